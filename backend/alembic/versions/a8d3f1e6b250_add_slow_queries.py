@@ -0,0 +1,37 @@
+"""add slow_queries table
+
+Revision ID: a8d3f1e6b250
+Revises: f2a6c9d4e817
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d3f1e6b250'
+down_revision: Union[str, None] = 'f2a6c9d4e817'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('slow_queries',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.Column('route', sa.String(length=300), nullable=False),
+    sa.Column('statement', sa.Text(), nullable=False),
+    sa.Column('duration_ms', sa.Float(), nullable=False),
+    sa.Column('plan', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_slow_queries_created_at'), 'slow_queries', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_slow_queries_created_at'), table_name='slow_queries')
+    op.drop_table('slow_queries')
@@ -0,0 +1,45 @@
+"""add ingest_runs table
+
+Revision ID: b4e7c2d9f361
+Revises: a8d3f1e6b250
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e7c2d9f361'
+down_revision: Union[str, None] = 'a8d3f1e6b250'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('ingest_runs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=20), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('duration_ms', sa.Float(), nullable=False),
+    sa.Column('items', sa.Integer(), nullable=False),
+    sa.Column('created', sa.Integer(), nullable=False),
+    sa.Column('updated', sa.Integer(), nullable=False),
+    sa.Column('errors', sa.Integer(), nullable=False),
+    sa.Column('phases', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('row_counts', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('slowest', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('error_details', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_ingest_runs_started_at'), 'ingest_runs', ['started_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_ingest_runs_started_at'), table_name='ingest_runs')
+    op.drop_table('ingest_runs')
@@ -0,0 +1,35 @@
+"""add catalog_versions table
+
+Revision ID: c6d1a9e3f472
+Revises: b4e7c2d9f361
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6d1a9e3f472'
+down_revision: Union[str, None] = 'b4e7c2d9f361'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of app.cache.CATALOG_SCOPES as of this revision
+SCOPES = ("books", "authors", "series", "characters", "tags")
+
+
+def upgrade() -> None:
+    catalog_versions = op.create_table('catalog_versions',
+    sa.Column('scope', sa.String(length=20), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('scope')
+    )
+    op.bulk_insert(catalog_versions, [{"scope": scope, "version": 0} for scope in SCOPES])
+
+
+def downgrade() -> None:
+    op.drop_table('catalog_versions')
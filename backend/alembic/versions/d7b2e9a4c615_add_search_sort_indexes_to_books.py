@@ -0,0 +1,36 @@
+"""add search sort indexes to books
+
+Revision ID: d7b2e9a4c615
+Revises: c1e4f8b2d301
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7b2e9a4c615'
+down_revision: Union[str, None] = 'c1e4f8b2d301'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_books_canon_title', 'books', ['canon_or_legends', 'title', 'id'], unique=False)
+    op.create_index('ix_books_canon_timeline', 'books', ['canon_or_legends', 'timeline_year', 'id'], unique=False)
+    op.create_index('ix_books_reading_title', 'books', ['reading_status', 'title', 'id'], unique=False)
+    op.create_index('ix_books_reading_timeline', 'books', ['reading_status', 'timeline_year', 'id'], unique=False)
+    op.create_index('ix_books_owned_title', 'books', ['title', 'id'], unique=False, postgresql_where=sa.text('owned'))
+    op.create_index('ix_books_owned_timeline', 'books', ['timeline_year', 'id'], unique=False, postgresql_where=sa.text('owned'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_books_owned_timeline', table_name='books')
+    op.drop_index('ix_books_owned_title', table_name='books')
+    op.drop_index('ix_books_reading_timeline', table_name='books')
+    op.drop_index('ix_books_reading_title', table_name='books')
+    op.drop_index('ix_books_canon_timeline', table_name='books')
+    op.drop_index('ix_books_canon_title', table_name='books')
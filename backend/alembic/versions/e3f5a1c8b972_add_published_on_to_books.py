@@ -0,0 +1,86 @@
+"""add published_on to books
+
+Revision ID: e3f5a1c8b972
+Revises: d7b2e9a4c615
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+import calendar
+import re
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3f5a1c8b972'
+down_revision: Union[str, None] = 'd7b2e9a4c615'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# A frozen copy of app.dates.parse_publication_date as of this revision, so
+# later changes to the app's parser don't change what this backfill does
+_MONTHS = {name.lower(): number for number, name in enumerate(calendar.month_name) if name}
+_MONTHS.update({name.lower(): number for number, name in enumerate(calendar.month_abbr) if name})
+_MONTHS["sept"] = 9
+
+_FOOTNOTE_RE = re.compile(r"\[\d+\]")
+_ISO_RE = re.compile(r"(\d{4})-(\d{1,2})(?:-(\d{1,2}))?")
+_DATE_RE = re.compile(
+    r"(?:(?P<month>[A-Za-z]{3,9})\.?\s*(?:(?P<day>\d{1,2})(?:st|nd|rd|th)?)?\s*,?\s*)?(?P<year>\d{4})"
+)
+
+
+def _safe_date(year, month, day):
+    try:
+        return date(year, month, day)
+    except ValueError:
+        try:
+            return date(year, month, 1)
+        except ValueError:
+            return None
+
+
+def _parse_publication_date(raw):
+    if not raw:
+        return None
+    text = _FOOTNOTE_RE.sub(" ", raw)
+    iso = _ISO_RE.search(text)
+    if iso:
+        return _safe_date(int(iso.group(1)), int(iso.group(2)), int(iso.group(3) or 1))
+    match = _DATE_RE.search(text)
+    if not match:
+        return None
+    month = _MONTHS.get((match.group("month") or "").lower())
+    if not month:
+        return _safe_date(int(match.group("year")), 1, 1)
+    return _safe_date(int(match.group("year")), month, int(match.group("day") or 1))
+
+
+def upgrade() -> None:
+    op.add_column('books', sa.Column('published_on', sa.Date(), nullable=True))
+
+    # Backfill from the scraped text with the parser ingest used at the time
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.text("SELECT id, publication_date FROM books WHERE publication_date IS NOT NULL")
+    ).all()
+    updates = [
+        {"id": row.id, "published_on": parsed}
+        for row in rows
+        if (parsed := _parse_publication_date(row.publication_date)) is not None
+    ]
+    if updates:
+        conn.execute(
+            sa.text("UPDATE books SET published_on = :published_on WHERE id = :id"),
+            updates,
+        )
+
+    op.create_index('ix_books_published_on', 'books', ['published_on', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_books_published_on', table_name='books')
+    op.drop_column('books', 'published_on')
@@ -0,0 +1,31 @@
+"""add reverse lookup indexes to link tables
+
+Revision ID: f2a6c9d4e817
+Revises: e3f5a1c8b972
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a6c9d4e817'
+down_revision: Union[str, None] = 'e3f5a1c8b972'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The composite primary keys lead with book_id; these serve the
+    # series/tag/character side (detail pages and book counts).
+    op.create_index(op.f('ix_book_series_series_id'), 'book_series', ['series_id'], unique=False)
+    op.create_index(op.f('ix_book_tags_tag_id'), 'book_tags', ['tag_id'], unique=False)
+    op.create_index(op.f('ix_book_characters_character_id'), 'book_characters', ['character_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_book_characters_character_id'), table_name='book_characters')
+    op.drop_index(op.f('ix_book_tags_tag_id'), table_name='book_tags')
+    op.drop_index(op.f('ix_book_series_series_id'), table_name='book_series')
@@ -0,0 +1,80 @@
+"""Admission control for expensive route classes.
+
+Each class runs at most ``limit`` requests at once; up to ``queue`` more wait
+for a slot for at most ADMISSION_QUEUE_TIMEOUT seconds. Anything beyond that
+is turned away with 429 and Retry-After straight away, so a burst of heavy
+searches or ingests cannot take every pooled connection from cheap routes.
+Cached responses are served without a slot: routes enter one only around
+the work that actually hits the database.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import HTTPException
+
+from app.config import settings
+
+
+class RouteClassLimiter:
+    def __init__(self, name: str, limit: int, queue: int):
+        self.name = name
+        self.limit = limit
+        self.queue = queue
+        self.active = 0
+        self.waiting = 0
+        self.rejected = 0
+        self._semaphore = asyncio.Semaphore(max(limit, 1))
+
+    def _reject(self) -> HTTPException:
+        self.rejected += 1
+        return HTTPException(
+            429,
+            f"Too many concurrent {self.name} requests, try again shortly",
+            headers={"Retry-After": str(settings.ADMISSION_RETRY_AFTER)},
+        )
+
+    @asynccontextmanager
+    async def slot(self):
+        if self.limit <= 0:
+            yield
+            return
+        if self._semaphore.locked():
+            if self.waiting >= self.queue:
+                raise self._reject()
+            self.waiting += 1
+            try:
+                async with asyncio.timeout(settings.ADMISSION_QUEUE_TIMEOUT):
+                    await self._semaphore.acquire()
+            except TimeoutError:
+                raise self._reject() from None
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self._semaphore.release()
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "queue": self.queue,
+            "active": self.active,
+            "waiting": self.waiting,
+            "rejected": self.rejected,
+        }
+
+
+# Text-filtered book searches and book_count-ordered character searches
+search = RouteClassLimiter("search", settings.ADMISSION_SEARCH_LIMIT, settings.ADMISSION_SEARCH_QUEUE)
+ingest = RouteClassLimiter("ingest", settings.ADMISSION_INGEST_LIMIT, settings.ADMISSION_INGEST_QUEUE)
+
+limiters = (search, ingest)
+
+
+def admission_stats() -> dict:
+    return {limiter.name: limiter.stats() for limiter in limiters}
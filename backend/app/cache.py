@@ -0,0 +1,361 @@
+import asyncio
+import functools
+import hashlib
+import inspect
+import logging
+import time
+import uuid
+from collections import Counter, OrderedDict, defaultdict
+from collections.abc import Hashable, Iterable
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from app.config import settings
+from app.database import read_session_factory, statement_timeout_info
+from app.responses import ResponseFormat, negotiate_media_type, render
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# Catalog versions. Every write bumps the global version, the scope it touched
+# ("books", "authors", ...) and either the changed ids or, when the ids are
+# unknown, the scope's "*" entry. Read caches key their entries on the versions
+# they depend on, so a write makes exactly those entries unreachable.
+_catalog_version = 0
+_versions: defaultdict[Hashable, int] = defaultdict(int)
+
+# The versions above are per process. HTTP validators come instead from the
+# catalog_versions table, which every write bumps in its own transaction; this
+# mirrors it (scope -> (version, updated_at)) from local commits, NOTIFYs and a
+# load at startup, so ETags and Last-Modified agree across workers and restarts.
+_stored_versions: dict[str, tuple[int, float]] = {}
+
+# Identifies this process's own NOTIFYs
+INSTANCE_ID = uuid.uuid4().hex
+
+CATALOG_SCOPES = ("books", "authors", "series", "characters", "tags")
+
+caches: dict[str, "TTLCache"] = {}
+
+
+def catalog_version() -> int:
+    return _catalog_version
+
+
+def scope_versions(*keys: Hashable) -> tuple[int, ...]:
+    return tuple(_versions.get(key, 0) for key in keys)
+
+
+def entity_versions(scope: str, entity_id: Hashable) -> tuple[int, ...]:
+    return scope_versions((scope, "*"), (scope, entity_id))
+
+
+def set_stored_versions(versions: dict[str, tuple[int, float]]) -> None:
+    """Record catalog_versions rows; an older version never replaces a newer one."""
+    for scope, (version, updated_at) in versions.items():
+        if version >= _stored_versions.get(scope, (-1, 0.0))[0]:
+            _stored_versions[scope] = (version, updated_at)
+
+
+def stored_versions(*scopes: str) -> tuple[tuple[int, float], ...] | None:
+    """The stored versions of ``scopes``, or None until they have been loaded."""
+    if not all(scope in _stored_versions for scope in scopes):
+        return None
+    return tuple(_stored_versions[scope] for scope in scopes)
+
+
+def bump_catalog_version(scope: str, ids: Iterable[Hashable] | None = None) -> int:
+    global _catalog_version
+    _catalog_version += 1
+    keys = [scope]
+    keys.extend([(scope, "*")] if ids is None else [(scope, entity_id) for entity_id in ids])
+    for key in keys:
+        _versions[key] += 1
+    return _catalog_version
+
+
+def bump_all_catalog_versions() -> int:
+    """Invalidate everything, e.g. after missing change notifications."""
+    for scope in CATALOG_SCOPES:
+        bump_catalog_version(scope)
+    return _catalog_version
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, name: str, ttl: float, maxsize: int = 256):
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.stale_hits = 0
+        self.coalesced = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        caches[name] = self
+
+    def get(self, key: Hashable, default: Any = None, record_stats: bool = True) -> Any:
+        entry = self._data.get(key, _MISSING)
+        if entry is not _MISSING and entry[0] < time.monotonic():
+            del self._data[key]
+            entry = _MISSING
+        if entry is _MISSING:
+            self.misses += record_stats
+            return default
+        self._data.move_to_end(key)
+        self.hits += record_stats
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "stale_hits": self.stale_hits,
+            "coalesced": self.coalesced,
+        }
+
+
+def cache_stats() -> dict:
+    return {"catalog_version": _catalog_version, "caches": {name: c.stats() for name, c in caches.items()}}
+
+
+def normalize_key(params: dict) -> tuple:
+    """Build a stable cache key from query params, ignoring unset values and case."""
+    items = []
+    for key, value in params.items():
+        if isinstance(value, BaseModel):
+            items.extend(normalize_key(value.model_dump()))
+            continue
+        if value is None or value == "":
+            continue
+        if isinstance(value, str):
+            value = value.strip().lower()
+        items.append((key, value))
+    return tuple(sorted(items, key=lambda item: item[0]))
+
+
+# Entries are kept through the stale window; freshness is checked per route
+response_cache = TTLCache(
+    "responses", ttl=settings.CACHE_TTL + settings.CACHE_STALE_TTL, maxsize=settings.CACHE_MAXSIZE
+)
+
+# Computations currently running per (route, versions, params) key, so that
+# identical concurrent requests await one query instead of each running it,
+# and how many requests are waiting on each.
+_inflight: dict[Hashable, asyncio.Task] = {}
+_waiters: Counter[asyncio.Task] = Counter()
+_background: set[asyncio.Task] = set()
+
+
+def _forget(key: Hashable, task: asyncio.Task) -> None:
+    if _inflight.get(key) is task:
+        del _inflight[key]
+
+
+async def _single_flight(key: Hashable, compute) -> Any:
+    """Await the shared computation for ``key``, starting it if needed.
+
+    One waiter being cancelled (e.g. by CancelOnDisconnectMiddleware) leaves
+    the computation running for the others; when the last one leaves, it is
+    cancelled too, so an abandoned query doesn't keep its connection.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(compute())
+        _inflight[key] = task
+        task.add_done_callback(lambda task: _forget(key, task))
+    else:
+        response_cache.coalesced += 1
+    _waiters[task] += 1
+    try:
+        return await asyncio.shield(task)
+    finally:
+        _waiters[task] -= 1
+        if not _waiters[task]:
+            del _waiters[task]
+            if not task.done():
+                # Later requests start afresh instead of joining the cancellation
+                _forget(key, task)
+                task.cancel()
+
+
+def _refresh_in_background(key: Hashable, compute) -> None:
+    if key in _inflight:
+        return
+    task = asyncio.create_task(_single_flight(key, compute))
+    _background.add(task)
+
+    def done(task: asyncio.Task) -> None:
+        _background.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error("Background cache refresh failed", exc_info=task.exception())
+
+    task.add_done_callback(done)
+
+
+def _etag(route: str, params_key: tuple, stored: tuple[tuple[int, float], ...]) -> str:
+    versions = tuple(version for version, _ in stored)
+    digest = hashlib.blake2b(repr((route, versions, params_key)).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _last_modified(stored: tuple[tuple[int, float], ...]) -> float:
+    return max(updated_at for _, updated_at in stored)
+
+
+def _validators(route: str, params_key: tuple, stored: tuple | None) -> dict[str, str]:
+    headers = {
+        "Cache-Control": settings.CACHE_CONTROL.get(route, settings.CACHE_CONTROL_DEFAULT),
+        "Vary": "Accept",
+    }
+    if stored is not None:
+        headers["ETag"] = _etag(route, params_key, stored)
+        headers["Last-Modified"] = formatdate(_last_modified(stored), usegmt=True)
+    return headers
+
+
+def _not_modified(request: Request, route: str, params_key: tuple, stored: tuple | None) -> bool:
+    if stored is None:
+        return False
+    etag, modified = _etag(route, params_key, stored), _last_modified(stored)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(modified) <= since
+    return False
+
+
+def cached_response(
+    route: str,
+    depends: tuple[str, ...] = CATALOG_SCOPES,
+    entity: tuple[str, str] | None = None,
+    stale_while_revalidate: bool = False,
+    exclude: tuple[str, ...] = ("db",),
+):
+    """Cache a read handler's return value per route and params.
+
+    ``depends`` lists the catalog scopes whose writes invalidate the entry.
+    ``entity`` is a (scope, parameter name) pair for detail routes, so only
+    writes to that one row invalidate it. Exceptions (e.g. 404s) are not
+    cached, and parameters named in ``exclude`` are left out of the key.
+
+    Misses run the handler once per key with its own session, however many
+    requests are waiting on it. With ``stale_while_revalidate`` an outdated
+    entry is served as-is while a single background task recomputes it, as
+    long as it is younger than CACHE_TTL + CACHE_STALE_TTL. With CACHE_TTL
+    at 0 none of this applies: the handler runs on the request's own session
+    every time and no validators are sent.
+
+    The handler's result is serialized once per representation (JSON via
+    orjson or MessagePack by Accept header, optionally ``format=columnar``)
+    and the bytes are what gets cached and returned, skipping response_model
+    validation; the handler must return trusted dicts or models. The
+    ETag and Last-Modified come from the stored catalog versions of the
+    scopes the route depends on (shared by all workers), as they were when
+    the body was computed. A matching If-None-Match/If-Modified-Since answers
+    304 without running the handler. Cache-Control comes from settings per
+    route.
+    """
+
+    validator_scopes = tuple(dict.fromkeys(depends + ((entity[0],) if entity else ())))
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, _request: Request, format: ResponseFormat | None = None, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = {k: v for k, v in bound.arguments.items() if k not in exclude}
+            version_keys = list(depends)
+            if entity:
+                version_keys += [(entity[0], "*"), (entity[0], params[entity[1]])]
+            versions = scope_versions(*version_keys)
+            stored = stored_versions(*validator_scopes)
+            media_type = negotiate_media_type(_request.headers.get("accept"))
+            params_key = (normalize_key(params), media_type, format)
+            key = (route, versions, params_key)
+
+            if settings.CACHE_TTL <= 0:
+                body = render(await func(**bound.arguments), media_type, columnar=format == ResponseFormat.columnar)
+                return Response(content=body, media_type=media_type, headers=_validators(route, params_key, None))
+
+            async def compute():
+                # Validators as of before the query, so the body is at least this new
+                snapshot = stored_versions(*validator_scopes)
+                info = statement_timeout_info(_request, settings.STATEMENT_TIMEOUT_READ)
+                async with read_session_factory(_request)(info=info) as session:
+                    call = bound.arguments | ({"db": session} if "db" in bound.arguments else {})
+                    body = render(await func(**call), media_type, columnar=format == ResponseFormat.columnar)
+                response_cache.set((route, params_key), (versions, time.time(), body, snapshot))
+                return body, snapshot
+
+            body = None
+            entry = response_cache.get((route, params_key), record_stats=False)
+            if entry is not None:
+                entry_versions, stored_at, cached, entry_stored = entry
+                age = time.time() - stored_at
+                if entry_versions == versions and age < settings.CACHE_TTL:
+                    response_cache.hits += 1
+                    body, stored = cached, entry_stored
+                elif (
+                    stale_while_revalidate
+                    and settings.CACHE_STALE_TTL > 0
+                    and age < settings.CACHE_TTL + settings.CACHE_STALE_TTL
+                ):
+                    response_cache.stale_hits += 1
+                    _refresh_in_background(key, compute)
+                    body, stored = cached, entry_stored
+
+            # Validators describe what is actually served
+            if _not_modified(_request, route, params_key, stored):
+                return Response(status_code=304, headers=_validators(route, params_key, stored))
+            if body is None:
+                response_cache.misses += 1
+                body, stored = await _single_flight(key, compute)
+
+            return Response(content=body, media_type=media_type, headers=_validators(route, params_key, stored))
+
+        # Expose the request and format param to FastAPI without changing the handler
+        wrapper.__signature__ = signature.replace(
+            parameters=[
+                *signature.parameters.values(),
+                inspect.Parameter("_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+                inspect.Parameter(
+                    "format", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=ResponseFormat | None
+                ),
+            ]
+        )
+        return wrapper
+
+    return decorator
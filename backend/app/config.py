@@ -1,10 +1,99 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     DATABASE_URL: str = "postgresql+asyncpg://swtracker:swtracker@db:5432/swbooktracker"
+    # Connection pool for interactive traffic. Timeout is how long a request
+    # waits for a connection; recycle (seconds, -1 = never) and pre-ping guard
+    # against connections dropped by the server or a proxy.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = False
+    # Prepared statements cached per connection; set 0 behind pgbouncer in
+    # transaction mode
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # Separate pool for /ingest and admin routes, optionally on another URL
+    # (e.g. a role with a longer statement timeout); defaults to DATABASE_URL
+    INGEST_DATABASE_URL: str | None = None
+    INGEST_DB_POOL_SIZE: int = 2
+    INGEST_DB_MAX_OVERFLOW: int = 0
+    # Per-statement time budgets in ms (0 = none), applied with SET LOCAL in
+    # each request's transaction so a runaway query is cancelled by the
+    # server instead of holding a pooled connection. STATEMENT_TIMEOUTS
+    # overrides them per route, e.g. {"GET /api/v1/books/facets": 2000}.
+    STATEMENT_TIMEOUT_READ: int = 5000
+    STATEMENT_TIMEOUT_WRITE: int = 10000
+    STATEMENT_TIMEOUT_INGEST: int = 60000
+    STATEMENT_TIMEOUTS: dict[str, int] = {}
+    # Concurrency limits for expensive route classes (text-filtered book
+    # search, book_count-ordered character search, ingest). LIMIT requests
+    # run at once and QUEUE more wait up to ADMISSION_QUEUE_TIMEOUT seconds;
+    # the rest get 429 with Retry-After. A limit of 0 disables the gate.
+    ADMISSION_SEARCH_LIMIT: int = 4
+    ADMISSION_SEARCH_QUEUE: int = 8
+    ADMISSION_INGEST_LIMIT: int = 2
+    ADMISSION_INGEST_QUEUE: int = 4
+    ADMISSION_QUEUE_TIMEOUT: float = 5.0
+    ADMISSION_RETRY_AFTER: int = 1
+    # Per-request SQL stats: a statement shape run this many times in one
+    # request is logged as a likely N+1 (0 disables the check). SELECTs
+    # slower than SLOW_QUERY_EXPLAIN_MS (0 = off) are re-run under EXPLAIN
+    # (ANALYZE, BUFFERS) into slow_queries, once per shape per cooldown.
+    SQL_N_PLUS_ONE_THRESHOLD: int = 10
+    SLOW_QUERY_EXPLAIN_MS: float = 0
+    SLOW_QUERY_COOLDOWN: float = 600.0
+    # On-demand profiling, off unless both are set. /debug/profiles and the
+    # X-Profile request header need X-Admin-Token to match ADMIN_TOKEN;
+    # profiled requests sample stacks every PROFILE_INTERVAL seconds.
+    PROFILE_DIR: str | None = None
+    ADMIN_TOKEN: str | None = None
+    PROFILE_INTERVAL: float = 0.005
+    # OpenTelemetry spans for requests, SQL statements and ingested books:
+    # "console" prints them, "file" appends OTLP/JSON lines to TRACING_FILE
+    TRACING_EXPORTER: Literal["none", "console", "file"] = "none"
+    TRACING_FILE: str = "traces.jsonl"
+    TRACING_SERVICE_NAME: str = "swtracker-backend"
+    # Comma-separated read replica URLs for GET routes; empty reads from the
+    # primary. Replicas are health-checked every interval and skipped while
+    # down or more than READ_REPLICA_MAX_LAG seconds behind (0 = no limit).
+    READ_DATABASE_URLS: str = ""
+    READ_REPLICA_CHECK_INTERVAL: float = 5.0
+    READ_REPLICA_CHECK_TIMEOUT: float = 2.0
+    READ_REPLICA_MAX_LAG: float = 10.0
+    # After a write, reads stay on the primary this long: for the writing
+    # client (via a cookie/header) and for this worker's cache fills
+    READ_YOUR_WRITES_SECONDS: float = 5.0
+    # In-process read cache for catalog endpoints; entries are also dropped on
+    # any catalog write. A TTL of 0 disables caching: every request runs its
+    # handler, with no coalescing, stale responses, ETags or 304s.
+    CACHE_TTL: float = 60.0
+    CACHE_MAXSIZE: int = 1024
+    # Stale-while-revalidate window for routes opting into it: an entry that
+    # expired or was invalidated is still served, while one background task
+    # refreshes it, until it is CACHE_TTL + CACHE_STALE_TTL seconds old.
+    # 0 disables serving stale entries.
+    CACHE_STALE_TTL: float = 30.0
+    # Broadcast catalog writes over Postgres NOTIFY so every worker's cache
+    # is invalidated, not just the one that handled the write
+    CACHE_NOTIFY_ENABLED: bool = True
+    # Cache-Control sent with ETag'd read responses, per cached route name
+    # (e.g. {"tags.list": "public, max-age=300"}); others get the default
+    CACHE_CONTROL_DEFAULT: str = "no-cache"
+    CACHE_CONTROL: dict[str, str] = {}
+    # Responses at least this many bytes are brotli/gzip compressed
+    COMPRESSION_MIN_SIZE: int = 1024
+    # Seconds to cache /books/facets results per filter set; 0 disables
+    FACETS_CACHE_TTL: float = 10.0
 
     model_config = {"env_file": ".env"}
 
+    @property
+    def read_database_urls(self) -> list[str]:
+        return [url.strip() for url in self.READ_DATABASE_URLS.split(",") if url.strip()]
+
 
 settings = Settings()
@@ -1,13 +1,118 @@
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
 
 from app.config import settings
+from app.metrics import TimedQueuePool
+from app.replicas import Replica, ReplicaSet, client_prefers_primary, recently_written
 
-engine = create_async_engine(settings.DATABASE_URL, echo=False)
+
+def make_engine(name: str, url: str, pool_size: int, max_overflow: int, read_only: bool = False) -> AsyncEngine:
+    connect_args = {
+        # asyncpg's own cache and SQLAlchemy's prepared statement cache on top of it
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+    if read_only:
+        connect_args["server_settings"] = {"default_transaction_read_only": "on"}
+    return create_async_engine(
+        url,
+        echo=False,
+        poolclass=TimedQueuePool,
+        pool_logging_name=name,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=connect_args,
+    )
+
+
+# Interactive traffic (the UI and API reads/writes)
+engine = make_engine("primary", settings.DATABASE_URL, settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# Ingest and admin routes get their own small pool so bulk loads queue among
+# themselves instead of taking connections from browsing requests
+ingest_engine = make_engine(
+    "ingest",
+    settings.INGEST_DATABASE_URL or settings.DATABASE_URL,
+    settings.INGEST_DB_POOL_SIZE,
+    settings.INGEST_DB_MAX_OVERFLOW,
+)
+ingest_session = async_sessionmaker(ingest_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+# Optional read replicas for GET routes; each gets a pool sized like the primary's
+read_replicas = ReplicaSet(
+    [
+        Replica(name, make_engine(name, url, settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW, read_only=True))
+        for url, name in ((url, make_url(url).render_as_string(hide_password=True)) for url in settings.read_database_urls)
+    ]
+)
+
+
+# SQLSTATE for a statement cancelled by statement_timeout (or pg_cancel_backend)
+QUERY_CANCELED = "57014"
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_statement_timeout(session: Session, transaction, connection) -> None:
+    # SET LOCAL lasts until commit/rollback, so it is reapplied to every
+    # transaction the session begins and never outlives the checkout
+    timeout = session.info.get("statement_timeout")
+    if timeout:
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout)}")
+
+
+def statement_timeout_info(request: Request | None, default: int) -> dict:
+    """Session ``info`` carrying the matched route's time budget in ms.
+
+    Budgets are looked up in STATEMENT_TIMEOUTS by ``"<METHOD> <path template>"``
+    and fall back to ``default``; 0 means no limit.
+    """
+    route = request.scope.get("route") if request is not None else None
+    if route is not None:
+        default = settings.STATEMENT_TIMEOUTS.get(f"{request.method} {route.path}", default)
+    return {"statement_timeout": default}
+
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session() as session:
+def is_statement_timeout(exc: DBAPIError) -> bool:
+    return getattr(exc.orig, "sqlstate", None) == QUERY_CANCELED
+
+
+def read_session_factory(request: Request | None = None) -> async_sessionmaker:
+    """A replica's session factory, or the primary's for sticky clients and
+    when no replica is healthy."""
+    if recently_written() or (request is not None and client_prefers_primary(request.cookies, request.headers)):
+        return async_session
+    return read_replicas.pick() or async_session
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with async_session(info=statement_timeout_info(request, settings.STATEMENT_TIMEOUT_WRITE)) as session:
+        yield session
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Session for read-only routes, on a replica when one is available."""
+    info = statement_timeout_info(request, settings.STATEMENT_TIMEOUT_READ)
+    async with read_session_factory(request)(info=info) as session:
+        yield session
+
+
+async def get_ingest_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with ingest_session(info=statement_timeout_info(request, settings.STATEMENT_TIMEOUT_INGEST)) as session:
         yield session
+
+
+async def dispose_engines() -> None:
+    await read_replicas.stop()
+    await engine.dispose()
+    await ingest_engine.dispose()
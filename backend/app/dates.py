@@ -0,0 +1,50 @@
+import calendar
+import re
+from datetime import date
+
+_MONTHS = {name.lower(): number for number, name in enumerate(calendar.month_name) if name}
+_MONTHS.update({name.lower(): number for number, name in enumerate(calendar.month_abbr) if name})
+_MONTHS["sept"] = 9
+
+_FOOTNOTE_RE = re.compile(r"\[\d+\]")
+_ISO_RE = re.compile(r"(\d{4})-(\d{1,2})(?:-(\d{1,2}))?")
+_DATE_RE = re.compile(
+    r"(?:(?P<month>[A-Za-z]{3,9})\.?\s*(?:(?P<day>\d{1,2})(?:st|nd|rd|th)?)?\s*,?\s*)?(?P<year>\d{4})"
+)
+
+
+def parse_publication_date(raw: str | None) -> date | None:
+    """Parse a scraped publication date into a date.
+
+    Tolerates footnote markers ("October 4,2022[1]"), missing spaces, edition
+    annotations and multiple listed releases (the first one wins). Partial
+    dates fall back to the first of the month or year ("July1998" -> 1998-07-01).
+    """
+    if not raw:
+        return None
+    text = _FOOTNOTE_RE.sub(" ", raw)
+
+    iso = _ISO_RE.search(text)
+    if iso:
+        year, month, day = int(iso.group(1)), int(iso.group(2)), int(iso.group(3) or 1)
+        return _safe_date(year, month, day)
+
+    match = _DATE_RE.search(text)
+    if not match:
+        return None
+    # A non-month word glued to the year ("Edition2017") leaves only the year
+    month = _MONTHS.get((match.group("month") or "").lower())
+    if not month:
+        return _safe_date(int(match.group("year")), 1, 1)
+    day = int(match.group("day") or 1)
+    return _safe_date(int(match.group("year")), month, day)
+
+
+def _safe_date(year: int, month: int, day: int) -> date | None:
+    try:
+        return date(year, month, day)
+    except ValueError:
+        try:
+            return date(year, month, 1)
+        except ValueError:
+            return None
@@ -0,0 +1,151 @@
+"""Cross-worker cache invalidation over Postgres LISTEN/NOTIFY.
+
+Write paths commit through ``commit_catalog_changes``, which bumps the
+touched scopes' rows in ``catalog_versions`` and queues a
+``NOTIFY catalog_changed`` inside the transaction (so both only take effect if
+the commit succeeds) and then bumps the local catalog versions. Every worker
+keeps one dedicated asyncpg connection listening on the channel and applies
+the same bumps for changes made by other workers, along with the new stored
+versions that HTTP validators are built from.
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import Iterable
+
+import asyncpg
+from sqlalchemy import func, select, update
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import INSTANCE_ID, bump_all_catalog_versions, bump_catalog_version, set_stored_versions
+from app.config import settings
+from app.database import engine
+from app.models import CatalogVersion
+from app.replicas import mark_request_wrote, note_catalog_write
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "catalog_changed"
+# NOTIFY payloads are capped at 8000 bytes; larger id lists are sent as "all"
+MAX_PAYLOAD_BYTES = 7500
+
+
+async def commit_catalog_changes(db: AsyncSession, **changes: Iterable[int] | None) -> None:
+    """Commit ``db`` and invalidate cached reads for the changed scopes.
+
+    Keyword names are catalog scopes (``books``, ``authors``, ...) and values
+    the affected ids, or ``None`` when every row of the scope may have changed.
+    """
+    changes = {scope: None if ids is None else sorted(set(ids)) for scope, ids in changes.items()}
+    stored = await _bump_stored_versions(db, changes)
+    if settings.CACHE_NOTIFY_ENABLED:
+        await db.execute(select(func.pg_notify(CHANNEL, _encode(changes, stored))))
+    await db.commit()
+    mark_request_wrote()
+    _apply(changes, stored)
+
+
+async def _bump_stored_versions(db: AsyncSession, scopes: Iterable[str]) -> dict[str, tuple[int, float]]:
+    scopes = sorted(scopes)
+    # Lock the rows in a fixed order so concurrent writers can't deadlock;
+    # clock_timestamp() then orders updated_at the same way as version
+    await db.execute(
+        select(CatalogVersion.scope)
+        .where(CatalogVersion.scope.in_(scopes))
+        .order_by(CatalogVersion.scope)
+        .with_for_update()
+    )
+    result = await db.execute(
+        update(CatalogVersion)
+        .where(CatalogVersion.scope.in_(scopes))
+        .values(version=CatalogVersion.version + 1, updated_at=func.clock_timestamp())
+        .returning(CatalogVersion.scope, CatalogVersion.version, CatalogVersion.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    return {scope: (version, updated_at.timestamp()) for scope, version, updated_at in result.all()}
+
+
+async def load_stored_versions() -> None:
+    """Read every scope's stored version, e.g. at startup or after missed notifications."""
+    async with engine.connect() as conn:
+        rows = (await conn.execute(select(CatalogVersion.scope, CatalogVersion.version, CatalogVersion.updated_at))).all()
+    set_stored_versions({scope: (version, updated_at.timestamp()) for scope, version, updated_at in rows})
+
+
+def _encode(changes: dict, stored: dict) -> str:
+    payload = json.dumps({"origin": INSTANCE_ID, "changes": changes, "versions": stored})
+    if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+        changes = {scope: None for scope in changes}
+        payload = json.dumps({"origin": INSTANCE_ID, "changes": changes, "versions": stored})
+    return payload
+
+
+def _apply(changes: dict, stored: dict) -> None:
+    note_catalog_write()
+    set_stored_versions(stored)
+    for scope, ids in changes.items():
+        bump_catalog_version(scope, ids)
+
+
+def _on_notification(connection, pid, channel, payload: str) -> None:
+    try:
+        message = json.loads(payload)
+    except ValueError:
+        logger.warning(f"Ignoring malformed {CHANNEL} payload: {payload[:200]}")
+        return
+    if message.get("origin") == INSTANCE_ID:
+        return  # already applied locally after commit
+    stored = {scope: tuple(entry) for scope, entry in message.get("versions", {}).items()}
+    _apply(message.get("changes", {}), stored)
+
+
+class CatalogListener:
+    """Keeps a dedicated LISTEN connection open, reconnecting on failure."""
+
+    def __init__(self, dsn: str, reconnect_delay: float = 5.0):
+        self.dsn = dsn
+        self.reconnect_delay = reconnect_delay
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(CHANNEL, _on_notification)
+                # Anything written while we weren't listening was missed
+                bump_all_catalog_versions()
+                await load_stored_versions()
+                logger.info(f"Listening for {CHANNEL} notifications")
+                await closed.wait()
+                logger.warning(f"{CHANNEL} listener connection lost, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception(f"{CHANNEL} listener failed, retrying in {self.reconnect_delay}s")
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(self.reconnect_delay)
+
+
+def listener_dsn() -> str:
+    """Plain asyncpg DSN for the SQLAlchemy DATABASE_URL."""
+    url = make_url(settings.DATABASE_URL).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
@@ -1,11 +1,56 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.admission import admission_stats
+from app.cache import cache_stats
+from app.config import settings
+from app.database import dispose_engines, engine, ingest_engine, is_statement_timeout, read_replicas
+from app.invalidation import CatalogListener, listener_dsn, load_stored_versions
+from app.metrics import MetricsMiddleware
+from app.middleware import CancelOnDisconnectMiddleware, CompressionMiddleware, ReadYourWritesMiddleware
+from app.profiling import ProfilingMiddleware, profiling_enabled
+from app.querystats import QueryStatsMiddleware
+from app.routers import authors, books, characters, debug, ingest, series, tags
+from app.tracing import setup_tracing, shutdown_tracing
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    listener = None
+    try:
+        await load_stored_versions()
+    except Exception:
+        # Responses go out without ETag/Last-Modified until the first write
+        logger.exception("Could not load catalog versions")
+    if settings.CACHE_NOTIFY_ENABLED:
+        listener = CatalogListener(listener_dsn())
+        listener.start()
+    await read_replicas.start()
+    yield
+    if listener:
+        await listener.stop()
+    await dispose_engines()
+    shutdown_tracing()
 
-from app.routers import authors, books, characters, ingest, series, tags
 
-app = FastAPI(title="Star Wars EU Book Tracker")
+app = FastAPI(title="Star Wars EU Book Tracker", lifespan=lifespan)
 
+app.add_middleware(CancelOnDisconnectMiddleware)
+if profiling_enabled():
+    app.add_middleware(ProfilingMiddleware, routes=app.routes)
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE)
+if settings.read_database_urls:
+    app.add_middleware(ReadYourWritesMiddleware, window=settings.READ_YOUR_WRITES_SECONDS)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173"],
@@ -13,6 +58,10 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Outermost, so latency and sizes cover the whole stack and compressed bodies
+app.add_middleware(MetricsMiddleware, routes=app.routes)
+
+setup_tracing(app, [engine, ingest_engine, *(r.engine for r in read_replicas.replicas)])
 
 app.include_router(books.router, prefix="/api/v1")
 app.include_router(authors.router, prefix="/api/v1")
@@ -20,11 +69,48 @@ app.include_router(series.router, prefix="/api/v1")
 app.include_router(characters.router, prefix="/api/v1")
 app.include_router(tags.router, prefix="/api/v1")
 app.include_router(ingest.router, prefix="/api/v1")
+if profiling_enabled():
+    app.include_router(debug.router)
 
 
 @app.get("/health")
 async def health():
-    return {"status": "ok"}
+    return {"status": "ok", "read_replicas": read_replicas.status()}
+
+
+@app.get("/cache/stats")
+async def get_cache_stats():
+    return cache_stats()
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+@app.get("/admission/stats")
+async def get_admission_stats():
+    return admission_stats()
+
+
+@app.exception_handler(DBAPIError)
+async def database_error_handler(request: Request, exc: DBAPIError):
+    if is_statement_timeout(exc):
+        return JSONResponse(
+            status_code=504,
+            content={"detail": "Database query exceeded its time budget"},
+        )
+    return await global_exception_handler(request, exc)
+
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    # Every pooled connection stayed busy for DB_POOL_TIMEOUT seconds
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Database is busy, try again shortly"},
+        headers={"Retry-After": "1"},
+    )
 
 
 @app.exception_handler(Exception)
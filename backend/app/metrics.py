@@ -0,0 +1,160 @@
+"""In-process Prometheus metrics, served at /metrics.
+
+HTTP metrics are labelled by route template (``/api/v1/books/{book_id}``),
+never the raw path, so label cardinality stays bounded; requests matching
+no route share ``<unmatched>``. Pool and admission gauges are read at
+scrape time rather than kept up to date on every checkout.
+"""
+
+import time
+
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app import admission
+
+UNMATCHED = "<unmatched>"
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time to send the complete response, by route template and status",
+    ["method", "route", "status"],
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Requests currently being handled",
+    ["method", "route"],
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "Response body bytes as sent (after compression)",
+    ["method", "route"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+)
+POOL_ACQUIRE = Histogram(
+    "db_pool_acquire_seconds",
+    "Time to obtain a pooled connection, including opening overflow connections",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0),
+)
+INGEST_ITEMS = Counter(
+    "ingest_items_total",
+    "Books and characters processed by ingest, by outcome",
+    ["kind", "outcome"],
+)
+INGEST_DURATION = Histogram(
+    "ingest_batch_duration_seconds",
+    "Time to ingest one batch",
+    ["kind"],
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+
+# Latest pool per engine name; dispose() swaps in a recreated pool of the same name
+_pools: dict[str, "TimedQueuePool"] = {}
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long checkouts wait.
+
+    Named through ``pool_logging_name``, which also survives ``recreate()``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics_name = self._orig_logging_name or "default"
+        _pools[self.metrics_name] = self
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            POOL_ACQUIRE.labels(self.metrics_name).observe(time.perf_counter() - start)
+
+
+class PoolCollector(Collector):
+    def collect(self):
+        checked_out = GaugeMetricFamily("db_pool_checked_out", "Connections currently checked out", labels=["pool"])
+        overflow = GaugeMetricFamily("db_pool_overflow", "Open connections beyond pool_size", labels=["pool"])
+        size = GaugeMetricFamily("db_pool_size", "Configured pool_size", labels=["pool"])
+        for name, pool in _pools.items():
+            checked_out.add_metric([name], pool.checkedout())
+            overflow.add_metric([name], max(pool.overflow(), 0))
+            size.add_metric([name], pool.size())
+        yield from (checked_out, overflow, size)
+
+
+class AdmissionCollector(Collector):
+    def collect(self):
+        active = GaugeMetricFamily("admission_active", "Requests holding an admission slot", labels=["route_class"])
+        waiting = GaugeMetricFamily("admission_queue_depth", "Requests waiting for an admission slot", labels=["route_class"])
+        rejected = CounterMetricFamily("admission_rejected", "Requests turned away with 429", labels=["route_class"])
+        for limiter in admission.limiters:
+            active.add_metric([limiter.name], limiter.active)
+            waiting.add_metric([limiter.name], limiter.waiting)
+            rejected.add_metric([limiter.name], limiter.rejected)
+        yield from (active, waiting, rejected)
+
+
+REGISTRY.register(PoolCollector())
+REGISTRY.register(AdmissionCollector())
+
+
+def record_ingest(kind: str, result: dict, started: float) -> None:
+    for outcome in ("created", "updated", "errors"):
+        INGEST_ITEMS.labels(kind, outcome).inc(result[outcome])
+    INGEST_DURATION.labels(kind).observe(time.perf_counter() - started)
+
+
+def route_template(routes: list, scope: Scope) -> str:
+    """Path template of the route ``scope`` will be dispatched to."""
+    for route in routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+    return UNMATCHED
+
+
+class MetricsMiddleware:
+    """Request latency, status, size and in-flight counts per route template.
+
+    ``routes`` is the application's live route list; it is matched up front
+    so in-flight requests can be labelled before the router runs.
+    """
+
+    def __init__(self, app: ASGIApp, routes: list):
+        self.app = app
+        self.routes = routes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        method, route = scope["method"], route_template(self.routes, scope)
+        # 499 (client closed request) unless a response gets started
+        status, size = "499", 0
+
+        async def send_measured(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = REQUESTS_IN_PROGRESS.labels(method, route)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_measured)
+        except Exception:
+            status = "500"
+            raise
+        finally:
+            in_progress.dec()
+            REQUEST_DURATION.labels(method, route, status).observe(time.perf_counter() - start)
+            RESPONSE_SIZE.labels(method, route).observe(size)
@@ -0,0 +1,188 @@
+import asyncio
+import gzip
+import math
+import time
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.replicas import STICKY_COOKIE, STICKY_HEADER, _request_writes
+
+# Already-compressed payloads (cover images) are left alone
+COMPRESSIBLE_TYPES = ("application/json", "application/msgpack", "text/")
+# In order of preference when the client weighs them equally
+SUPPORTED_ENCODINGS = ("br", "gzip")
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """Pick the supported coding with the highest q in ``Accept-Encoding``.
+
+    A coding the header does not name takes the q of ``*``, if present, and
+    a q of 0 refuses it. Returns None when neither coding is acceptable.
+    """
+    if not accept_encoding:
+        return None
+    weights: dict[str, float] = {}
+    for entry in accept_encoding.split(","):
+        coding, _, params = entry.strip().partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding:
+            weights[coding] = q
+    best, best_q = None, 0.0
+    for coding in SUPPORTED_ENCODINGS:
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class CompressionMiddleware:
+    """Brotli or gzip for complete response bodies of at least ``minimum_size``.
+
+    The coding follows the client's ``Accept-Encoding`` weights, with Brotli
+    preferred on a tie. Streaming responses and already-encoded bodies pass
+    through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+            if message.get("more_body", False):
+                # Streaming: flush the held start and stop intercepting
+                await send(start)
+                start = None
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start["headers"])
+            compressible = headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+            if compressible and len(body) >= self.minimum_size and "content-encoding" not in headers:
+                if encoding == "br":
+                    body = brotli.compress(body, quality=self.brotli_quality)
+                else:
+                    body = gzip.compress(body, compresslevel=self.gzip_level)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                headers.add_vary_header("Accept-Encoding")
+            await send(start)
+            start = None
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
+
+
+class ReadYourWritesMiddleware:
+    """Pin a client's reads to the primary for ``window`` seconds after it writes.
+
+    Write paths flag the request through ``mark_request_wrote``; the response
+    then carries a short-lived cookie, and the same deadline in a header for
+    clients that do not keep cookies and send it back themselves.
+    """
+
+    def __init__(self, app: ASGIApp, window: float):
+        self.app = app
+        self.window = window
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        wrote: list = []
+        token = _request_writes.set(wrote)
+
+        async def send_with_deadline(message: Message) -> None:
+            if message["type"] == "http.response.start" and wrote:
+                until = f"{time.time() + self.window:.3f}"
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Set-Cookie",
+                    f"{STICKY_COOKIE}={until}; Max-Age={math.ceil(self.window)}; Path=/; HttpOnly; SameSite=Lax",
+                )
+                headers[STICKY_HEADER] = until
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_deadline)
+        finally:
+            _request_writes.reset(token)
+
+
+class CancelOnDisconnectMiddleware:
+    """Cancel the handler when the client disconnects before its response is complete.
+
+    Cancelling the task cancels the query in flight (asyncpg asks the server
+    to cancel it) and returns its connection to the pool instead of finishing
+    work nobody will read. Request messages are relayed to the app unchanged.
+    Cached routes share their query between identical requests, and it is
+    cancelled once the last request waiting on it is gone.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        messages: asyncio.Queue[Message] = asyncio.Queue()
+        complete = disconnected = False
+
+        async def send_tracking(message: Message) -> None:
+            nonlocal complete
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                complete = True
+            await send(message)
+
+        task = asyncio.create_task(self.app(scope, messages.get, send_tracking))
+
+        async def listen() -> None:
+            nonlocal disconnected
+            while True:
+                message = await receive()
+                messages.put_nowait(message)
+                if message["type"] == "http.disconnect":
+                    if not complete:
+                        disconnected = True
+                        task.cancel()
+                    return
+
+        listener = asyncio.create_task(listen())
+        try:
+            await task
+        except asyncio.CancelledError:
+            if not disconnected:
+                raise
+        finally:
+            listener.cancel()
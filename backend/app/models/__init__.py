@@ -5,6 +5,9 @@ from app.models.series import Series
 from app.models.character import Character
 from app.models.tag import Tag
 from app.models.timeline_event import TimelineEvent
+from app.models.slow_query import SlowQuery
+from app.models.ingest_run import IngestRun
+from app.models.catalog_version import CatalogVersion
 from app.models.associations import BookSeries, book_characters, book_tags, book_timeline_events
 
 __all__ = [
@@ -18,6 +21,9 @@ __all__ = [
     "Character",
     "Tag",
     "TimelineEvent",
+    "SlowQuery",
+    "IngestRun",
+    "CatalogVersion",
     "BookSeries",
     "book_characters",
     "book_tags",
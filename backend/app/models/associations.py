@@ -7,7 +7,7 @@ book_characters = Table(
     "book_characters",
     Base.metadata,
     Column("book_id", Integer, ForeignKey("books.id", ondelete="CASCADE"), primary_key=True),
-    Column("character_id", Integer, ForeignKey("characters.id", ondelete="CASCADE"), primary_key=True),
+    Column("character_id", Integer, ForeignKey("characters.id", ondelete="CASCADE"), primary_key=True, index=True),
     Column("appearance_tag", String(255), nullable=True),
 )
 
@@ -15,7 +15,7 @@ book_tags = Table(
     "book_tags",
     Base.metadata,
     Column("book_id", Integer, ForeignKey("books.id", ondelete="CASCADE"), primary_key=True),
-    Column("tag_id", Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+    Column("tag_id", Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True, index=True),
 )
 
 book_timeline_events = Table(
@@ -30,7 +30,7 @@ class BookSeries(Base):
     __tablename__ = "book_series"
 
     book_id: Mapped[int] = mapped_column(ForeignKey("books.id", ondelete="CASCADE"), primary_key=True)
-    series_id: Mapped[int] = mapped_column(ForeignKey("series.id", ondelete="CASCADE"), primary_key=True)
+    series_id: Mapped[int] = mapped_column(ForeignKey("series.id", ondelete="CASCADE"), primary_key=True, index=True)
     order_in_series: Mapped[int | None] = mapped_column(Integer)
 
     book: Mapped["Book"] = relationship(back_populates="series_links")  # noqa: F821
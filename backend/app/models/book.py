@@ -1,6 +1,7 @@
 import enum
+from datetime import date
 
-from sqlalchemy import Enum, ForeignKey, Integer, LargeBinary, String, Text
+from sqlalchemy import Date, Enum, ForeignKey, Index, Integer, LargeBinary, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin
@@ -19,6 +20,16 @@ class ReadingStatus(str, enum.Enum):
 
 class Book(TimestampMixin, Base):
     __tablename__ = "books"
+    __table_args__ = (
+        # (filter, sort, id) indexes backing the search_books sort registry
+        Index("ix_books_canon_title", "canon_or_legends", "title", "id"),
+        Index("ix_books_canon_timeline", "canon_or_legends", "timeline_year", "id"),
+        Index("ix_books_reading_title", "reading_status", "title", "id"),
+        Index("ix_books_reading_timeline", "reading_status", "timeline_year", "id"),
+        Index("ix_books_owned_title", "title", "id", postgresql_where=text("owned")),
+        Index("ix_books_owned_timeline", "timeline_year", "id", postgresql_where=text("owned")),
+        Index("ix_books_published_on", "published_on", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(String(500), index=True)
@@ -26,6 +37,7 @@ class Book(TimestampMixin, Base):
     isbn: Mapped[str | None] = mapped_column(String(17))
     page_count: Mapped[int | None] = mapped_column(Integer)
     publication_date: Mapped[str | None] = mapped_column(String(100))
+    published_on: Mapped[date | None] = mapped_column(Date)
     cover_url: Mapped[str | None] = mapped_column(String(1000))
     cover_image: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
     cover_image_content_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
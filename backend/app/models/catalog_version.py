@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class CatalogVersion(Base):
+    """Write counter per catalog scope, bumped in the writing transaction.
+
+    Shared by every worker, so HTTP validators built from it match no matter
+    which worker produced or receives them.
+    """
+
+    __tablename__ = "catalog_versions"
+
+    scope: Mapped[str] = mapped_column(String(20), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class IngestRun(Base):
+    """One /ingest request: timing per phase, row counts per table, slowest items and errors."""
+
+    __tablename__ = "ingest_runs"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    kind: Mapped[str] = mapped_column(String(20))
+    status: Mapped[str] = mapped_column(String(20))
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+    finished_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    duration_ms: Mapped[float] = mapped_column(Float)
+    items: Mapped[int] = mapped_column(Integer)
+    created: Mapped[int] = mapped_column(Integer)
+    updated: Mapped[int] = mapped_column(Integer)
+    errors: Mapped[int] = mapped_column(Integer)
+    # {"lookup": ms, "upsert": ms, ...}
+    phases: Mapped[dict] = mapped_column(JSONB)
+    # {"books": {"inserted": n, "updated": n, "deleted": n}, ...}
+    row_counts: Mapped[dict] = mapped_column(JSONB)
+    # [{"name": ..., "ms": ...}], slowest first
+    slowest: Mapped[list] = mapped_column(JSONB)
+    # [{"name": ..., "error": ...}]
+    error_details: Mapped[list] = mapped_column(JSONB)
@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from sqlalchemy import Float, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class SlowQuery(Base):
+    """A statement that exceeded SLOW_QUERY_EXPLAIN_MS, with its plan."""
+
+    __tablename__ = "slow_queries"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now(), index=True)
+    route: Mapped[str] = mapped_column(String(300))
+    statement: Mapped[str] = mapped_column(Text)
+    duration_ms: Mapped[float] = mapped_column(Float)
+    plan: Mapped[list] = mapped_column(JSONB)
@@ -0,0 +1,169 @@
+"""On-demand sampling profiler for live requests.
+
+A profiled request runs with a background thread that samples the event
+loop thread's stack every PROFILE_INTERVAL seconds. The samples are written
+to PROFILE_DIR in collapsed-stack format (``frame;frame;frame count`` per
+line), which flamegraph.pl, speedscope and inferno read directly. Requests
+are profiled when an admin armed their route for the next N requests, or
+when they carry ``X-Profile`` along with a valid ``X-Admin-Token``.
+
+Sampling covers the whole loop thread, so requests running at the same
+time show up in the same profile. The middleware is only installed when
+profiling is configured; otherwise it adds nothing to the request path.
+"""
+
+import asyncio
+import re
+import secrets
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import settings
+from app.metrics import route_template
+
+PROFILE_HEADER = "X-Profile"
+ADMIN_HEADER = "X-Admin-Token"
+PROFILE_SUFFIX = ".folded"
+
+# "<METHOD> <path template>" -> profiles still to take
+_armed: dict[str, int] = {}
+
+
+def profiling_enabled() -> bool:
+    return bool(settings.PROFILE_DIR and settings.ADMIN_TOKEN)
+
+
+def is_admin(token: str | None) -> bool:
+    return bool(token and settings.ADMIN_TOKEN) and secrets.compare_digest(token, settings.ADMIN_TOKEN)
+
+
+def arm(route: str, count: int) -> None:
+    _armed[route] = count
+
+
+def armed() -> dict[str, int]:
+    return dict(_armed)
+
+
+def _take_armed(key: str) -> bool:
+    remaining = _armed.get(key)
+    if not remaining:
+        return False
+    if remaining == 1:
+        del _armed[key]
+    else:
+        _armed[key] = remaining - 1
+    return True
+
+
+def profile_dir() -> Path:
+    return Path(settings.PROFILE_DIR)
+
+
+def list_profiles() -> list[dict]:
+    directory = profile_dir()
+    if not directory.is_dir():
+        return []
+    profiles = []
+    for path in directory.glob(f"*{PROFILE_SUFFIX}"):
+        stat = path.stat()
+        profiles.append(
+            {
+                "name": path.name,
+                "size": stat.st_size,
+                "created_at": datetime.fromtimestamp(stat.st_mtime, timezone.utc),
+            }
+        )
+    return sorted(profiles, key=lambda p: p["created_at"], reverse=True)
+
+
+def profile_path(name: str) -> Path | None:
+    """The stored profile called ``name``, refusing anything outside PROFILE_DIR."""
+    path = profile_dir() / name
+    if path.name != name or path.suffix != PROFILE_SUFFIX or not path.is_file():
+        return None
+    return path
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    # ';' separates frames in collapsed stacks
+    return f"{code.co_qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})".replace(";", ":")
+
+
+class StackSampler(threading.Thread):
+    def __init__(self, thread_id: int, interval: float):
+        super().__init__(name="profile-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._done = threading.Event()
+
+    def run(self) -> None:
+        while not self._done.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            if labels:
+                self.stacks[";".join(reversed(labels))] += 1
+
+    def stop(self) -> None:
+        self._done.set()
+        self.join()
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def _write_profile(name: str, content: str) -> None:
+    directory = profile_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / name).write_text(content)
+
+
+class ProfilingMiddleware:
+    """Sample the stacks of armed or ``X-Profile`` requests into PROFILE_DIR."""
+
+    def __init__(self, app: ASGIApp, routes: list):
+        self.app = app
+        self.routes = routes
+
+    def _wanted(self, scope: Scope) -> str | None:
+        """Route template to profile this request under, or None to skip it."""
+        headers = Headers(scope=scope)
+        if PROFILE_HEADER in headers and is_admin(headers.get(ADMIN_HEADER)):
+            return route_template(self.routes, scope)
+        if _armed:
+            route = route_template(self.routes, scope)
+            if _take_armed(f"{scope['method']} {route}"):
+                return route
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        route = self._wanted(scope)
+        if route is None:
+            await self.app(scope, receive, send)
+            return
+        sampler = StackSampler(threading.get_ident(), settings.PROFILE_INTERVAL)
+        started = time.time()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            await asyncio.to_thread(sampler.stop)
+            slug = re.sub(r"[^A-Za-z0-9]+", "_", route).strip("_") or "root"
+            stamp = datetime.fromtimestamp(started, timezone.utc).strftime("%Y%m%dT%H%M%S.%f")
+            name = f"{stamp}-{scope['method']}-{slug}-{(time.time() - started) * 1000:.0f}ms{PROFILE_SUFFIX}"
+            await asyncio.to_thread(_write_profile, name, sampler.collapsed())
@@ -0,0 +1,179 @@
+"""Per-request SQL statistics.
+
+Engine events count each statement run while a request is handled, add up
+its database time and group statements by shape (the SQL text with
+expanded IN-lists collapsed to one placeholder). A shape that repeats
+SQL_N_PLUS_ONE_THRESHOLD times in one request is most likely a query in a
+loop. Totals go out as a ``Server-Timing`` header and one JSON log line
+per request. With SLOW_QUERY_EXPLAIN_MS set, slow SELECTs are re-run
+afterwards under ``EXPLAIN (ANALYZE, BUFFERS)`` and the plan is stored in
+``slow_queries``.
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+import re
+import time
+from collections import Counter
+
+from sqlalchemy import event, insert
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.database import engine
+from app.metrics import UNMATCHED
+from app.models import SlowQuery
+
+logger = logging.getLogger(__name__)
+
+# "$1, $2, $3" from an expanded IN-list or multi-row VALUES
+_PARAM_RUN = re.compile(r"\$\d+(?:\s*,\s*\$\d+)+")
+# Slow statements kept per request for EXPLAIN, repeated shapes per log line
+_MAX_SLOW_PER_REQUEST = 3
+_MAX_REPEATED_LOGGED = 5
+
+_request_stats: contextvars.ContextVar["QueryStats | None"] = contextvars.ContextVar("query_stats", default=None)
+# Shape -> when it was last explained, so a slow endpoint under load is
+# explained once per cooldown rather than once per request
+_explained: dict[str, float] = {}
+_explain_tasks: set[asyncio.Task] = set()
+
+
+def statement_shape(statement: str) -> str:
+    return _PARAM_RUN.sub("$n", " ".join(statement.split()))
+
+
+class QueryStats:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes: Counter[str] = Counter()
+        self.slow: list[tuple[str, tuple, float]] = []
+
+    def record(self, statement: str, parameters, elapsed: float, executemany: bool) -> None:
+        self.count += 1
+        self.duration += elapsed
+        self.shapes[statement_shape(statement)] += 1
+        if (
+            settings.SLOW_QUERY_EXPLAIN_MS
+            and elapsed * 1000 >= settings.SLOW_QUERY_EXPLAIN_MS
+            and not executemany
+            and statement.lstrip()[:6].upper() == "SELECT"
+            and len(self.slow) < _MAX_SLOW_PER_REQUEST
+        ):
+            self.slow.append((statement, tuple(parameters or ()), elapsed))
+
+    def repeated(self) -> dict[str, int]:
+        return {shape: n for shape, n in self.shapes.most_common(_MAX_REPEATED_LOGGED) if n > 1}
+
+    def likely_n_plus_one(self) -> bool:
+        threshold = settings.SQL_N_PLUS_ONE_THRESHOLD
+        return bool(threshold) and any(n >= threshold for n in self.shapes.values())
+
+    def server_timing(self, total: float) -> str:
+        return f'db;dur={self.duration * 1000:.1f};desc="{self.count} statements", app;dur={total * 1000:.1f}'
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _request_stats.get() is not None:
+        conn.info["query_started"] = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _request_stats.get()
+    started = conn.info.pop("query_started", None)
+    if stats is not None and started is not None:
+        stats.record(statement, parameters, time.perf_counter() - started, executemany)
+
+
+async def _explain(route: str, statement: str, parameters: tuple, elapsed: float) -> None:
+    _request_stats.set(None)
+    try:
+        async with engine.connect() as conn:
+            await conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(settings.STATEMENT_TIMEOUT_READ)}")
+            result = await conn.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters)
+            plan = result.scalar()
+            # ANALYZE really ran the statement; leave nothing behind
+            await conn.rollback()
+        async with engine.begin() as conn:
+            await conn.execute(
+                insert(SlowQuery).values(
+                    route=route,
+                    statement=statement,
+                    duration_ms=elapsed * 1000,
+                    plan=json.loads(plan) if isinstance(plan, str) else plan,
+                )
+            )
+    except Exception:
+        logger.warning("Could not capture plan for slow query on %s", route, exc_info=True)
+
+
+def _schedule_explains(route: str, stats: QueryStats) -> None:
+    now = time.time()
+    for statement, parameters, elapsed in stats.slow:
+        shape = statement_shape(statement)
+        if now - _explained.get(shape, 0.0) < settings.SLOW_QUERY_COOLDOWN:
+            continue
+        _explained[shape] = now
+        task = asyncio.create_task(_explain(route, statement, parameters, elapsed))
+        _explain_tasks.add(task)
+        task.add_done_callback(_explain_tasks.discard)
+
+
+class QueryStatsMiddleware:
+    """Collect per-request SQL stats, send them as Server-Timing and log them.
+
+    The header is added when the response starts, which for non-streaming
+    routes is after all of their queries have run.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = QueryStats()
+        token = _request_stats.set(stats)
+        start = time.perf_counter()
+        status = None
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message).append("Server-Timing", stats.server_timing(time.perf_counter() - start))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_stats.reset(token)
+            if stats.count:
+                route = scope["route"].path if "route" in scope else UNMATCHED
+                self._report(scope["method"], route, status, stats, time.perf_counter() - start)
+
+    def _report(self, method: str, route: str, status: int | None, stats: QueryStats, total: float) -> None:
+        n_plus_one = stats.likely_n_plus_one()
+        record = {
+            "event": "request_sql",
+            "method": method,
+            "route": route,
+            "status": status,
+            "statements": stats.count,
+            "db_ms": round(stats.duration * 1000, 2),
+            "total_ms": round(total * 1000, 2),
+            "distinct_shapes": len(stats.shapes),
+            "repeated": stats.repeated(),
+            "n_plus_one": n_plus_one,
+        }
+        logger.log(logging.WARNING if n_plus_one else logging.INFO, json.dumps(record))
+        if stats.slow:
+            _schedule_explains(route, stats)
@@ -0,0 +1,130 @@
+"""Read-replica selection with health checks and read-your-writes.
+
+Reads go round-robin to replicas that passed their last health check and
+are not lagging more than READ_REPLICA_MAX_LAG seconds. They fall back to
+the primary when none are healthy, when the client wrote recently (sticky
+cookie/header set on its write responses), or when this worker saw any
+catalog write in the last READ_YOUR_WRITES_SECONDS. That keeps cache fills
+right after a write from caching rows a replica has not replayed yet.
+"""
+
+import asyncio
+import contextvars
+import itertools
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+STICKY_COOKIE = "read_primary_until"
+STICKY_HEADER = "X-Read-Primary-Until"
+
+# Seconds behind the primary; 0 when the replica has replayed everything it received
+_LAG_QUERY = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+_last_write = 0.0
+# Per-request holder flagged by write paths; see ReadYourWritesMiddleware
+_request_writes: contextvars.ContextVar[list | None] = contextvars.ContextVar("request_writes", default=None)
+
+
+def note_catalog_write() -> None:
+    """Record that the catalog changed (here or on another worker)."""
+    global _last_write
+    _last_write = time.time()
+
+
+def mark_request_wrote() -> None:
+    holder = _request_writes.get()
+    if holder is not None:
+        holder.append(True)
+
+
+def recently_written() -> bool:
+    return time.time() - _last_write < settings.READ_YOUR_WRITES_SECONDS
+
+
+def client_prefers_primary(cookies: dict, headers) -> bool:
+    """Whether a client is inside its own read-your-writes window."""
+    value = cookies.get(STICKY_COOKIE) or headers.get(STICKY_HEADER)
+    try:
+        return value is not None and float(value) > time.time()
+    except ValueError:
+        return False
+
+
+class Replica:
+    def __init__(self, name: str, engine: AsyncEngine):
+        self.name = name
+        self.engine = engine
+        self.session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        self.healthy = False
+        self.lag: float | None = None
+        self.checked_at: float | None = None
+
+    async def check(self) -> None:
+        try:
+            async with asyncio.timeout(settings.READ_REPLICA_CHECK_TIMEOUT):
+                async with self.engine.connect() as conn:
+                    lag = float(await conn.scalar(_LAG_QUERY))
+        except Exception as exc:
+            if self.healthy:
+                logger.warning("Read replica %s failed its health check: %s", self.name, exc)
+            self.healthy, self.lag = False, None
+        else:
+            healthy = not settings.READ_REPLICA_MAX_LAG or lag <= settings.READ_REPLICA_MAX_LAG
+            if healthy != self.healthy:
+                logger.info("Read replica %s is %s (lag %.1fs)", self.name, "up" if healthy else "down", lag)
+            self.healthy, self.lag = healthy, lag
+        self.checked_at = time.time()
+
+
+class ReplicaSet:
+    def __init__(self, replicas: list[Replica]):
+        self.replicas = replicas
+        self._counter = itertools.count()
+        self._task: asyncio.Task | None = None
+
+    def pick(self) -> async_sessionmaker | None:
+        """Next healthy replica's session factory, or None to use the primary."""
+        healthy = [r for r in self.replicas if r.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)].session
+
+    async def check_all(self) -> None:
+        await asyncio.gather(*(r.check() for r in self.replicas))
+
+    async def start(self) -> None:
+        if not self.replicas:
+            return
+        await self.check_all()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.READ_REPLICA_CHECK_INTERVAL)
+            await self.check_all()
+
+    def status(self) -> list[dict]:
+        return [
+            {"name": r.name, "healthy": r.healthy, "lag": r.lag, "checked_at": r.checked_at}
+            for r in self.replicas
+        ]
@@ -0,0 +1,110 @@
+import enum
+from datetime import date, datetime
+from typing import Any
+
+import msgpack
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+_MSGPACK_ALIASES = {MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack"}
+
+
+class ResponseFormat(str, enum.Enum):
+    """``columnar`` turns every list of objects into one array per field."""
+
+    columnar = "columnar"
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _msgpack_default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    raise TypeError(f"Type is not MessagePack serializable: {type(obj).__name__}")
+
+
+def dump_json(content: Any) -> bytes:
+    """Serialize service output without re-validating it against a response model."""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def to_columnar(content: Any) -> Any:
+    """Rewrite lists of objects as {field: [values...]}, at any depth."""
+    if isinstance(content, BaseModel):
+        content = content.model_dump()
+    if isinstance(content, dict):
+        return {key: to_columnar(value) for key, value in content.items()}
+    if isinstance(content, list):
+        rows = [row.model_dump() if isinstance(row, BaseModel) else row for row in content]
+        if rows and all(isinstance(row, dict) for row in rows):
+            fields = list(dict.fromkeys(key for row in rows for key in row))
+            return {field: [to_columnar(row.get(field)) for row in rows] for field in fields}
+        return [to_columnar(item) for item in rows]
+    return content
+
+
+def negotiate_media_type(accept: str | None) -> str:
+    """Pick MessagePack when the client prefers it over JSON, else JSON."""
+    if not accept:
+        return JSON_MEDIA_TYPE
+    best, best_q = JSON_MEDIA_TYPE, -1.0
+    for media_range in accept.split(","):
+        media_type, _, params = media_range.strip().partition(";")
+        media_type = media_type.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if media_type in _MSGPACK_ALIASES:
+            candidate = MSGPACK_MEDIA_TYPE
+        elif media_type in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            candidate = JSON_MEDIA_TYPE
+        else:
+            continue
+        if q > best_q:
+            best, best_q = candidate, q
+    return best if best_q > 0 else JSON_MEDIA_TYPE
+
+
+def prefers_minimal(prefer: str | None) -> bool:
+    """Whether a ``Prefer`` header (RFC 7240) asks for ``return=minimal``."""
+    if not prefer:
+        return False
+    # Preferences are comma-separated; anything after ";" is a parameter
+    tokens = (preference.split(";")[0].replace(" ", "").lower() for preference in prefer.split(","))
+    return "return=minimal" in tokens
+
+
+def render(content: Any, media_type: str = JSON_MEDIA_TYPE, columnar: bool = False) -> bytes:
+    if columnar:
+        content = to_columnar(content)
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return msgpack.packb(content, default=_msgpack_default)
+    return dump_json(content)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Returning one from a route skips FastAPI's response_model validation, so
+    only use it for content built from trusted service output. The route's
+    response_model still documents the shape in OpenAPI.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
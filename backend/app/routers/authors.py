@@ -1,21 +1,64 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.schemas.author import AuthorCreate, AuthorRead, AuthorUpdate, AuthorWithBooks
+from app.cache import cached_response
+from app.database import get_db, get_read_db
+from app.schemas.author import (
+    AuthorCreate,
+    AuthorRead,
+    AuthorSearchParams,
+    AuthorUpdate,
+    AuthorWithBooks,
+    PaginatedAuthors,
+)
+from app.schemas.book import BookOrderBy, OrderDir
 from app.services import author_service
 
 router = APIRouter(prefix="/authors", tags=["authors"])
 
 
 @router.get("", response_model=list[AuthorRead])
-async def list_authors(db: AsyncSession = Depends(get_db)):
-    return await author_service.list_authors(db)
+@cached_response("authors.list", depends=("authors",))
+async def list_authors(db: AsyncSession = Depends(get_read_db)):
+    return [AuthorRead.model_validate(a) for a in await author_service.list_authors(db)]
+
+
+@router.get("/search", response_model=PaginatedAuthors)
+@cached_response("authors.search", depends=("authors", "books"))
+async def search_authors(
+    name: str | None = None,
+    min_book_count: int | None = None,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=200),
+    order_by: Literal["name", "book_count"] = "name",
+    order_dir: OrderDir = "asc",
+    db: AsyncSession = Depends(get_read_db),
+):
+    params = AuthorSearchParams(
+        name=name,
+        min_book_count=min_book_count,
+        page=page,
+        page_size=page_size,
+        order_by=order_by,
+        order_dir=order_dir,
+    )
+    authors, total = await author_service.search_authors(db, params)
+    return {"items": authors, "total": total, "page": page, "page_size": page_size}
 
 
 @router.get("/{author_id}", response_model=AuthorWithBooks)
-async def get_author(author_id: int, db: AsyncSession = Depends(get_db)):
-    author = await author_service.get_author(db, author_id)
+@cached_response("authors.get", depends=("books",), entity=("authors", "author_id"))
+async def get_author(
+    author_id: int,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(100, ge=1, le=500),
+    order_by: BookOrderBy = "publication_date",
+    order_dir: OrderDir = "asc",
+    db: AsyncSession = Depends(get_read_db),
+):
+    author = await author_service.get_author(db, author_id, page, page_size, order_by, order_dir)
     if not author:
         raise HTTPException(404, "Author not found")
     return author
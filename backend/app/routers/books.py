@@ -1,16 +1,34 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from contextlib import nullcontext
+from datetime import date
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
 from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app import admission
+from app.cache import cached_response
+from app.database import get_db, get_read_db
 from app.models.book import CanonStatus, ReadingStatus
+from app.responses import FastJSONResponse, prefers_minimal
 from app.schemas.book import (
-    BookBrief,
+    BOOK_DETAIL_FIELDS,
+    BOOK_INCLUDES,
+    BookBatch,
+    BookBatchRequest,
     BookCreate,
+    BookDetail,
+    BookDetailParams,
+    BookFacets,
+    BookFilterParams,
+    BookOrderBy,
     BookRead,
     BookSearchParams,
     BookUpdate,
+    BulkStatusResult,
+    BulkStatusUpdate,
+    OrderDir,
     OwnedUpdate,
+    PaginatedBookCharacters,
     PaginatedBooks,
     StatusUpdate,
 )
@@ -19,8 +37,7 @@ from app.services import book_service
 router = APIRouter(prefix="/books", tags=["books"])
 
 
-@router.get("", response_model=PaginatedBooks)
-async def search_books(
+def book_filters(
     q: str | None = None,
     author_name: str | None = None,
     character_name: str | None = None,
@@ -30,13 +47,10 @@ async def search_books(
     owned: bool | None = None,
     timeline_year_min: int | None = None,
     timeline_year_max: int | None = None,
-    page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100),
-    order_by: str = "title",
-    order_dir: str = "asc",
-    db: AsyncSession = Depends(get_db),
-):
-    params = BookSearchParams(
+    published_min: date | None = None,
+    published_max: date | None = None,
+) -> BookFilterParams:
+    return BookFilterParams(
         q=q,
         author_name=author_name,
         character_name=character_name,
@@ -46,32 +60,114 @@ async def search_books(
         owned=owned,
         timeline_year_min=timeline_year_min,
         timeline_year_max=timeline_year_max,
+        published_min=published_min,
+        published_max=published_max,
+    )
+
+
+def _split_csv(value: str, allowed: tuple[str, ...], param: str) -> tuple[str, ...]:
+    names = {name.strip() for name in value.split(",") if name.strip()}
+    unknown = names - set(allowed)
+    if unknown:
+        raise HTTPException(422, f"Unknown {param}: {', '.join(sorted(unknown))}")
+    # Canonical order so equivalent requests share a cache entry
+    return tuple(name for name in allowed if name in names)
+
+
+def book_detail_params(
+    fields: str | None = Query(None, description="Comma-separated header fields to return (id is always included)"),
+    include: str | None = Query(None, description="Comma-separated relations to expand: series, characters, tags"),
+) -> BookDetailParams:
+    params = BookDetailParams()
+    if fields is not None:
+        params.fields = ("id", *(f for f in _split_csv(fields, BOOK_DETAIL_FIELDS, "fields") if f != "id"))
+    if include is not None:
+        params.include = _split_csv(include, BOOK_INCLUDES, "include")
+    return params
+
+
+def _book_brief(book, matched_characters: list[str] | None = None) -> dict:
+    return {
+        "id": book.id,
+        "title": book.title,
+        "canon_or_legends": book.canon_or_legends,
+        "reading_status": book.reading_status,
+        "owned": book.owned,
+        "timeline_year": book.timeline_year,
+        "published_on": book.published_on,
+        "author_name": book.author.name if book.author else None,
+        "cover_url": book.cover_url,
+        "matched_characters": matched_characters or [],
+    }
+
+
+@router.get("", response_model=PaginatedBooks)
+@cached_response("books.search", depends=("books", "authors", "characters", "series"))
+async def search_books(
+    filters: BookFilterParams = Depends(book_filters),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    order_by: BookOrderBy = "title",
+    order_dir: OrderDir = "asc",
+    db: AsyncSession = Depends(get_read_db),
+):
+    params = BookSearchParams(
+        **filters.model_dump(),
         page=page,
         page_size=page_size,
         order_by=order_by,
         order_dir=order_dir,
     )
-    books, total, matched_characters = await book_service.search_books(db, params)
-    items = []
-    for b in books:
-        items.append(
-            BookBrief(
-                id=b.id,
-                title=b.title,
-                canon_or_legends=b.canon_or_legends,
-                reading_status=b.reading_status,
-                owned=b.owned,
-                timeline_year=b.timeline_year,
-                author_name=b.author.name if b.author else None,
-                cover_url=b.cover_url,
-                matched_characters=matched_characters.get(b.id, []),
-            )
-        )
-    return PaginatedBooks(items=items, total=total, page=params.page, page_size=params.page_size)
+    text_filtered = any((filters.q, filters.author_name, filters.character_name, filters.series_name))
+    async with admission.search.slot() if text_filtered else nullcontext():
+        books, total, matched_characters = await book_service.search_books(db, params)
+    items = [_book_brief(b, matched_characters.get(b.id, [])) for b in books]
+    return {"items": items, "total": total, "page": params.page, "page_size": params.page_size}
+
+
+@router.get("/facets", response_model=BookFacets)
+async def get_book_facets(
+    filters: BookFilterParams = Depends(book_filters),
+    db: AsyncSession = Depends(get_read_db),
+):
+    return await book_service.get_book_facets(db, filters)
+
+
+@router.patch("/status", response_model=BulkStatusResult, response_model_exclude_none=True)
+async def bulk_update_status(
+    data: BulkStatusUpdate,
+    echo: bool = Query(True, description="Also return the updated books, not just their ids"),
+    prefer: str | None = Header(None),
+    db: AsyncSession = Depends(get_db),
+):
+    values = data.model_dump(include={"reading_status", "owned"}, exclude_none=True)
+    updated_ids = await book_service.update_books_status(db, values, data.ids, data.filter)
+    result = {"updated_ids": updated_ids}
+    if echo and not prefers_minimal(prefer):
+        briefs = await book_service.get_book_briefs(db, updated_ids) if updated_ids else []
+        result["items"] = [_book_brief(b) for b in briefs]
+    return result
+
+
+@router.post("/batch", response_model=BookBatch)
+async def get_books_batch(
+    data: BookBatchRequest,
+    params: BookDetailParams = Depends(book_detail_params),
+    db: AsyncSession = Depends(get_read_db),
+):
+    ids = list(dict.fromkeys(data.ids))
+    books = await book_service.get_books(db, ids, params)
+    # Serializing through BookDetail would fill in the fields left out, so render directly
+    return FastJSONResponse(
+        {
+            "items": [_book_read(books[book_id], params) for book_id in ids if book_id in books],
+            "missing": [book_id for book_id in ids if book_id not in books],
+        }
+    )
 
 
 @router.get("/{book_id}/cover")
-async def get_book_cover(book_id: int, db: AsyncSession = Depends(get_db)):
+async def get_book_cover(book_id: int, db: AsyncSession = Depends(get_read_db)):
     from app.models import Book
 
     book = await db.get(Book, book_id)
@@ -84,50 +180,86 @@ async def get_book_cover(book_id: int, db: AsyncSession = Depends(get_db)):
     )
 
 
-@router.get("/{book_id}", response_model=BookRead)
-async def get_book(book_id: int, db: AsyncSession = Depends(get_db)):
-    book = await book_service.get_book(db, book_id)
+def _book_read(book, params: BookDetailParams | None = None) -> dict:
+    params = params or BookDetailParams()
+    data = {}
+    for name in params.fields:
+        if name == "author_name":
+            data[name] = book.author.name if book.author else None
+        else:
+            data[name] = getattr(book, name)
+    if "series" in params.include:
+        data["series"] = [
+            {"id": sl.series.id, "name": sl.series.name, "order_in_series": sl.order_in_series}
+            for sl in book.series_links
+        ]
+    if "characters" in params.include:
+        data["characters"] = [{"id": c.id, "name": c.name} for c in book.characters]
+    if "tags" in params.include:
+        data["tags"] = [{"id": t.id, "tag_name": t.tag_name, "category": t.category} for t in book.tags]
+    return data
+
+
+async def _load_book_read(db: AsyncSession, book_id: int, params: BookDetailParams | None = None) -> dict:
+    book = await book_service.get_book(db, book_id, params)
     if not book:
         raise HTTPException(404, "Book not found")
+    return _book_read(book, params)
 
-    return BookRead(
-        id=book.id,
-        title=book.title,
-        description=book.description,
-        isbn=book.isbn,
-        page_count=book.page_count,
-        publication_date=book.publication_date,
-        cover_url=book.cover_url,
-        wookieepedia_url=book.wookieepedia_url,
-        canon_or_legends=book.canon_or_legends,
-        reading_status=book.reading_status,
-        owned=book.owned,
-        timeline_year=book.timeline_year,
-        timeline_year_start=book.timeline_year_start,
-        timeline_year_end=book.timeline_year_end,
-        author_id=book.author_id,
-        author_name=book.author.name if book.author else None,
-        series=[
-            {"id": sl.series.id, "name": sl.series.name, "order_in_series": sl.order_in_series}
-            for sl in book.series_links
-        ],
-        characters=[{"id": c.id, "name": c.name} for c in book.characters],
-        tags=[{"id": t.id, "tag_name": t.tag_name, "category": t.category} for t in book.tags],
-    )
+
+@router.get("/{book_id}/characters", response_model=PaginatedBookCharacters)
+@cached_response("books.characters", depends=("characters",), entity=("books", "book_id"))
+async def get_book_characters(
+    book_id: int,
+    name: str | None = None,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_read_db),
+):
+    result = await book_service.get_book_characters(db, book_id, name, page, page_size)
+    if result is None:
+        raise HTTPException(404, "Book not found")
+    items, total = result
+    return {"items": items, "total": total, "page": page, "page_size": page_size}
+
+
+# ``fields`` narrows the header and ``include`` picks the relations to expand;
+# omitting ``include`` expands all of them, as before.
+@router.get("/{book_id}", response_model=BookDetail)
+@cached_response("books.get", depends=("authors", "series", "characters", "tags"), entity=("books", "book_id"))
+async def get_book(
+    book_id: int,
+    params: BookDetailParams = Depends(book_detail_params),
+    db: AsyncSession = Depends(get_read_db),
+):
+    return await _load_book_read(db, book_id, params)
 
 
+def _minimal_response(status_code: int = 204, **headers: str) -> Response:
+    return Response(status_code=status_code, headers={"Preference-Applied": "return=minimal", **headers})
+
+
+# Writes echo the book with one load afterwards, or nothing at all when the
+# client sends ``Prefer: return=minimal``.
 @router.post("", response_model=BookRead, status_code=201)
-async def create_book(data: BookCreate, db: AsyncSession = Depends(get_db)):
-    book = await book_service.create_book(db, data)
-    return await get_book(book.id, db)
+async def create_book(
+    data: BookCreate, request: Request, prefer: str | None = Header(None), db: AsyncSession = Depends(get_db)
+):
+    book_id = await book_service.create_book(db, data)
+    if prefers_minimal(prefer):
+        return _minimal_response(201, Location=str(request.url_for("get_book", book_id=book_id)))
+    return await _load_book_read(db, book_id)
 
 
 @router.put("/{book_id}", response_model=BookRead)
-async def update_book(book_id: int, data: BookUpdate, db: AsyncSession = Depends(get_db)):
-    book = await book_service.update_book(db, book_id, data)
-    if not book:
+async def update_book(
+    book_id: int, data: BookUpdate, prefer: str | None = Header(None), db: AsyncSession = Depends(get_db)
+):
+    if await book_service.update_book(db, book_id, data) is None:
         raise HTTPException(404, "Book not found")
-    return await get_book(book.id, db)
+    if prefers_minimal(prefer):
+        return _minimal_response()
+    return await _load_book_read(db, book_id)
 
 
 @router.delete("/{book_id}", status_code=204)
@@ -138,24 +270,22 @@ async def delete_book(book_id: int, db: AsyncSession = Depends(get_db)):
 
 
 @router.patch("/{book_id}/status", response_model=BookRead)
-async def update_status(book_id: int, data: StatusUpdate, db: AsyncSession = Depends(get_db)):
-    from app.models import Book
-
-    book = await db.get(Book, book_id)
-    if not book:
+async def update_status(
+    book_id: int, data: StatusUpdate, prefer: str | None = Header(None), db: AsyncSession = Depends(get_db)
+):
+    if not await book_service.update_books_status(db, {"reading_status": data.reading_status}, [book_id]):
         raise HTTPException(404, "Book not found")
-    book.reading_status = data.reading_status
-    await db.commit()
-    return await get_book(book_id, db)
+    if prefers_minimal(prefer):
+        return _minimal_response()
+    return await _load_book_read(db, book_id)
 
 
 @router.patch("/{book_id}/owned", response_model=BookRead)
-async def update_owned(book_id: int, data: OwnedUpdate, db: AsyncSession = Depends(get_db)):
-    from app.models import Book
-
-    book = await db.get(Book, book_id)
-    if not book:
+async def update_owned(
+    book_id: int, data: OwnedUpdate, prefer: str | None = Header(None), db: AsyncSession = Depends(get_db)
+):
+    if not await book_service.update_books_status(db, {"owned": data.owned}, [book_id]):
         raise HTTPException(404, "Book not found")
-    book.owned = data.owned
-    await db.commit()
-    return await get_book(book_id, db)
+    if prefers_minimal(prefer):
+        return _minimal_response()
+    return await _load_book_read(db, book_id)
@@ -1,12 +1,22 @@
+from contextlib import nullcontext
+
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app import admission
+from app.cache import cached_response
+from app.database import get_db, get_read_db
 from app.models.book import CanonStatus, ReadingStatus
+from app.responses import FastJSONResponse
+from app.schemas.book import OrderDir
 from app.schemas.character import (
+    CharacterBatch,
+    CharacterBatchRequest,
+    CharacterBookOrderBy,
     CharacterCreate,
     CharacterDetail,
     CharacterDetailParams,
+    CharacterOrderBy,
     CharacterRead,
     CharacterSearchParams,
     PaginatedCharacters,
@@ -17,14 +27,15 @@ router = APIRouter(prefix="/characters", tags=["characters"])
 
 
 @router.get("/search", response_model=PaginatedCharacters)
+@cached_response("characters.search", depends=("books", "characters"), stale_while_revalidate=True)
 async def search_characters(
     name: str | None = None,
     min_book_count: int | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    order_by: str = "name",
-    order_dir: str = "asc",
-    db: AsyncSession = Depends(get_db),
+    order_by: CharacterOrderBy = "name",
+    order_dir: OrderDir = "asc",
+    db: AsyncSession = Depends(get_read_db),
 ):
     params = CharacterSearchParams(
         name=name,
@@ -34,24 +45,22 @@ async def search_characters(
         order_by=order_by,
         order_dir=order_dir,
     )
-    characters, total = await character_service.search_characters(db, params)
-    return PaginatedCharacters(items=characters, total=total, page=page, page_size=page_size)
+    async with admission.search.slot() if order_by == "book_count" else nullcontext():
+        characters, total = await character_service.search_characters(db, params)
+    return {"items": characters, "total": total, "page": page, "page_size": page_size}
 
 
-@router.get("/{character_id}", response_model=CharacterDetail)
-async def get_character(
-    character_id: int,
+def character_detail_params(
     canon_status: CanonStatus | None = None,
     reading_status: ReadingStatus | None = None,
     timeline_year_min: int | None = None,
     timeline_year_max: int | None = None,
-    order_by: str = "timeline_year",
-    order_dir: str = "asc",
+    order_by: CharacterBookOrderBy = "timeline_year",
+    order_dir: OrderDir = "asc",
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=500),
-    db: AsyncSession = Depends(get_db),
-):
-    params = CharacterDetailParams(
+) -> CharacterDetailParams:
+    return CharacterDetailParams(
         canon_status=canon_status,
         reading_status=reading_status,
         timeline_year_min=timeline_year_min,
@@ -61,6 +70,36 @@ async def get_character(
         page=page,
         page_size=page_size,
     )
+
+
+@router.post("/batch", response_model=CharacterBatch)
+async def get_characters_batch(
+    data: CharacterBatchRequest,
+    params: CharacterDetailParams = Depends(character_detail_params),
+    db: AsyncSession = Depends(get_read_db),
+):
+    ids = list(dict.fromkeys(data.ids))
+    details = await character_service.get_character_details(db, ids, params)
+    return FastJSONResponse(
+        {
+            "items": [details[character_id] for character_id in ids if character_id in details],
+            "missing": [character_id for character_id in ids if character_id not in details],
+        }
+    )
+
+
+@router.get("/{character_id}", response_model=CharacterDetail)
+@cached_response(
+    "characters.get",
+    depends=("books", "authors"),
+    entity=("characters", "character_id"),
+    stale_while_revalidate=True,
+)
+async def get_character(
+    character_id: int,
+    params: CharacterDetailParams = Depends(character_detail_params),
+    db: AsyncSession = Depends(get_read_db),
+):
     detail = await character_service.get_character_detail(db, character_id, params)
     if not detail:
         raise HTTPException(404, "Character not found")
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi.responses import FileResponse
+
+from app import profiling
+from app.schemas.debug import ProfileArm, ProfileIndex
+
+
+def require_admin(x_admin_token: str | None = Header(None)) -> None:
+    if not profiling.is_admin(x_admin_token):
+        raise HTTPException(403, "Admin token required")
+
+
+router = APIRouter(prefix="/debug/profiles", tags=["debug"], dependencies=[Depends(require_admin)])
+
+
+def _route_keys(request: Request) -> set[str]:
+    return {
+        f"{method} {route.path}"
+        for route in request.app.routes
+        for method in getattr(route, "methods", None) or ()
+    }
+
+
+@router.get("", response_model=ProfileIndex)
+async def list_profiles():
+    return {"armed": profiling.armed(), "profiles": profiling.list_profiles()}
+
+
+@router.post("", response_model=ProfileIndex)
+async def arm_profiling(data: ProfileArm, request: Request):
+    """Profile the next ``count`` requests to ``route``."""
+    if data.route not in _route_keys(request):
+        raise HTTPException(422, f"Unknown route: {data.route}")
+    profiling.arm(data.route, data.count)
+    return {"armed": profiling.armed(), "profiles": profiling.list_profiles()}
+
+
+@router.get("/{name}")
+async def get_profile(name: str):
+    path = profiling.profile_path(name)
+    if path is None:
+        raise HTTPException(404, "Profile not found")
+    return FileResponse(path, media_type="text/plain")
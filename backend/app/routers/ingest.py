@@ -1,18 +1,42 @@
-from fastapi import APIRouter, Depends
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.schemas.ingest import IngestBook, IngestCharacter, IngestResult
-from app.services import ingest_service
+from app import admission
+from app.database import get_ingest_db, get_read_db
+from app.schemas.ingest import IngestBook, IngestCharacter, IngestResult, IngestRunDetail, PaginatedIngestRuns
+from app.services import ingest_run_service, ingest_service
 
 router = APIRouter(prefix="/ingest", tags=["ingest"])
 
 
 @router.post("/books", response_model=IngestResult)
-async def ingest_books(books: list[IngestBook], db: AsyncSession = Depends(get_db)):
-    return await ingest_service.ingest_books(db, books)
+async def ingest_books(books: list[IngestBook], db: AsyncSession = Depends(get_ingest_db)):
+    async with admission.ingest.slot():
+        return await ingest_service.ingest_books(db, books)
 
 
 @router.post("/characters", response_model=IngestResult)
-async def ingest_characters(characters: list[IngestCharacter], db: AsyncSession = Depends(get_db)):
-    return await ingest_service.ingest_characters(db, characters)
+async def ingest_characters(characters: list[IngestCharacter], db: AsyncSession = Depends(get_ingest_db)):
+    async with admission.ingest.slot():
+        return await ingest_service.ingest_characters(db, characters)
+
+
+@router.get("/runs", response_model=PaginatedIngestRuns)
+async def list_ingest_runs(
+    kind: Literal["books", "characters"] | None = None,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+):
+    runs, total = await ingest_run_service.list_ingest_runs(db, kind, page, page_size)
+    return {"items": runs, "total": total, "page": page, "page_size": page_size}
+
+
+@router.get("/runs/{run_id}", response_model=IngestRunDetail)
+async def get_ingest_run(run_id: int, db: AsyncSession = Depends(get_read_db)):
+    run = await ingest_run_service.get_ingest_run(db, run_id)
+    if not run:
+        raise HTTPException(404, "Ingest run not found")
+    return run
@@ -1,44 +1,67 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.schemas.book import BookBrief
-from app.schemas.series import SeriesCreate, SeriesRead, SeriesWithBooks
+from app.cache import cached_response
+from app.database import get_db, get_read_db
+from app.schemas.book import OrderDir
+from app.schemas.series import (
+    PaginatedSeries,
+    SeriesBookOrderBy,
+    SeriesCreate,
+    SeriesRead,
+    SeriesSearchParams,
+    SeriesWithBooks,
+)
 from app.services import series_service
 
 router = APIRouter(prefix="/series", tags=["series"])
 
 
 @router.get("", response_model=list[SeriesRead])
-async def list_series(db: AsyncSession = Depends(get_db)):
-    return await series_service.list_series(db)
+@cached_response("series.list", depends=("series",))
+async def list_series(db: AsyncSession = Depends(get_read_db)):
+    return [SeriesRead.model_validate(s) for s in await series_service.list_series(db)]
+
+
+@router.get("/search", response_model=PaginatedSeries)
+@cached_response("series.search", depends=("series", "books"))
+async def search_series(
+    name: str | None = None,
+    min_book_count: int | None = None,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=200),
+    order_by: Literal["name", "book_count"] = "name",
+    order_dir: OrderDir = "asc",
+    db: AsyncSession = Depends(get_read_db),
+):
+    params = SeriesSearchParams(
+        name=name,
+        min_book_count=min_book_count,
+        page=page,
+        page_size=page_size,
+        order_by=order_by,
+        order_dir=order_dir,
+    )
+    series, total = await series_service.search_series(db, params)
+    return {"items": series, "total": total, "page": page, "page_size": page_size}
 
 
 @router.get("/{series_id}", response_model=SeriesWithBooks)
-async def get_series(series_id: int, db: AsyncSession = Depends(get_db)):
-    series = await series_service.get_series(db, series_id)
+@cached_response("series.get", depends=("books",), entity=("series", "series_id"))
+async def get_series(
+    series_id: int,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(100, ge=1, le=500),
+    order_by: SeriesBookOrderBy = "order_in_series",
+    order_dir: OrderDir = "asc",
+    db: AsyncSession = Depends(get_read_db),
+):
+    series = await series_service.get_series(db, series_id, page, page_size, order_by, order_dir)
     if not series:
         raise HTTPException(404, "Series not found")
-
-    books = sorted(series.book_links, key=lambda bl: bl.order_in_series or 0)
-    return SeriesWithBooks(
-        id=series.id,
-        name=series.name,
-        description=series.description,
-        books=[
-            BookBrief(
-                id=bl.book.id,
-                title=bl.book.title,
-                canon_or_legends=bl.book.canon_or_legends,
-                reading_status=bl.book.reading_status,
-                owned=bl.book.owned,
-                timeline_year=bl.book.timeline_year,
-                author_name=None,
-                cover_url=bl.book.cover_url,
-            )
-            for bl in books
-        ],
-    )
+    return series
 
 
 @router.post("", response_model=SeriesRead, status_code=201)
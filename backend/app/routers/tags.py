@@ -1,18 +1,56 @@
-from fastapi import APIRouter, Depends
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.schemas.tag import TagCreate, TagRead
+from app.cache import cached_response
+from app.database import get_db, get_read_db
+from app.schemas.book import OrderDir
+from app.schemas.tag import PaginatedTags, TagApply, TagApplyResult, TagCreate, TagRead, TagSearchParams
 from app.services import tag_service
 
 router = APIRouter(prefix="/tags", tags=["tags"])
 
 
 @router.get("", response_model=list[TagRead])
-async def list_tags(category: str | None = None, db: AsyncSession = Depends(get_db)):
-    return await tag_service.list_tags(db, category)
+@cached_response("tags.list", depends=("tags",))
+async def list_tags(category: str | None = None, db: AsyncSession = Depends(get_read_db)):
+    return [TagRead.model_validate(t) for t in await tag_service.list_tags(db, category)]
+
+
+@router.get("/search", response_model=PaginatedTags)
+@cached_response("tags.search", depends=("tags", "books"))
+async def search_tags(
+    name: str | None = None,
+    category: str | None = None,
+    min_book_count: int | None = None,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=200),
+    order_by: Literal["name", "book_count"] = "name",
+    order_dir: OrderDir = "asc",
+    db: AsyncSession = Depends(get_read_db),
+):
+    params = TagSearchParams(
+        name=name,
+        category=category,
+        min_book_count=min_book_count,
+        page=page,
+        page_size=page_size,
+        order_by=order_by,
+        order_dir=order_dir,
+    )
+    tags, total = await tag_service.search_tags(db, params)
+    return {"items": tags, "total": total, "page": page, "page_size": page_size}
 
 
 @router.post("", response_model=TagRead, status_code=201)
 async def create_tag(data: TagCreate, db: AsyncSession = Depends(get_db)):
     return await tag_service.create_tag(db, data)
+
+
+@router.post("/{tag_id}/apply", response_model=TagApplyResult)
+async def apply_tag(tag_id: int, data: TagApply, db: AsyncSession = Depends(get_db)):
+    book_ids = await tag_service.apply_tag(db, tag_id, data)
+    if book_ids is None:
+        raise HTTPException(404, "Tag not found")
+    return {"tag_id": tag_id, "action": data.action, "book_ids": book_ids}
@@ -1,16 +1,43 @@
 from app.schemas.book import (
+    BookBatch,
+    BookBatchRequest,
     BookBrief,
     BookCreate,
+    BookDetail,
+    BookDetailParams,
+    BookFacets,
+    BookFilterParams,
     BookRead,
     BookSearchParams,
+    BookSelection,
     BookUpdate,
+    BulkStatusResult,
+    BulkStatusUpdate,
     OwnedUpdate,
+    PaginatedBookCharacters,
     PaginatedBooks,
     StatusUpdate,
 )
-from app.schemas.author import AuthorCreate, AuthorRead, AuthorUpdate, AuthorWithBooks
-from app.schemas.series import SeriesCreate, SeriesRead, SeriesWithBooks
+from app.schemas.author import (
+    AuthorCreate,
+    AuthorRead,
+    AuthorSearchParams,
+    AuthorSummary,
+    AuthorUpdate,
+    AuthorWithBooks,
+    PaginatedAuthors,
+)
+from app.schemas.series import (
+    PaginatedSeries,
+    SeriesCreate,
+    SeriesRead,
+    SeriesSearchParams,
+    SeriesSummary,
+    SeriesWithBooks,
+)
 from app.schemas.character import (
+    CharacterBatch,
+    CharacterBatchRequest,
     CharacterCreate,
     CharacterDetail,
     CharacterDetailParams,
@@ -18,5 +45,21 @@ from app.schemas.character import (
     CharacterSearchParams,
     PaginatedCharacters,
 )
-from app.schemas.tag import TagCreate, TagRead
-from app.schemas.ingest import IngestBook, IngestCharacter, IngestResult
+from app.schemas.tag import (
+    PaginatedTags,
+    TagApply,
+    TagApplyResult,
+    TagCreate,
+    TagRead,
+    TagSearchParams,
+    TagSummary,
+)
+from app.schemas.ingest import (
+    IngestBook,
+    IngestCharacter,
+    IngestResult,
+    IngestRunDetail,
+    IngestRunSummary,
+    PaginatedIngestRuns,
+)
+from app.schemas.debug import ProfileArm, ProfileIndex, ProfileInfo
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
 
@@ -19,8 +21,31 @@ class AuthorRead(AuthorBase):
     model_config = {"from_attributes": True}
 
 
+class AuthorSummary(AuthorRead):
+    book_count: int = 0
+
+
 class AuthorWithBooks(AuthorRead):
+    book_count: int = 0
     books: list["BookBrief"] = []
+    books_page: int = 1
+    books_page_size: int = 100
+
+
+class AuthorSearchParams(BaseModel):
+    name: str | None = None
+    min_book_count: int | None = None
+    page: int = 1
+    page_size: int = 50
+    order_by: Literal["name", "book_count"] = "name"
+    order_dir: Literal["asc", "desc"] = "asc"
+
+
+class PaginatedAuthors(BaseModel):
+    items: list[AuthorSummary]
+    total: int
+    page: int
+    page_size: int
 
 
 from app.schemas.book import BookBrief  # noqa: E402
@@ -1,7 +1,19 @@
-from pydantic import BaseModel
+from datetime import date
+from typing import Literal
+
+from pydantic import BaseModel, Field, create_model, model_validator
 
 from app.models.book import CanonStatus, ReadingStatus
 
+BookOrderBy = Literal["title", "timeline_year", "publication_date", "published_on", "page_count"]
+OrderDir = Literal["asc", "desc"]
+
+# Upper bound on ids per batch request
+MAX_BATCH_IDS = 100
+
+# Related collections on book detail, loaded only when asked for
+BOOK_INCLUDES = ("series", "characters", "tags")
+
 
 class BookBrief(BaseModel):
     id: int
@@ -10,6 +22,7 @@ class BookBrief(BaseModel):
     reading_status: ReadingStatus
     owned: bool
     timeline_year: int | None = None
+    published_on: date | None = None
     author_name: str | None = None
     cover_url: str | None = None
     matched_characters: list[str] = []
@@ -69,6 +82,7 @@ class TagBrief(BaseModel):
 
 class BookRead(BookBase):
     id: int
+    published_on: date | None = None
     author_id: int | None = None
     author_name: str | None = None
     series: list[SeriesBrief] = []
@@ -77,7 +91,45 @@ class BookRead(BookBase):
     model_config = {"from_attributes": True}
 
 
-class BookSearchParams(BaseModel):
+# Header fields selectable with ``fields=`` on book detail
+BOOK_DETAIL_FIELDS = tuple(name for name in BookRead.model_fields if name not in BOOK_INCLUDES)
+
+# BookRead as narrowed by ``fields=`` and ``include=``: only ``id`` is always present
+BookDetail = create_model(
+    "BookDetail",
+    id=(int, ...),
+    **{name: (field.annotation, None) for name, field in BookRead.model_fields.items() if name != "id"},
+)
+
+
+class BookDetailParams(BaseModel):
+    fields: tuple[str, ...] = BOOK_DETAIL_FIELDS
+    include: tuple[str, ...] = BOOK_INCLUDES
+
+
+class BookBatchRequest(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=MAX_BATCH_IDS)
+
+
+class BookBatch(BaseModel):
+    items: list[BookDetail]  # type: ignore[valid-type]
+    missing: list[int] = []
+
+
+class BookCharacter(BaseModel):
+    id: int
+    name: str
+    appearance_tag: str | None = None
+
+
+class PaginatedBookCharacters(BaseModel):
+    items: list[BookCharacter]
+    total: int
+    page: int
+    page_size: int
+
+
+class BookFilterParams(BaseModel):
     q: str | None = None
     author_name: str | None = None
     character_name: str | None = None
@@ -87,10 +139,15 @@ class BookSearchParams(BaseModel):
     owned: bool | None = None
     timeline_year_min: int | None = None
     timeline_year_max: int | None = None
+    published_min: date | None = None
+    published_max: date | None = None
+
+
+class BookSearchParams(BookFilterParams):
     page: int = 1
     page_size: int = 20
-    order_by: str = "title"
-    order_dir: str = "asc"
+    order_by: BookOrderBy = "title"
+    order_dir: OrderDir = "asc"
 
 
 class PaginatedBooks(BaseModel):
@@ -100,6 +157,48 @@ class PaginatedBooks(BaseModel):
     page_size: int
 
 
+class DecadeFacet(BaseModel):
+    decade: int | None
+    count: int
+
+
+class BookFacets(BaseModel):
+    total: int
+    canon_status: dict[CanonStatus, int]
+    reading_status: dict[ReadingStatus, int]
+    owned: dict[bool, int]
+    timeline_decade: list[DecadeFacet]
+
+
+class BookSelection(BaseModel):
+    """The books listed in ``ids``, or every book matching ``filter``."""
+
+    ids: list[int] | None = None
+    filter: BookFilterParams | None = None
+
+    @model_validator(mode="after")
+    def check_target(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of ids or filter")
+        return self
+
+
+class BulkStatusUpdate(BookSelection):
+    reading_status: ReadingStatus | None = None
+    owned: bool | None = None
+
+    @model_validator(mode="after")
+    def check_values(self):
+        if self.reading_status is None and self.owned is None:
+            raise ValueError("Provide reading_status and/or owned")
+        return self
+
+
+class BulkStatusResult(BaseModel):
+    updated_ids: list[int]
+    items: list[BookBrief] | None = None
+
+
 class StatusUpdate(BaseModel):
     reading_status: ReadingStatus
 
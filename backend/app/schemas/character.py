@@ -1,6 +1,12 @@
-from pydantic import BaseModel
+from typing import Literal
+
+from pydantic import BaseModel, Field
 
 from app.models.book import CanonStatus, ReadingStatus
+from app.schemas.book import MAX_BATCH_IDS, OrderDir
+
+CharacterOrderBy = Literal["name", "book_count"]
+CharacterBookOrderBy = Literal["timeline_year", "title", "publication_date"]
 
 
 class CharacterBase(BaseModel):
@@ -52,19 +58,28 @@ class CharacterDetailParams(BaseModel):
     reading_status: ReadingStatus | None = None
     timeline_year_min: int | None = None
     timeline_year_max: int | None = None
-    order_by: str = "timeline_year"
-    order_dir: str = "asc"
+    order_by: CharacterBookOrderBy = "timeline_year"
+    order_dir: OrderDir = "asc"
     page: int = 1
     page_size: int = 20
 
 
+class CharacterBatchRequest(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=MAX_BATCH_IDS)
+
+
+class CharacterBatch(BaseModel):
+    items: list[CharacterDetail]
+    missing: list[int] = []
+
+
 class CharacterSearchParams(BaseModel):
     name: str | None = None
     min_book_count: int | None = None
     page: int = 1
     page_size: int = 20
-    order_by: str = "name"
-    order_dir: str = "asc"
+    order_by: CharacterOrderBy = "name"
+    order_dir: OrderDir = "asc"
 
 
 class PaginatedCharacters(BaseModel):
@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class ProfileArm(BaseModel):
+    # "<METHOD> <path template>", e.g. "GET /api/v1/books/{book_id}"
+    route: str
+    count: int = Field(1, ge=1, le=100)
+
+
+class ProfileInfo(BaseModel):
+    name: str
+    size: int
+    created_at: datetime
+
+
+class ProfileIndex(BaseModel):
+    armed: dict[str, int]
+    profiles: list[ProfileInfo]
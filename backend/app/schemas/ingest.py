@@ -1,3 +1,6 @@
+from datetime import datetime
+from typing import Literal
+
 from pydantic import BaseModel, field_validator
 
 
@@ -45,3 +48,42 @@ class IngestResult(BaseModel):
     created: int
     updated: int
     errors: int
+    run_id: int | None = None
+
+
+class IngestRunSummary(BaseModel):
+    id: int
+    kind: Literal["books", "characters"]
+    status: Literal["completed", "failed"]
+    started_at: datetime
+    finished_at: datetime
+    duration_ms: float
+    items: int
+    created: int
+    updated: int
+    errors: int
+    phases: dict[str, float]
+    row_counts: dict[str, dict[str, int]]
+    model_config = {"from_attributes": True}
+
+
+class IngestSlowItem(BaseModel):
+    name: str
+    ms: float
+
+
+class IngestError(BaseModel):
+    name: str | None
+    error: str
+
+
+class IngestRunDetail(IngestRunSummary):
+    slowest: list[IngestSlowItem]
+    error_details: list[IngestError]
+
+
+class PaginatedIngestRuns(BaseModel):
+    items: list[IngestRunSummary]
+    total: int
+    page: int
+    page_size: int
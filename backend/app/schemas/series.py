@@ -1,6 +1,8 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
-from app.schemas.book import BookBrief
+from app.schemas.book import BookBrief, BookOrderBy
 
 
 class SeriesBase(BaseModel):
@@ -17,5 +19,35 @@ class SeriesRead(SeriesBase):
     model_config = {"from_attributes": True}
 
 
+class SeriesSummary(SeriesRead):
+    book_count: int = 0
+
+
+class SeriesBook(BookBrief):
+    order_in_series: int | None = None
+
+
 class SeriesWithBooks(SeriesRead):
-    books: list[BookBrief] = []
+    book_count: int = 0
+    books: list[SeriesBook] = []
+    books_page: int = 1
+    books_page_size: int = 100
+
+
+SeriesBookOrderBy = Literal["order_in_series"] | BookOrderBy
+
+
+class SeriesSearchParams(BaseModel):
+    name: str | None = None
+    min_book_count: int | None = None
+    page: int = 1
+    page_size: int = 50
+    order_by: Literal["name", "book_count"] = "name"
+    order_dir: Literal["asc", "desc"] = "asc"
+
+
+class PaginatedSeries(BaseModel):
+    items: list[SeriesSummary]
+    total: int
+    page: int
+    page_size: int
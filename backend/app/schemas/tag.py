@@ -1,5 +1,9 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
+from app.schemas.book import BookSelection
+
 
 class TagBase(BaseModel):
     tag_name: str
@@ -13,3 +17,34 @@ class TagCreate(TagBase):
 class TagRead(TagBase):
     id: int
     model_config = {"from_attributes": True}
+
+
+class TagSummary(TagRead):
+    book_count: int = 0
+
+
+class TagSearchParams(BaseModel):
+    name: str | None = None
+    category: str | None = None
+    min_book_count: int | None = None
+    page: int = 1
+    page_size: int = 50
+    order_by: Literal["name", "book_count"] = "name"
+    order_dir: Literal["asc", "desc"] = "asc"
+
+
+class PaginatedTags(BaseModel):
+    items: list[TagSummary]
+    total: int
+    page: int
+    page_size: int
+
+
+class TagApply(BookSelection):
+    action: Literal["apply", "remove"] = "apply"
+
+
+class TagApplyResult(BaseModel):
+    tag_id: int
+    action: Literal["apply", "remove"]
+    book_ids: list[int]
@@ -1,9 +1,10 @@
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.models import Author
-from app.schemas.author import AuthorCreate, AuthorUpdate
+from app.invalidation import commit_catalog_changes
+from app.models import Author, Book
+from app.schemas.author import AuthorCreate, AuthorSearchParams, AuthorUpdate
+from app.services.book_service import BOOK_BRIEF_COLUMNS, book_order_clauses, page_book_briefs
 
 
 async def list_authors(db: AsyncSession):
@@ -11,16 +12,72 @@ async def list_authors(db: AsyncSession):
     return result.scalars().all()
 
 
-async def get_author(db: AsyncSession, author_id: int):
-    query = select(Author).options(selectinload(Author.books)).where(Author.id == author_id)
+async def search_authors(db: AsyncSession, params: AuthorSearchParams):
+    book_count_sq = (
+        select(Book.author_id, func.count().label("book_count")).group_by(Book.author_id).subquery()
+    )
+    book_count = func.coalesce(book_count_sq.c.book_count, 0)
+
+    query = select(Author.id, Author.name, Author.bio, book_count.label("book_count")).outerjoin(
+        book_count_sq, Author.id == book_count_sq.c.author_id
+    )
+
+    if params.name:
+        query = query.where(Author.name.ilike(f"%{params.name}%"))
+
+    if params.min_book_count is not None:
+        query = query.where(book_count >= params.min_book_count)
+
+    # Count total
+    count_query = select(func.count()).select_from(query.subquery())
+    total = (await db.execute(count_query)).scalar_one()
+
+    # Ordering, with id as a tiebreaker so pages are stable
+    order_col = book_count if params.order_by == "book_count" else Author.name
+    if params.order_dir == "desc":
+        query = query.order_by(order_col.desc(), Author.id.desc())
+    else:
+        query = query.order_by(order_col.asc(), Author.id.asc())
+
+    # Pagination
+    offset = (params.page - 1) * params.page_size
+    query = query.offset(offset).limit(params.page_size)
+
     result = await db.execute(query)
-    return result.scalar_one_or_none()
+    authors = [dict(row._mapping) for row in result.all()]
+    return authors, total
+
+
+async def get_author(
+    db: AsyncSession,
+    author_id: int,
+    page: int = 1,
+    page_size: int = 100,
+    order_by: str = "publication_date",
+    order_dir: str = "asc",
+):
+    """Get an author with one page of their books, ordered in the database."""
+    result = await db.execute(select(Author.id, Author.name, Author.bio).where(Author.id == author_id))
+    row = result.one_or_none()
+    if row is None:
+        return None
+
+    query = select(*BOOK_BRIEF_COLUMNS).join(Author, Book.author_id == Author.id).where(Book.author_id == author_id)
+    books, total = await page_book_briefs(db, query, book_order_clauses(order_by, order_dir), page, page_size)
+    return {
+        **row._mapping,
+        "book_count": total,
+        "books": books,
+        "books_page": page,
+        "books_page_size": page_size,
+    }
 
 
 async def create_author(db: AsyncSession, data: AuthorCreate):
     author = Author(**data.model_dump())
     db.add(author)
-    await db.commit()
+    await db.flush()
+    await commit_catalog_changes(db, authors=[author.id])
     await db.refresh(author)
     return author
 
@@ -31,7 +88,7 @@ async def update_author(db: AsyncSession, author_id: int, data: AuthorUpdate):
         return None
     for key, value in data.model_dump(exclude_unset=True).items():
         setattr(author, key, value)
-    await db.commit()
+    await commit_catalog_changes(db, authors=[author.id])
     await db.refresh(author)
     return author
 
@@ -1,22 +1,76 @@
-from sqlalchemy import func, or_, select
+from sqlalchemy import ARRAY, Integer, and_, any_, bindparam, cast, func, insert, or_, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, load_only, selectinload
 
+from app.cache import TTLCache, normalize_key, scope_versions
+from app.config import settings
+from app.dates import parse_publication_date
+from app.invalidation import commit_catalog_changes
 from app.models import (
     Author,
     Book,
     BookSeries,
+    CanonStatus,
     Character,
+    ReadingStatus,
+    Series,
     Tag,
     book_characters,
     book_tags,
 )
-from app.schemas.book import BookCreate, BookSearchParams, BookUpdate
+from app.schemas.book import BookCreate, BookDetailParams, BookFilterParams, BookSearchParams, BookUpdate
+
+
+# Sortable columns for search_books. Every sort gets Book.id as a tiebreaker so
+# pages are stable and line up with the (filter, sort, id) indexes on books.
+BOOK_SORT_COLUMNS = {
+    "title": Book.title,
+    "timeline_year": Book.timeline_year,
+    # Release order sorts on the parsed date, not the scraped text
+    "publication_date": Book.published_on,
+    "published_on": Book.published_on,
+    "page_count": Book.page_count,
+}
+
+
+def book_order_clauses(order_by: str, order_dir: str) -> list:
+    column = BOOK_SORT_COLUMNS.get(order_by)
+    if column is None:
+        raise ValueError(f"Unsupported order_by: {order_by}")
+    if order_dir == "desc":
+        return [column.desc(), Book.id.desc()]
+    return [column.asc(), Book.id.asc()]
+
+
+# Columns behind a BookBrief, for listings that project rows instead of
+# loading Book entities (and with them the cover bytea)
+BOOK_BRIEF_COLUMNS = (
+    Book.id,
+    Book.title,
+    Book.canon_or_legends,
+    Book.reading_status,
+    Book.owned,
+    Book.timeline_year,
+    Book.published_on,
+    Book.cover_url,
+    Author.name.label("author_name"),
+)
 
 
-async def search_books(db: AsyncSession, params: BookSearchParams):
-    query = select(Book).options(selectinload(Book.author))
+async def page_book_briefs(db: AsyncSession, query, order_clauses: list, page: int, page_size: int):
+    """Count and fetch one page of ``query``, a select over BOOK_BRIEF_COLUMNS.
+
+    Returns (rows as dicts, total).
+    """
+    count_query = select(func.count()).select_from(query.subquery())
+    total = (await db.execute(count_query)).scalar_one()
+
+    offset = (page - 1) * page_size
+    result = await db.execute(query.order_by(*order_clauses).offset(offset).limit(page_size))
+    return [dict(row._mapping) for row in result.all()], total
 
+
+def _apply_filters(query, params: BookFilterParams):
     if params.q:
         pattern = f"%{params.q}%"
         query = query.where(or_(Book.title.ilike(pattern), Book.description.ilike(pattern)))
@@ -30,23 +84,17 @@ async def search_books(db: AsyncSession, params: BookSearchParams):
     if params.owned is not None:
         query = query.where(Book.owned == params.owned)
 
+    # Relation filters are EXISTS semi-joins so the outer scan stays on books
+    # (and in index order) and a book matching several rows is counted once.
     if params.author_name:
-        query = query.join(Book.author).where(Author.name.ilike(f"%{params.author_name}%"))
+        query = query.where(Book.author.has(Author.name.ilike(f"%{params.author_name}%")))
 
     if params.character_name:
-        query = (
-            query.join(book_characters, Book.id == book_characters.c.book_id)
-            .join(Character, Character.id == book_characters.c.character_id)
-            .where(Character.name.ilike(f"%{params.character_name}%"))
-        )
+        query = query.where(Book.characters.any(Character.name.ilike(f"%{params.character_name}%")))
 
     if params.series_name:
-        from app.models import Series
-
-        query = (
-            query.join(BookSeries, Book.id == BookSeries.book_id)
-            .join(Series, Series.id == BookSeries.series_id)
-            .where(Series.name.ilike(f"%{params.series_name}%"))
+        query = query.where(
+            Book.series_links.any(BookSeries.series.has(Series.name.ilike(f"%{params.series_name}%")))
         )
 
     if params.timeline_year_min is not None:
@@ -55,22 +103,30 @@ async def search_books(db: AsyncSession, params: BookSearchParams):
     if params.timeline_year_max is not None:
         query = query.where(Book.timeline_year <= params.timeline_year_max)
 
+    if params.published_min is not None:
+        query = query.where(Book.published_on >= params.published_min)
+
+    if params.published_max is not None:
+        query = query.where(Book.published_on <= params.published_max)
+
+    return query
+
+
+async def search_books(db: AsyncSession, params: BookSearchParams):
+    query = _apply_filters(select(Book).options(selectinload(Book.author)), params)
+
     # Count total
     count_query = select(func.count()).select_from(query.subquery())
     total = (await db.execute(count_query)).scalar_one()
 
-    # Ordering
-    order_col = getattr(Book, params.order_by, Book.title)
-    if params.order_dir == "desc":
-        order_col = order_col.desc()
-    query = query.order_by(order_col)
+    query = query.order_by(*book_order_clauses(params.order_by, params.order_dir))
 
     # Pagination
     offset = (params.page - 1) * params.page_size
     query = query.offset(offset).limit(params.page_size)
 
     result = await db.execute(query)
-    books = result.scalars().unique().all()
+    books = result.scalars().all()
 
     # If filtering by character name, fetch matched character names per book
     matched_characters: dict[int, list[str]] = {}
@@ -91,45 +147,150 @@ async def search_books(db: AsyncSession, params: BookSearchParams):
     return books, total, matched_characters
 
 
-async def get_book(db: AsyncSession, book_id: int):
-    query = (
-        select(Book)
-        .options(
-            selectinload(Book.author),
-            selectinload(Book.series_links).selectinload(BookSeries.series),
-            selectinload(Book.characters),
-            selectinload(Book.tags),
-        )
-        .where(Book.id == book_id)
-    )
+_facets_cache = TTLCache("facets", ttl=settings.FACETS_CACHE_TTL)
+
+# grouping() bitmask over (canon, reading_status, owned, decade) identifying
+# which grouping set a row belongs to; a set bit means "not grouped by".
+_FACET_CANON = 0b0111
+_FACET_READING = 0b1011
+_FACET_OWNED = 0b1101
+_FACET_DECADE = 0b1110
+_FACET_TOTAL = 0b1111
+
+
+async def get_book_facets(db: AsyncSession, params: BookFilterParams) -> dict:
+    """Count books per facet for a filter set in a single GROUPING SETS query."""
+    cache_key = (scope_versions("books", "authors", "characters", "series"), normalize_key(params.model_dump()))
+    cached = _facets_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    filtered = _apply_filters(
+        select(
+            Book.canon_or_legends,
+            Book.reading_status,
+            Book.owned,
+            cast(func.floor(Book.timeline_year / 10.0) * 10, Integer).label("decade"),
+        ),
+        params,
+    ).subquery()
+    columns = [filtered.c.canon_or_legends, filtered.c.reading_status, filtered.c.owned, filtered.c.decade]
+    query = select(
+        func.grouping(*columns).label("grouping"),
+        *columns,
+        func.count().label("count"),
+    ).group_by(func.grouping_sets(*(tuple_(c) for c in columns), tuple_()))
+
+    facets = {
+        "total": 0,
+        "canon_status": {status: 0 for status in CanonStatus},
+        "reading_status": {status: 0 for status in ReadingStatus},
+        "owned": {True: 0, False: 0},
+        "timeline_decade": [],
+    }
+    for row in (await db.execute(query)).all():
+        if row.grouping == _FACET_CANON:
+            facets["canon_status"][row.canon_or_legends] = row.count
+        elif row.grouping == _FACET_READING:
+            facets["reading_status"][row.reading_status] = row.count
+        elif row.grouping == _FACET_OWNED:
+            facets["owned"][row.owned] = row.count
+        elif row.grouping == _FACET_DECADE:
+            facets["timeline_decade"].append({"decade": row.decade, "count": row.count})
+        elif row.grouping == _FACET_TOTAL:
+            facets["total"] = row.count
+    # Undated books (decade NULL) sort last
+    facets["timeline_decade"].sort(key=lambda f: (f["decade"] is None, f["decade"] or 0))
+
+    _facets_cache.set(cache_key, facets)
+    return facets
+
+
+def _book_detail_options(params: BookDetailParams) -> list:
+    # Only the requested columns are read; the cover bytea never is
+    columns = {Book.id} | {getattr(Book, name) for name in params.fields if name in Book.__mapper__.columns}
+    options = [load_only(*columns)]
+    if "author_name" in params.fields:
+        options.append(joinedload(Book.author).load_only(Author.name))
+    if "series" in params.include:
+        options.append(selectinload(Book.series_links).selectinload(BookSeries.series).load_only(Series.name))
+    if "characters" in params.include:
+        options.append(selectinload(Book.characters).load_only(Character.name))
+    if "tags" in params.include:
+        options.append(selectinload(Book.tags))
+    return options
+
+
+async def get_book(db: AsyncSession, book_id: int, params: BookDetailParams | None = None):
+    query = select(Book).options(*_book_detail_options(params or BookDetailParams())).where(Book.id == book_id)
     result = await db.execute(query)
     return result.scalar_one_or_none()
 
 
-async def create_book(db: AsyncSession, data: BookCreate):
-    book_data = data.model_dump(exclude={"series_ids", "character_ids", "tag_ids"})
-    book = Book(**book_data)
-    db.add(book)
-    await db.flush()
+async def get_books(db: AsyncSession, book_ids: list[int], params: BookDetailParams | None = None) -> dict:
+    """Load many books at once, keyed by id.
 
-    await _sync_relations(db, book, data)
-    await db.commit()
-    await db.refresh(book)
-    return await get_book(db, book.id)
+    The options are the same as get_book's, so the relation loads are one
+    shared IN query each whatever the number of books.
+    """
+    query = select(Book).options(*_book_detail_options(params or BookDetailParams())).where(Book.id.in_(book_ids))
+    result = await db.execute(query)
+    return {book.id: book for book in result.unique().scalars().all()}
 
 
-async def update_book(db: AsyncSession, book_id: int, data: BookUpdate):
-    book = await get_book(db, book_id)
-    if not book:
+async def get_book_characters(
+    db: AsyncSession, book_id: int, name: str | None = None, page: int = 1, page_size: int = 50
+):
+    """A page of a book's characters with their appearance tags, or None if the book is missing."""
+    if (await db.execute(select(Book.id).where(Book.id == book_id))).scalar_one_or_none() is None:
         return None
 
+    query = (
+        select(Character.id, Character.name, book_characters.c.appearance_tag)
+        .join(book_characters, Character.id == book_characters.c.character_id)
+        .where(book_characters.c.book_id == book_id)
+    )
+    if name:
+        query = query.where(Character.name.ilike(f"%{name}%"))
+
+    count_query = select(func.count()).select_from(query.subquery())
+    total = (await db.execute(count_query)).scalar_one()
+
+    offset = (page - 1) * page_size
+    query = query.order_by(Character.name, Character.id).offset(offset).limit(page_size)
+    result = await db.execute(query)
+    items = [{"id": row.id, "name": row.name, "appearance_tag": row.appearance_tag} for row in result.all()]
+    return items, total
+
+
+async def create_book(db: AsyncSession, data: BookCreate) -> int:
+    """Insert a book and its links; returns the new id. Callers load what they need to echo."""
+    book_data = data.model_dump(exclude={"series_ids", "character_ids", "tag_ids"})
+    stmt = insert(Book).values(**book_data, published_on=parse_publication_date(data.publication_date))
+    book_id = (await db.execute(stmt.returning(Book.id))).scalar_one()
+
+    await _sync_relations(db, book_id, data)
+    await commit_catalog_changes(db, books=[book_id])
+    return book_id
+
+
+async def update_book(db: AsyncSession, book_id: int, data: BookUpdate) -> int | None:
+    """Update a book's columns and links; returns its id, or None if it does not exist."""
     update_data = data.model_dump(exclude_unset=True, exclude={"series_ids", "character_ids", "tag_ids"})
-    for key, value in update_data.items():
-        setattr(book, key, value)
+    if "publication_date" in update_data:
+        update_data["published_on"] = parse_publication_date(update_data["publication_date"])
+
+    if update_data:
+        stmt = update(Book).where(Book.id == book_id).values(**update_data).returning(Book.id)
+        found = (await db.execute(stmt.execution_options(synchronize_session=False))).scalar_one_or_none()
+    else:
+        found = (await db.execute(select(Book.id).where(Book.id == book_id))).scalar_one_or_none()
+    if found is None:
+        return None
 
-    await _sync_relations(db, book, data)
-    await db.commit()
-    return await get_book(db, book.id)
+    await _sync_relations(db, book_id, data)
+    await commit_catalog_changes(db, books=[book_id])
+    return book_id
 
 
 async def delete_book(db: AsyncSession, book_id: int):
@@ -137,28 +298,128 @@ async def delete_book(db: AsyncSession, book_id: int):
     if not book:
         return False
     await db.delete(book)
-    await db.commit()
+    await commit_catalog_changes(db, books=[book_id])
     return True
 
 
-async def _sync_relations(db: AsyncSession, book: Book, data):
+def _select_books(query, book_ids: list[int] | None = None, filters: BookFilterParams | None = None):
+    """Restrict ``query`` to explicit book ids or to a search filter set."""
+    if book_ids is not None:
+        # One array parameter keeps the statement shape the same for any number of ids
+        return query.where(Book.id == any_(bindparam("book_ids", book_ids, type_=ARRAY(Integer))))
+    return _apply_filters(query, filters)
+
+
+def select_book_ids(book_ids: list[int] | None = None, filters: BookFilterParams | None = None):
+    return _select_books(select(Book.id), book_ids, filters)
+
+
+async def update_books_status(
+    db: AsyncSession,
+    values: dict,
+    book_ids: list[int] | None = None,
+    filters: BookFilterParams | None = None,
+) -> list[int]:
+    """Apply ``values`` to the given books, or to all books matching
+    ``filters``, in one UPDATE. Returns the ids that were updated."""
+    stmt = update(Book).values(**values).returning(Book.id).execution_options(synchronize_session=False)
+    stmt = _select_books(stmt, book_ids, filters)
+    updated_ids = list((await db.execute(stmt)).scalars().all())
+    # Nothing matched: leave the caches alone
+    if updated_ids:
+        await commit_catalog_changes(db, books=updated_ids)
+    return updated_ids
+
+
+async def get_book_briefs(db: AsyncSession, book_ids: list[int]):
+    query = (
+        select(Book)
+        .options(
+            load_only(
+                Book.id,
+                Book.title,
+                Book.canon_or_legends,
+                Book.reading_status,
+                Book.owned,
+                Book.timeline_year,
+                Book.published_on,
+                Book.cover_url,
+            ),
+            joinedload(Book.author).load_only(Author.name),
+        )
+        .where(Book.id == any_(bindparam("book_ids", book_ids, type_=ARRAY(Integer))))
+        .order_by(Book.title, Book.id)
+    )
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
+async def _sync_links(db: AsyncSession, table, column: str, book_id: int, wanted: list[int]) -> None:
+    """Make ``table``'s links for a book match ``wanted``, touching only the difference.
+
+    Kept links keep their extra columns (e.g. appearance tags).
+    """
+    target = table.c[column]
+    result = await db.execute(select(target).where(table.c.book_id == book_id))
+    existing = set(result.scalars().all())
+    wanted = list(dict.fromkeys(wanted))
+
+    removed = existing.difference(wanted)
+    if removed:
+        await db.execute(
+            table.delete().where(
+                table.c.book_id == book_id,
+                target == any_(bindparam("removed", list(removed), type_=ARRAY(Integer))),
+            )
+        )
+    added = [{"book_id": book_id, column: link_id} for link_id in wanted if link_id not in existing]
+    if added:
+        await db.execute(table.insert(), added)
+
+
+async def _sync_relations(db: AsyncSession, book_id: int, data) -> None:
     if data.series_ids is not None:
-        # Clear existing
-        existing = await db.execute(
-            select(BookSeries).where(BookSeries.book_id == book.id)
+        result = await db.execute(
+            select(BookSeries.series_id, BookSeries.order_in_series).where(BookSeries.book_id == book_id)
         )
-        for bs in existing.scalars().all():
-            await db.delete(bs)
-        await db.flush()
-        for s in data.series_ids:
-            db.add(BookSeries(book_id=book.id, series_id=s["series_id"], order_in_series=s.get("order_in_series")))
+        existing = dict(result.all())
+        wanted = {s["series_id"]: s.get("order_in_series") for s in data.series_ids}
+
+        removed = existing.keys() - wanted.keys()
+        if removed:
+            await db.execute(
+                BookSeries.__table__.delete().where(
+                    BookSeries.book_id == book_id,
+                    BookSeries.series_id == any_(bindparam("removed", list(removed), type_=ARRAY(Integer))),
+                )
+            )
+        changed = [
+            {"b_book_id": book_id, "b_series_id": series_id, "order_in_series": order}
+            for series_id, order in wanted.items()
+            if series_id in existing and existing[series_id] != order
+        ]
+        if changed:
+            await db.execute(
+                BookSeries.__table__.update()
+                .where(
+                    and_(
+                        BookSeries.book_id == bindparam("b_book_id"),
+                        BookSeries.series_id == bindparam("b_series_id"),
+                    )
+                )
+                .values(order_in_series=bindparam("order_in_series")),
+                changed,
+            )
+        added = [
+            {"book_id": book_id, "series_id": series_id, "order_in_series": order}
+            for series_id, order in wanted.items()
+            if series_id not in existing
+        ]
+        if added:
+            await db.execute(BookSeries.__table__.insert(), added)
 
     if data.character_ids is not None:
-        await db.execute(book_characters.delete().where(book_characters.c.book_id == book.id))
-        for cid in data.character_ids:
-            await db.execute(book_characters.insert().values(book_id=book.id, character_id=cid))
+        await _sync_links(db, book_characters, "character_id", book_id, data.character_ids)
 
     if data.tag_ids is not None:
-        await db.execute(book_tags.delete().where(book_tags.c.book_id == book.id))
-        for tid in data.tag_ids:
-            await db.execute(book_tags.insert().values(book_id=book.id, tag_id=tid))
+        await _sync_links(db, book_tags, "tag_id", book_id, data.tag_ids)
@@ -2,6 +2,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.invalidation import commit_catalog_changes
 from app.models import Author, Book, Character, book_characters
 from app.schemas.character import CharacterDetailParams, CharacterSearchParams
 
@@ -62,116 +63,144 @@ async def search_characters(db: AsyncSession, params: CharacterSearchParams):
     return characters, total
 
 
-async def get_character_detail(
-    db: AsyncSession, character_id: int, params: CharacterDetailParams | None = None
-):
-    """Get character with filtered, paginated books and appearance tags."""
-    if params is None:
-        params = CharacterDetailParams()
-
-    result = await db.execute(
-        select(Character).where(Character.id == character_id)
-    )
-    character = result.scalar_one_or_none()
-    if not character:
-        return None
-
-    # First appearance — always unfiltered so it stays stable
-    first_app_query = (
-        select(
-            Book.id,
-            Book.title,
-            Book.canon_or_legends,
-            Book.reading_status,
-            Book.owned,
-            Book.timeline_year,
-            Book.cover_url,
-            Author.name.label("author_name"),
-            book_characters.c.appearance_tag,
-        )
+# Book columns shown for each appearance of a character
+_APPEARANCE_COLUMNS = (
+    Book.id,
+    Book.title,
+    Book.canon_or_legends,
+    Book.reading_status,
+    Book.owned,
+    Book.timeline_year,
+    Book.cover_url,
+    Author.name.label("author_name"),
+    book_characters.c.appearance_tag,
+)
+
+
+def _appearances(*columns, character_ids):
+    return (
+        select(*columns)
+        .select_from(Book)
         .join(book_characters, Book.id == book_characters.c.book_id)
         .outerjoin(Author, Book.author_id == Author.id)
-        .where(book_characters.c.character_id == character_id)
-        .order_by(Book.timeline_year.asc().nulls_last())
+        .where(book_characters.c.character_id.in_(character_ids))
     )
-    first_app_result = await db.execute(first_app_query)
-    all_books_unfiltered = first_app_result.all()
 
-    first_appearance = None
-    for b in all_books_unfiltered:
-        if b.appearance_tag and "first appearance" in b.appearance_tag.lower():
-            first_appearance = _book_row_to_dict(b)
-            break
-    if not first_appearance and all_books_unfiltered:
-        first_appearance = _book_row_to_dict(all_books_unfiltered[0])
-
-    total_book_count = len(all_books_unfiltered)
-
-    # Filtered books query
-    books_query = (
-        select(
-            Book.id,
-            Book.title,
-            Book.canon_or_legends,
-            Book.reading_status,
-            Book.owned,
-            Book.timeline_year,
-            Book.cover_url,
-            Author.name.label("author_name"),
-            book_characters.c.appearance_tag,
-        )
-        .join(book_characters, Book.id == book_characters.c.book_id)
-        .outerjoin(Author, Book.author_id == Author.id)
-        .where(book_characters.c.character_id == character_id)
-    )
 
+def _detail_filters(params: CharacterDetailParams) -> list:
+    clauses = []
     if params.canon_status:
-        books_query = books_query.where(Book.canon_or_legends == params.canon_status)
-
+        clauses.append(Book.canon_or_legends == params.canon_status)
     if params.reading_status:
-        books_query = books_query.where(Book.reading_status == params.reading_status)
-
+        clauses.append(Book.reading_status == params.reading_status)
     if params.timeline_year_min is not None:
-        books_query = books_query.where(Book.timeline_year >= params.timeline_year_min)
-
+        clauses.append(Book.timeline_year >= params.timeline_year_min)
     if params.timeline_year_max is not None:
-        books_query = books_query.where(Book.timeline_year <= params.timeline_year_max)
+        clauses.append(Book.timeline_year <= params.timeline_year_max)
+    return clauses
+
 
-    # Count filtered total
-    count_query = select(func.count()).select_from(books_query.subquery())
-    books_total = (await db.execute(count_query)).scalar_one()
+async def get_character_details(
+    db: AsyncSession, character_ids: list[int], params: CharacterDetailParams | None = None
+) -> dict[int, dict]:
+    """Get many characters with filtered, paginated books, keyed by id.
+
+    The query count does not grow with the number of characters: each
+    character's page of books is cut with a per-character row_number().
+    """
+    if params is None:
+        params = CharacterDetailParams()
+
+    result = await db.execute(
+        select(Character.id, Character.name, Character.description).where(Character.id.in_(character_ids))
+    )
+    details = {
+        row.id: {
+            "id": row.id,
+            "name": row.name,
+            "description": row.description,
+            "book_count": 0,
+            "first_appearance": None,
+            "books": [],
+            "books_total": 0,
+            "books_page": params.page,
+            "books_page_size": params.page_size,
+        }
+        for row in result.all()
+    }
+    if not details:
+        return details
+    found_ids = list(details)
+    character_id = book_characters.c.character_id
+
+    # First appearance — always unfiltered so it stays stable. A book tagged
+    # as the first appearance wins, otherwise the earliest on the timeline.
+    tagged_first = func.coalesce(book_characters.c.appearance_tag.ilike("%first appearance%"), False)
+    first_sq = _appearances(
+        character_id,
+        *_APPEARANCE_COLUMNS,
+        func.count().over(partition_by=character_id).label("book_count"),
+        func.row_number()
+        .over(partition_by=character_id, order_by=(tagged_first.desc(), Book.timeline_year.asc().nulls_last()))
+        .label("rn"),
+        character_ids=found_ids,
+    ).subquery()
+    first_result = await db.execute(select(first_sq).where(first_sq.c.rn == 1))
+    for row in first_result.all():
+        details[row.character_id]["book_count"] = row.book_count
+        details[row.character_id]["first_appearance"] = _book_row_to_dict(row)
+
+    filters = _detail_filters(params)
+
+    # Count filtered totals
+    count_query = (
+        _appearances(character_id, func.count(), character_ids=found_ids).where(*filters).group_by(character_id)
+    )
+    for cid, books_total in (await db.execute(count_query)).all():
+        details[cid]["books_total"] = books_total
 
     # Ordering
     if params.order_by == "title":
         order_col = Book.title
     elif params.order_by == "publication_date":
-        order_col = Book.publication_date
+        order_col = Book.published_on
     else:
         order_col = Book.timeline_year
 
     if params.order_dir == "desc":
-        books_query = books_query.order_by(order_col.desc().nulls_last())
+        order = (order_col.desc().nulls_last(), Book.id.desc())
     else:
-        books_query = books_query.order_by(order_col.asc().nulls_last())
-
-    # Pagination
+        order = (order_col.asc().nulls_last(), Book.id.asc())
+
+    # Pagination, per character
+    books_sq = (
+        _appearances(
+            character_id,
+            *_APPEARANCE_COLUMNS,
+            func.row_number().over(partition_by=character_id, order_by=order).label("rn"),
+            character_ids=found_ids,
+        )
+        .where(*filters)
+        .subquery()
+    )
     offset = (params.page - 1) * params.page_size
-    books_query = books_query.offset(offset).limit(params.page_size)
+    books_query = (
+        select(books_sq)
+        .where(books_sq.c.rn > offset, books_sq.c.rn <= offset + params.page_size)
+        .order_by(books_sq.c.character_id, books_sq.c.rn)
+    )
+    for row in (await db.execute(books_query)).all():
+        details[row.character_id]["books"].append(_book_row_to_dict(row))
 
-    books_result = await db.execute(books_query)
-    books = [_book_row_to_dict(row) for row in books_result.all()]
+    return details
 
-    return {
-        "id": character.id,
-        "name": character.name,
-        "description": character.description,
-        "book_count": total_book_count,
-        "first_appearance": first_appearance,
-        "books": books,
-        "books_total": books_total,
-        "books_page": params.page,
-        "books_page_size": params.page_size,
-    }
+
+async def get_character_detail(
+    db: AsyncSession, character_id: int, params: CharacterDetailParams | None = None
+):
+    """Get character with filtered, paginated books and appearance tags."""
+    details = await get_character_details(db, [character_id], params)
+    return details.get(character_id)
 
 
 def _book_row_to_dict(row):
@@ -206,7 +235,8 @@ async def get_character(db: AsyncSession, character_id: int):
 async def create_character(db: AsyncSession, name: str, description: str | None = None):
     char = Character(name=name, description=description)
     db.add(char)
-    await db.commit()
+    await db.flush()
+    await commit_catalog_changes(db, characters=[char.id])
     await db.refresh(char)
     return char
 
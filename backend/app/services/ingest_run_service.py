@@ -0,0 +1,148 @@
+import heapq
+import logging
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+
+from app.models import IngestRun
+
+logger = logging.getLogger(__name__)
+
+SLOWEST_KEPT = 10
+ERRORS_KEPT = 100
+
+
+class IngestRunLedger:
+    """Collects what one ingest request did, for a row in ``ingest_runs``.
+
+    ORM rows are counted from the session's flushes; Core statements are
+    counted by the caller. Counts for an item stay pending until ``keep()``
+    so a book rolled back to its savepoint does not inflate the totals.
+    Within an item each ORM row counts once, however often it is flushed:
+    inserted then updated is an insert, and inserted then deleted is nothing.
+    """
+
+    def __init__(self, kind: str, items: int):
+        self.kind = kind
+        self.items = items
+        self.started_at = datetime.now(timezone.utc)
+        self.started = time.perf_counter()
+        self.phases: defaultdict[str, float] = defaultdict(float)
+        self.rows: defaultdict[str, Counter] = defaultdict(Counter)
+        self.error_details: list[dict] = []
+        self._pending: defaultdict[str, Counter] = defaultdict(Counter)
+        # (table, primary key) -> operation, for ORM rows flushed in this item
+        self._pending_rows: dict[tuple[str, tuple], str] = {}
+        self._slowest: list[tuple[float, str]] = []
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] += time.perf_counter() - start
+
+    @contextmanager
+    def tracking(self, db: AsyncSession):
+        event.listen(db.sync_session, "after_flush", self._on_flush)
+        try:
+            yield
+        finally:
+            event.remove(db.sync_session, "after_flush", self._on_flush)
+
+    def _on_flush(self, session, flush_context) -> None:
+        for obj in session.new:
+            self._row(obj, "inserted")
+        for obj in session.dirty:
+            if session.is_modified(obj, include_collections=False):
+                self._row(obj, "updated")
+        for obj in session.deleted:
+            self._row(obj, "deleted")
+
+    def _row(self, obj, operation: str) -> None:
+        state = inspect(obj)
+        key = (type(obj).__tablename__, tuple(state.mapper.primary_key_from_instance(obj)))
+        previous = self._pending_rows.get(key)
+        if previous == "inserted" and operation == "updated":
+            return
+        if previous == "inserted" and operation == "deleted":
+            del self._pending_rows[key]
+            return
+        self._pending_rows[key] = operation
+
+    def count(self, table: str, operation: str, n: int = 1) -> None:
+        self._pending[table][operation] += n
+
+    def keep(self) -> None:
+        for table, counts in self._pending.items():
+            self.rows[table].update(counts)
+        for (table, _), operation in self._pending_rows.items():
+            self.rows[table][operation] += 1
+        self._pending.clear()
+        self._pending_rows.clear()
+
+    def discard(self) -> None:
+        self._pending.clear()
+        self._pending_rows.clear()
+
+    def item_done(self, name: str, elapsed: float) -> None:
+        entry = (elapsed, name)
+        if len(self._slowest) < SLOWEST_KEPT:
+            heapq.heappush(self._slowest, entry)
+        elif entry > self._slowest[0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def error(self, name: str | None, exc: Exception) -> None:
+        if len(self.error_details) < ERRORS_KEPT:
+            self.error_details.append({"name": name, "error": f"{type(exc).__name__}: {exc}"[:500]})
+
+    def to_run(self, status: str, result: dict) -> IngestRun:
+        return IngestRun(
+            kind=self.kind,
+            status=status,
+            started_at=self.started_at,
+            finished_at=datetime.now(timezone.utc),
+            duration_ms=(time.perf_counter() - self.started) * 1000,
+            items=self.items,
+            created=result["created"],
+            updated=result["updated"],
+            errors=result["errors"],
+            phases={name: round(seconds * 1000, 3) for name, seconds in self.phases.items()},
+            row_counts={table: dict(counts) for table, counts in self.rows.items()},
+            slowest=[{"name": name, "ms": round(elapsed * 1000, 3)} for elapsed, name in sorted(self._slowest, reverse=True)],
+            error_details=self.error_details,
+        )
+
+
+async def record_run(db: AsyncSession, ledger: IngestRunLedger, status: str, result: dict) -> int | None:
+    """Store the run; a failure here is logged and never fails the ingest itself."""
+    try:
+        run = ledger.to_run(status, result)
+        db.add(run)
+        await db.commit()
+        return run.id
+    except Exception:
+        logger.exception(f"Could not record {ledger.kind} ingest run")
+        await db.rollback()
+        return None
+
+
+async def list_ingest_runs(db: AsyncSession, kind: str | None = None, page: int = 1, page_size: int = 20):
+    # The listing leaves out the per-item details
+    query = select(IngestRun).options(defer(IngestRun.slowest), defer(IngestRun.error_details))
+    if kind:
+        query = query.where(IngestRun.kind == kind)
+    total = (await db.execute(select(func.count()).select_from(query.subquery()))).scalar_one()
+    query = query.order_by(IngestRun.started_at.desc(), IngestRun.id.desc())
+    result = await db.execute(query.offset((page - 1) * page_size).limit(page_size))
+    return result.scalars().all(), total
+
+
+async def get_ingest_run(db: AsyncSession, run_id: int) -> IngestRun | None:
+    return await db.get(IngestRun, run_id)
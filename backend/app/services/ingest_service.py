@@ -1,130 +1,196 @@
 import base64
 import logging
+import time
 
+from opentelemetry import trace
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.dates import parse_publication_date
+from app.invalidation import commit_catalog_changes
+from app.metrics import record_ingest
 from app.models import Book, Character, book_characters
 from app.models.book import CanonStatus
 from app.services.author_service import get_or_create_author
 from app.services.character_service import get_or_create_character
+from app.services.ingest_run_service import IngestRunLedger, record_run
 from app.schemas.ingest import IngestBook, IngestCharacter
 
 logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+
+async def _ingest_book(db: AsyncSession, book_data: IngestBook, ledger: IngestRunLedger) -> tuple[Book, bool]:
+    """Upsert one book inside the caller's savepoint; returns it and whether it existed."""
+    with ledger.phase("lookup"):
+        # Find existing by title
+        result = await db.execute(
+            select(Book).where(Book.title == book_data.title)
+        )
+        existing = result.scalar_one_or_none()
+
+        author = None
+        if book_data.author:
+            author = await get_or_create_author(db, book_data.author)
+
+    canon = CanonStatus(book_data.canon_or_legends) if book_data.canon_or_legends else CanonStatus.canon
+
+    with ledger.phase("upsert"):
+        if existing:
+            existing.description = book_data.description or existing.description
+            existing.isbn = book_data.isbn or existing.isbn
+            existing.page_count = book_data.page_count or existing.page_count
+            existing.publication_date = book_data.publication_date or existing.publication_date
+            existing.published_on = parse_publication_date(existing.publication_date)
+            existing.wookieepedia_url = book_data.url or existing.wookieepedia_url
+            existing.cover_url = book_data.cover_url or existing.cover_url
+            existing.canon_or_legends = canon
+            existing.timeline_year = book_data.timeline_year or existing.timeline_year
+            existing.timeline_year_start = book_data.timeline_year_start or existing.timeline_year_start
+            existing.timeline_year_end = book_data.timeline_year_end or existing.timeline_year_end
+            if author:
+                existing.author_id = author.id
+            book = existing
+        else:
+            book = Book(
+                title=book_data.title,
+                description=book_data.description,
+                isbn=book_data.isbn,
+                page_count=book_data.page_count,
+                publication_date=book_data.publication_date,
+                published_on=parse_publication_date(book_data.publication_date),
+                wookieepedia_url=book_data.url,
+                cover_url=book_data.cover_url,
+                canon_or_legends=canon,
+                timeline_year=book_data.timeline_year,
+                timeline_year_start=book_data.timeline_year_start,
+                timeline_year_end=book_data.timeline_year_end,
+                author_id=author.id if author else None,
+            )
+            db.add(book)
+
+        await db.flush()
+
+    # Store cover image if provided as base64
+    if book_data.cover_image_b64:
+        with ledger.phase("cover_decode"):
+            book.cover_image = base64.b64decode(book_data.cover_image_b64)
+            book.cover_image_content_type = book_data.cover_image_content_type or "image/jpeg"
+            book.cover_url = f"/api/v1/books/{book.id}/cover"
+
+    # Link characters with appearance tags (deduplicate by name)
+    if book_data.characters:
+        with ledger.phase("appearances"):
+            deleted = await db.execute(
+                book_characters.delete().where(book_characters.c.book_id == book.id)
+            )
+            ledger.count("book_characters", "deleted", deleted.rowcount)
+            seen_char_ids: set[int] = set()
+            for char_entry in book_data.characters:
+                char_name = char_entry.name.removesuffix("/Legends")
+                char = await get_or_create_character(db, char_name)
+                if char.id in seen_char_ids:
+                    continue
+                seen_char_ids.add(char.id)
+                tag_str = ", ".join(char_entry.tags) if char_entry.tags else None
+                await db.execute(
+                    book_characters.insert().values(
+                        book_id=book.id,
+                        character_id=char.id,
+                        appearance_tag=tag_str,
+                    )
+                )
+                ledger.count("book_characters", "inserted")
+
+    return book, existing is not None
 
 
 async def ingest_books(db: AsyncSession, books: list[IngestBook]):
+    ledger = IngestRunLedger("books", len(books))
     created = 0
     updated = 0
     errors = 0
+    changed_ids: list[int] = []
 
-    for book_data in books:
+    with ledger.tracking(db):
         try:
-            async with db.begin_nested():
-                # Find existing by title
-                result = await db.execute(
-                    select(Book).where(Book.title == book_data.title)
-                )
-                existing = result.scalar_one_or_none()
-
-                author = None
-                if book_data.author:
-                    author = await get_or_create_author(db, book_data.author)
-
-                canon = CanonStatus(book_data.canon_or_legends) if book_data.canon_or_legends else CanonStatus.canon
-
-                if existing:
-                    existing.description = book_data.description or existing.description
-                    existing.isbn = book_data.isbn or existing.isbn
-                    existing.page_count = book_data.page_count or existing.page_count
-                    existing.publication_date = book_data.publication_date or existing.publication_date
-                    existing.wookieepedia_url = book_data.url or existing.wookieepedia_url
-                    existing.cover_url = book_data.cover_url or existing.cover_url
-                    existing.canon_or_legends = canon
-                    existing.timeline_year = book_data.timeline_year or existing.timeline_year
-                    existing.timeline_year_start = book_data.timeline_year_start or existing.timeline_year_start
-                    existing.timeline_year_end = book_data.timeline_year_end or existing.timeline_year_end
-                    if author:
-                        existing.author_id = author.id
-                    book = existing
-                    updated += 1
-                else:
-                    book = Book(
-                        title=book_data.title,
-                        description=book_data.description,
-                        isbn=book_data.isbn,
-                        page_count=book_data.page_count,
-                        publication_date=book_data.publication_date,
-                        wookieepedia_url=book_data.url,
-                        cover_url=book_data.cover_url,
-                        canon_or_legends=canon,
-                        timeline_year=book_data.timeline_year,
-                        timeline_year_start=book_data.timeline_year_start,
-                        timeline_year_end=book_data.timeline_year_end,
-                        author_id=author.id if author else None,
-                    )
-                    db.add(book)
-                    created += 1
-
-                await db.flush()
-
-                # Store cover image if provided as base64
-                if book_data.cover_image_b64:
-                    book.cover_image = base64.b64decode(book_data.cover_image_b64)
-                    book.cover_image_content_type = book_data.cover_image_content_type or "image/jpeg"
-                    book.cover_url = f"/api/v1/books/{book.id}/cover"
-
-                # Link characters with appearance tags (deduplicate by name)
-                if book_data.characters:
-                    await db.execute(
-                        book_characters.delete().where(book_characters.c.book_id == book.id)
-                    )
-                    seen_char_ids: set[int] = set()
-                    for char_entry in book_data.characters:
-                        char_name = char_entry.name.removesuffix("/Legends")
-                        char = await get_or_create_character(db, char_name)
-                        if char.id in seen_char_ids:
-                            continue
-                        seen_char_ids.add(char.id)
-                        tag_str = ", ".join(char_entry.tags) if char_entry.tags else None
-                        await db.execute(
-                            book_characters.insert().values(
-                                book_id=book.id,
-                                character_id=char.id,
-                                appearance_tag=tag_str,
-                            )
-                        )
-
-        except Exception:
-            logger.exception(f"Error ingesting book: {book_data.title}")
-            errors += 1
-
-    await db.commit()
-    return {"created": created, "updated": updated, "errors": errors}
+            for book_data in books:
+                book_started = time.perf_counter()
+                with tracer.start_as_current_span("ingest_book", attributes={"book.title": book_data.title}) as span:
+                    try:
+                        async with db.begin_nested():
+                            book, existed = await _ingest_book(db, book_data, ledger)
+                    except Exception as exc:
+                        logger.exception(f"Error ingesting book: {book_data.title}")
+                        errors += 1
+                        ledger.discard()
+                        ledger.error(book_data.title, exc)
+                        span.set_attribute("ingest.outcome", "error")
+                    else:
+                        ledger.keep()
+                        changed_ids.append(book.id)
+                        if existed:
+                            updated += 1
+                        else:
+                            created += 1
+                        span.set_attribute("ingest.outcome", "updated" if existed else "created")
+                ledger.item_done(book_data.title, time.perf_counter() - book_started)
+
+            with ledger.phase("commit"):
+                await commit_catalog_changes(db, books=changed_ids, authors=None, characters=None)
+            ledger.keep()
+        except Exception as exc:
+            await db.rollback()
+            ledger.error(None, exc)
+            await record_run(db, ledger, "failed", {"created": created, "updated": updated, "errors": errors})
+            raise
+
+    result = {"created": created, "updated": updated, "errors": errors}
+    result["run_id"] = await record_run(db, ledger, "completed", result)
+    record_ingest("books", result, ledger.started)
+    return result
 
 
 async def ingest_characters(db: AsyncSession, characters: list[IngestCharacter]):
+    ledger = IngestRunLedger("characters", len(characters))
     created = 0
     updated = 0
     errors = 0
 
-    for char_data in characters:
+    with ledger.tracking(db):
         try:
-            result = await db.execute(
-                select(Character).where(Character.name == char_data.name)
-            )
-            existing = result.scalar_one_or_none()
-
-            if existing:
-                if char_data.description:
-                    existing.description = char_data.description
-                updated += 1
-            else:
-                db.add(Character(name=char_data.name, description=char_data.description))
-                created += 1
-        except Exception:
-            logger.exception(f"Error ingesting character: {char_data.name}")
-            errors += 1
-
-    await db.commit()
-    return {"created": created, "updated": updated, "errors": errors}
+            for char_data in characters:
+                try:
+                    with ledger.phase("lookup"):
+                        result = await db.execute(
+                            select(Character).where(Character.name == char_data.name)
+                        )
+                        existing = result.scalar_one_or_none()
+
+                    with ledger.phase("upsert"):
+                        if existing:
+                            if char_data.description:
+                                existing.description = char_data.description
+                            updated += 1
+                        else:
+                            db.add(Character(name=char_data.name, description=char_data.description))
+                            created += 1
+                except Exception as exc:
+                    logger.exception(f"Error ingesting character: {char_data.name}")
+                    errors += 1
+                    ledger.error(char_data.name, exc)
+
+            with ledger.phase("commit"):
+                await commit_catalog_changes(db, characters=None)
+            # Characters are flushed in bulk (autoflush and commit), not per item
+            ledger.keep()
+        except Exception as exc:
+            await db.rollback()
+            ledger.error(None, exc)
+            await record_run(db, ledger, "failed", {"created": created, "updated": updated, "errors": errors})
+            raise
+
+    result = {"created": created, "updated": updated, "errors": errors}
+    result["run_id"] = await record_run(db, ledger, "completed", result)
+    record_ingest("characters", result, ledger.started)
+    return result
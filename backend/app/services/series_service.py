@@ -1,9 +1,10 @@
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.models import Series, BookSeries
-from app.schemas.series import SeriesCreate
+from app.invalidation import commit_catalog_changes
+from app.models import Author, Book, BookSeries, Series
+from app.schemas.series import SeriesCreate, SeriesSearchParams
+from app.services.book_service import BOOK_BRIEF_COLUMNS, book_order_clauses, page_book_briefs
 
 
 async def list_series(db: AsyncSession):
@@ -11,19 +12,86 @@ async def list_series(db: AsyncSession):
     return result.scalars().all()
 
 
-async def get_series(db: AsyncSession, series_id: int):
-    query = (
-        select(Series)
-        .options(selectinload(Series.book_links).selectinload(BookSeries.book))
-        .where(Series.id == series_id)
+async def search_series(db: AsyncSession, params: SeriesSearchParams):
+    book_count_sq = (
+        select(BookSeries.series_id, func.count().label("book_count")).group_by(BookSeries.series_id).subquery()
+    )
+    book_count = func.coalesce(book_count_sq.c.book_count, 0)
+
+    query = select(Series.id, Series.name, Series.description, book_count.label("book_count")).outerjoin(
+        book_count_sq, Series.id == book_count_sq.c.series_id
     )
+
+    if params.name:
+        query = query.where(Series.name.ilike(f"%{params.name}%"))
+
+    if params.min_book_count is not None:
+        query = query.where(book_count >= params.min_book_count)
+
+    # Count total
+    count_query = select(func.count()).select_from(query.subquery())
+    total = (await db.execute(count_query)).scalar_one()
+
+    # Ordering, with id as a tiebreaker so pages are stable
+    order_col = book_count if params.order_by == "book_count" else Series.name
+    if params.order_dir == "desc":
+        query = query.order_by(order_col.desc(), Series.id.desc())
+    else:
+        query = query.order_by(order_col.asc(), Series.id.asc())
+
+    # Pagination
+    offset = (params.page - 1) * params.page_size
+    query = query.offset(offset).limit(params.page_size)
+
     result = await db.execute(query)
-    return result.scalar_one_or_none()
+    series = [dict(row._mapping) for row in result.all()]
+    return series, total
+
+
+async def get_series(
+    db: AsyncSession,
+    series_id: int,
+    page: int = 1,
+    page_size: int = 100,
+    order_by: str = "order_in_series",
+    order_dir: str = "asc",
+):
+    """Get a series with one page of its books, ordered in the database.
+
+    Reading order puts unnumbered entries last, then falls back to release order.
+    """
+    result = await db.execute(
+        select(Series.id, Series.name, Series.description).where(Series.id == series_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+
+    query = (
+        select(*BOOK_BRIEF_COLUMNS, BookSeries.order_in_series)
+        .join(BookSeries, Book.id == BookSeries.book_id)
+        .outerjoin(Author, Book.author_id == Author.id)
+        .where(BookSeries.series_id == series_id)
+    )
+    if order_by == "order_in_series":
+        position = BookSeries.order_in_series.desc() if order_dir == "desc" else BookSeries.order_in_series.asc()
+        order_clauses = [position.nulls_last(), *book_order_clauses("published_on", order_dir)]
+    else:
+        order_clauses = book_order_clauses(order_by, order_dir)
+    books, total = await page_book_briefs(db, query, order_clauses, page, page_size)
+    return {
+        **row._mapping,
+        "book_count": total,
+        "books": books,
+        "books_page": page,
+        "books_page_size": page_size,
+    }
 
 
 async def create_series(db: AsyncSession, data: SeriesCreate):
     series = Series(**data.model_dump())
     db.add(series)
-    await db.commit()
+    await db.flush()
+    await commit_catalog_changes(db, series=[series.id])
     await db.refresh(series)
     return series
@@ -1,8 +1,11 @@
-from sqlalchemy import select
+from sqlalchemy import func, literal, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Tag
-from app.schemas.tag import TagCreate
+from app.invalidation import commit_catalog_changes
+from app.models import Tag, book_tags
+from app.schemas.tag import TagApply, TagCreate, TagSearchParams
+from app.services.book_service import select_book_ids
 
 
 async def list_tags(db: AsyncSession, category: str | None = None):
@@ -13,9 +16,80 @@ async def list_tags(db: AsyncSession, category: str | None = None):
     return result.scalars().all()
 
 
+async def search_tags(db: AsyncSession, params: TagSearchParams):
+    book_count_sq = (
+        select(book_tags.c.tag_id, func.count().label("book_count")).group_by(book_tags.c.tag_id).subquery()
+    )
+    book_count = func.coalesce(book_count_sq.c.book_count, 0)
+
+    query = select(Tag.id, Tag.tag_name, Tag.category, book_count.label("book_count")).outerjoin(
+        book_count_sq, Tag.id == book_count_sq.c.tag_id
+    )
+
+    if params.name:
+        query = query.where(Tag.tag_name.ilike(f"%{params.name}%"))
+
+    if params.category:
+        query = query.where(Tag.category == params.category)
+
+    if params.min_book_count is not None:
+        query = query.where(book_count >= params.min_book_count)
+
+    # Count total
+    count_query = select(func.count()).select_from(query.subquery())
+    total = (await db.execute(count_query)).scalar_one()
+
+    # Ordering, with id as a tiebreaker so pages are stable
+    order_col = book_count if params.order_by == "book_count" else Tag.tag_name
+    if params.order_dir == "desc":
+        query = query.order_by(order_col.desc(), Tag.id.desc())
+    else:
+        query = query.order_by(order_col.asc(), Tag.id.asc())
+
+    # Pagination
+    offset = (params.page - 1) * params.page_size
+    query = query.offset(offset).limit(params.page_size)
+
+    result = await db.execute(query)
+    tags = [dict(row._mapping) for row in result.all()]
+    return tags, total
+
+
 async def create_tag(db: AsyncSession, data: TagCreate):
     tag = Tag(**data.model_dump())
     db.add(tag)
-    await db.commit()
+    await db.flush()
+    await commit_catalog_changes(db, tags=[tag.id])
     await db.refresh(tag)
     return tag
+
+
+async def apply_tag(db: AsyncSession, tag_id: int, data: TagApply) -> list[int] | None:
+    """Add or remove a tag on a selection of books in one statement.
+
+    Returns the ids of books whose tags actually changed, or None if the
+    tag does not exist.
+    """
+    if (await db.execute(select(Tag.id).where(Tag.id == tag_id))).scalar_one_or_none() is None:
+        return None
+
+    selected = select_book_ids(data.ids, data.filter)
+    if data.action == "apply":
+        books = selected.add_columns(literal(tag_id))
+        stmt = (
+            insert(book_tags)
+            .from_select(["book_id", "tag_id"], books)
+            .on_conflict_do_nothing()
+            .returning(book_tags.c.book_id)
+        )
+    else:
+        stmt = (
+            book_tags.delete()
+            .where(book_tags.c.tag_id == tag_id, book_tags.c.book_id.in_(selected.scalar_subquery()))
+            .returning(book_tags.c.book_id)
+        )
+    changed_ids = list((await db.execute(stmt)).scalars().all())
+    # No tag links changed: leave the caches alone
+    if changed_ids:
+        await commit_catalog_changes(db, books=changed_ids)
+    return changed_ids
@@ -0,0 +1,75 @@
+"""OpenTelemetry tracing, off unless TRACING_EXPORTER is set.
+
+Server spans come from FastAPI and continue the caller's ``traceparent``
+(the scraper sends one), SQLAlchemy adds a span per statement and
+ingest_service one per book. "console" prints finished spans; "file"
+appends them to TRACING_FILE as OTLP/JSON, one export batch per line, the
+layout the OpenTelemetry Collector's file exporter writes and its
+otlpjsonfile receiver reads back.
+"""
+
+import base64
+import json
+import threading
+
+from google.protobuf.json_format import MessageToDict
+from opentelemetry import trace
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SpanExporter, SpanExportResult
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings
+
+_provider: TracerProvider | None = None
+# OTLP/JSON spells ids in hex where protobuf's JSON mapping uses base64
+_ID_FIELDS = ("traceId", "spanId", "parentSpanId")
+
+
+def _hex_ids(value):
+    if isinstance(value, dict):
+        return {
+            k: base64.b64decode(v).hex() if k in _ID_FIELDS and isinstance(v, str) else _hex_ids(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_hex_ids(v) for v in value]
+    return value
+
+
+class OTLPJsonFileExporter(SpanExporter):
+    def __init__(self, path: str):
+        self._file = open(path, "a")
+        self._lock = threading.Lock()
+
+    def export(self, spans) -> SpanExportResult:
+        line = json.dumps(_hex_ids(MessageToDict(encode_spans(spans))), separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        self._file.close()
+
+
+def setup_tracing(app, engines: list[AsyncEngine]) -> None:
+    global _provider
+    if settings.TRACING_EXPORTER == "none":
+        return
+    _provider = TracerProvider(resource=Resource.create({SERVICE_NAME: settings.TRACING_SERVICE_NAME}))
+    exporter = ConsoleSpanExporter() if settings.TRACING_EXPORTER == "console" else OTLPJsonFileExporter(settings.TRACING_FILE)
+    _provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(_provider)
+    FastAPIInstrumentor.instrument_app(
+        app, tracer_provider=_provider, excluded_urls="/health,/metrics", exclude_spans=["receive", "send"]
+    )
+    SQLAlchemyInstrumentor().instrument(engines=[e.sync_engine for e in engines], tracer_provider=_provider)
+
+
+def shutdown_tracing() -> None:
+    if _provider is not None:
+        _provider.shutdown()
@@ -0,0 +1,34 @@
+"""Stand-ins for an AsyncSession that replay canned rows and record statements."""
+
+from collections import namedtuple
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = list(rows)
+
+    def all(self):
+        return list(self._rows)
+
+    def scalars(self):
+        return FakeResult(row[0] if isinstance(row, tuple) else row for row in self._rows)
+
+    def scalar_one_or_none(self):
+        return self._rows[0][0] if self._rows else None
+
+
+class FakeSession:
+    """Answers each ``execute`` with the next list in ``results`` (empty once they run out)."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.executed = []
+
+    async def execute(self, statement, params=None):
+        self.executed.append((statement, params))
+        return FakeResult(self.results.pop(0) if self.results else [])
+
+
+def rows(fields: str, *values) -> list:
+    Row = namedtuple("Row", fields)
+    return [Row(*value) for value in values]
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.admission import RouteClassLimiter
+from app.config import settings
+
+pytestmark = pytest.mark.anyio
+
+
+async def hold(limiter: RouteClassLimiter, release: asyncio.Event, entered: list | None = None):
+    async with limiter.slot():
+        if entered is not None:
+            entered.append(True)
+        await release.wait()
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_requests_beyond_limit_and_queue_get_429(monkeypatch):
+    monkeypatch.setattr(settings, "ADMISSION_RETRY_AFTER", 3)
+    limiter = RouteClassLimiter("test", limit=1, queue=1)
+    release = asyncio.Event()
+    running = asyncio.create_task(hold(limiter, release))
+    queued = asyncio.create_task(hold(limiter, release))
+    await settle()
+
+    with pytest.raises(HTTPException) as rejected:
+        async with limiter.slot():
+            pass
+
+    assert rejected.value.status_code == 429
+    assert rejected.value.headers == {"Retry-After": "3"}
+    assert limiter.stats() == {"limit": 1, "queue": 1, "active": 1, "waiting": 1, "rejected": 1}
+    release.set()
+    await asyncio.gather(running, queued)
+    assert (limiter.active, limiter.waiting) == (0, 0)
+
+
+async def test_queued_requests_run_when_a_slot_frees_up():
+    limiter = RouteClassLimiter("test", limit=1, queue=2)
+    first_release, second_release = asyncio.Event(), asyncio.Event()
+    entered = []
+    first = asyncio.create_task(hold(limiter, first_release, entered))
+    second = asyncio.create_task(hold(limiter, second_release, entered))
+    await settle()
+    assert (len(entered), limiter.waiting) == (1, 1)
+
+    first_release.set()
+    await settle()
+
+    assert (len(entered), limiter.active, limiter.waiting) == (2, 1, 0)
+    second_release.set()
+    await asyncio.gather(first, second)
+
+
+async def test_queue_wait_times_out_with_429(monkeypatch):
+    monkeypatch.setattr(settings, "ADMISSION_QUEUE_TIMEOUT", 0.01)
+    limiter = RouteClassLimiter("test", limit=1, queue=5)
+    release = asyncio.Event()
+    running = asyncio.create_task(hold(limiter, release))
+    await settle()
+
+    with pytest.raises(HTTPException) as rejected:
+        async with limiter.slot():
+            pass
+
+    assert rejected.value.status_code == 429
+    assert (limiter.waiting, limiter.rejected) == (0, 1)
+    release.set()
+    await running
+
+
+async def test_slot_is_released_when_the_work_fails():
+    limiter = RouteClassLimiter("test", limit=1, queue=0)
+
+    with pytest.raises(RuntimeError):
+        async with limiter.slot():
+            raise RuntimeError("query failed")
+
+    async with limiter.slot():
+        assert limiter.active == 1
+
+
+async def test_zero_limit_disables_the_gate():
+    limiter = RouteClassLimiter("test", limit=0, queue=0)
+    release = asyncio.Event()
+    holders = [asyncio.create_task(hold(limiter, release)) for _ in range(10)]
+    await settle()
+
+    assert limiter.rejected == 0
+    release.set()
+    await asyncio.gather(*holders)
@@ -0,0 +1,126 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.sql import Delete, Insert, Update
+
+from app.models import book_characters, book_tags
+from app.responses import prefers_minimal
+from app.models.book import ReadingStatus
+from app.services import book_service
+from app.services.book_service import _sync_links, _sync_relations
+from fakes import FakeSession
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize(
+    ("prefer", "expected"),
+    [
+        (None, False),
+        ("", False),
+        ("return=minimal", True),
+        ("Return = Minimal", True),
+        ("respond-async, return=minimal; foo=bar", True),
+        ("return=representation", False),
+        ("handling=lenient", False),
+    ],
+)
+def test_prefers_minimal(prefer, expected):
+    assert prefers_minimal(prefer) is expected
+
+
+@pytest.fixture
+def committed(monkeypatch) -> list:
+    """Changes passed to commit_catalog_changes by book_service."""
+    calls = []
+
+    async def record(db, **changes):
+        calls.append(changes)
+
+    monkeypatch.setattr(book_service, "commit_catalog_changes", record)
+    return calls
+
+
+async def test_status_update_invalidates_the_updated_books(committed):
+    db = FakeSession([(3,), (5,)])
+
+    updated = await book_service.update_books_status(db, {"reading_status": ReadingStatus.read}, book_ids=[3, 5, 8])
+
+    assert updated == [3, 5]
+    assert committed == [{"books": [3, 5]}]
+
+
+async def test_status_update_matching_nothing_leaves_caches_alone(committed):
+    db = FakeSession([])
+
+    updated = await book_service.update_books_status(db, {"owned": True}, book_ids=[404])
+
+    assert updated == []
+    assert committed == []
+
+
+def writes(db: FakeSession) -> list:
+    """The statements after the initial SELECT of existing links."""
+    return db.executed[1:]
+
+
+def removed_ids(statement) -> set:
+    return set(statement.compile().params["removed"])
+
+
+async def test_sync_links_touches_only_the_difference():
+    db = FakeSession([(1,), (2,), (3,)])
+
+    await _sync_links(db, book_characters, "character_id", 10, [2, 3, 4, 4, 5])
+
+    (delete, _), (insert, rows) = writes(db)
+    assert isinstance(delete, Delete) and removed_ids(delete) == {1}
+    assert isinstance(insert, Insert)
+    assert rows == [{"book_id": 10, "character_id": 4}, {"book_id": 10, "character_id": 5}]
+
+
+async def test_sync_links_writes_nothing_when_unchanged():
+    db = FakeSession([(7,), (8,)])
+
+    await _sync_links(db, book_tags, "tag_id", 10, [8, 7])
+
+    assert writes(db) == []
+
+
+async def test_sync_links_can_clear_everything():
+    db = FakeSession([(7,), (8,)])
+
+    await _sync_links(db, book_tags, "tag_id", 10, [])
+
+    ((delete, _),) = writes(db)
+    assert removed_ids(delete) == {7, 8}
+
+
+async def test_sync_relations_diffs_series_including_reading_order():
+    db = FakeSession([(1, 1), (2, 2), (3, None)])
+    data = SimpleNamespace(
+        series_ids=[
+            {"series_id": 1, "order_in_series": 1},
+            {"series_id": 2, "order_in_series": 5},
+            {"series_id": 4, "order_in_series": None},
+        ],
+        character_ids=None,
+        tag_ids=None,
+    )
+
+    await _sync_relations(db, 10, data)
+
+    (delete, _), (update, changed), (insert, added) = writes(db)
+    assert isinstance(delete, Delete) and removed_ids(delete) == {3}
+    assert isinstance(update, Update)
+    assert changed == [{"b_book_id": 10, "b_series_id": 2, "order_in_series": 5}]
+    assert isinstance(insert, Insert)
+    assert added == [{"book_id": 10, "series_id": 4, "order_in_series": None}]
+
+
+async def test_sync_relations_leaves_unspecified_relations_alone():
+    db = FakeSession()
+
+    await _sync_relations(db, 10, SimpleNamespace(series_ids=None, character_ids=None, tag_ids=None))
+
+    assert db.executed == []
@@ -0,0 +1,324 @@
+import asyncio
+from collections import defaultdict
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from pydantic import BaseModel
+
+from app import cache
+from app.cache import TTLCache, bump_catalog_version, cached_response, normalize_key
+from app.config import settings
+
+pytestmark = pytest.mark.anyio
+
+
+class _CacheSession:
+    async def __aenter__(self):
+        return "cache-session"
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def request_db():
+    return "request-session"
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch):
+    monkeypatch.setattr(cache, "read_session_factory", lambda request=None: lambda **kw: _CacheSession())
+    monkeypatch.setattr(cache, "_versions", defaultdict(int))
+    monkeypatch.setattr(cache, "_stored_versions", {})
+    cache.response_cache.clear()
+
+
+def make_client(gate: asyncio.Event | None = None, **options) -> tuple[httpx.AsyncClient, list]:
+    """A one-route app whose handler records the session it ran on, after
+    waiting for ``gate`` if one is given."""
+    app = FastAPI()
+    calls = []
+
+    @app.get("/books/{book_id}")
+    @cached_response("test.book", **options)
+    async def get_book(book_id: int, q: str | None = None, db=Depends(request_db)):
+        calls.append(db)
+        if gate is not None:
+            await gate.wait()
+        return {"id": book_id, "q": q, "call": len(calls)}
+
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+    return client, calls
+
+
+class Filters(BaseModel):
+    name: str | None = None
+    page: int = 1
+
+
+def test_normalize_key_ignores_unset_values_case_and_order():
+    assert normalize_key({"b": " Luke ", "a": None, "c": ""}) == normalize_key({"b": "luke"})
+    assert normalize_key({"x": 1, "y": 2}) == normalize_key({"y": 2, "x": 1})
+    assert normalize_key({"b": "Luke"}) != normalize_key({"b": "Leia"})
+
+
+def test_normalize_key_flattens_models():
+    assert normalize_key({"params": Filters(name="Han")}) == (("name", "han"), ("page", 1))
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    ttl_cache = TTLCache("test.expiry", ttl=10)
+    ttl_cache.set("key", "value")
+
+    assert ttl_cache.get("key") == "value"
+    now[0] += 11
+    assert ttl_cache.get("key") is None
+    assert (ttl_cache.hits, ttl_cache.misses) == (1, 1)
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    ttl_cache = TTLCache("test.lru", ttl=60, maxsize=2)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.get("a")
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("b") is None
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.evictions == 1
+
+
+async def test_repeated_requests_are_served_from_cache():
+    client, calls = make_client(depends=("books",))
+    async with client:
+        first = await client.get("/books/1", params={"q": "Jedi"})
+        second = await client.get("/books/1", params={"q": " jedi"})
+
+    assert first.content == second.content
+    assert calls == ["cache-session"]
+
+
+async def test_write_to_a_dependency_invalidates():
+    client, _ = make_client(depends=("books",))
+    async with client:
+        await client.get("/books/1")
+        bump_catalog_version("books", [99])
+        response = await client.get("/books/1")
+
+    assert response.json()["call"] == 2
+
+
+async def test_entity_routes_only_see_writes_to_their_row():
+    client, _ = make_client(depends=(), entity=("books", "book_id"))
+    async with client:
+        await client.get("/books/1")
+        bump_catalog_version("books", [2])
+        assert (await client.get("/books/1")).json()["call"] == 1
+        bump_catalog_version("books", [1])
+        assert (await client.get("/books/1")).json()["call"] == 2
+        bump_catalog_version("books")
+        assert (await client.get("/books/1")).json()["call"] == 3
+
+
+async def test_no_validators_until_stored_versions_are_known():
+    client, _ = make_client(depends=("books",))
+    async with client:
+        response = await client.get("/books/1")
+
+    assert "etag" not in response.headers
+    assert response.headers["cache-control"] == "no-cache"
+
+
+async def test_matching_validators_answer_304_without_running_the_handler():
+    cache.set_stored_versions({"books": (3, 1_700_000_000.0)})
+    client, calls = make_client(depends=("books",))
+    async with client:
+        first = await client.get("/books/1")
+        cache.response_cache.clear()
+        etag = await client.get("/books/1", headers={"If-None-Match": first.headers["etag"]})
+        since = await client.get("/books/1", headers={"If-Modified-Since": first.headers["last-modified"]})
+
+    assert first.headers["last-modified"] == "Tue, 14 Nov 2023 22:13:20 GMT"
+    assert (etag.status_code, since.status_code) == (304, 304)
+    assert etag.headers["etag"] == first.headers["etag"]
+    assert len(calls) == 1
+
+
+async def test_validators_do_not_depend_on_the_process(monkeypatch):
+    cache.set_stored_versions({"books": (3, 1_700_000_000.0)})
+    client, _ = make_client(depends=("books",))
+    async with client:
+        first = await client.get("/books/1")
+        # Another worker: its own instance id and local versions, same stored versions
+        monkeypatch.setattr(cache, "INSTANCE_ID", "another-worker")
+        monkeypatch.setattr(cache, "_versions", defaultdict(int, {"books": 41}))
+        cache.response_cache.clear()
+        second = await client.get("/books/1", headers={"If-None-Match": first.headers["etag"]})
+
+    assert second.status_code == 304
+
+
+async def test_a_stored_version_bump_changes_the_validators():
+    cache.set_stored_versions({"books": (3, 1_700_000_000.0)})
+    client, _ = make_client(depends=("books",))
+    async with client:
+        first = await client.get("/books/1")
+        cache.set_stored_versions({"books": (4, 1_700_000_100.0)})
+        bump_catalog_version("books", [1])
+        second = await client.get("/books/1", headers={"If-None-Match": first.headers["etag"]})
+
+    assert second.status_code == 200
+    assert second.headers["etag"] != first.headers["etag"]
+    assert second.headers["last-modified"] == "Tue, 14 Nov 2023 22:15:00 GMT"
+
+
+def test_stored_versions_never_go_backwards():
+    cache.set_stored_versions({"books": (5, 200.0)})
+    cache.set_stored_versions({"books": (4, 100.0), "tags": (1, 50.0)})
+
+    assert cache.stored_versions("books", "tags") == ((5, 200.0), (1, 50.0))
+    assert cache.stored_versions("books", "authors") is None
+
+
+async def _background_refreshes():
+    while cache._background:
+        await asyncio.sleep(0)
+
+
+async def test_concurrent_misses_share_one_computation():
+    gate = asyncio.Event()
+    client, calls = make_client(gate=gate, depends=("books",))
+    coalesced = cache.response_cache.coalesced
+    async with client:
+        requests = [asyncio.create_task(client.get("/books/1")) for _ in range(3)]
+        async with asyncio.timeout(5):
+            while cache.response_cache.coalesced - coalesced < 2:
+                await asyncio.sleep(0)
+        gate.set()
+        responses = await asyncio.gather(*requests)
+
+    assert len(calls) == 1
+    assert {response.content for response in responses} == {responses[0].content}
+
+
+async def test_stale_entries_are_served_while_one_refresh_runs():
+    client, calls = make_client(depends=("books",), stale_while_revalidate=True)
+    async with client:
+        await client.get("/books/1")
+        bump_catalog_version("books", [1])
+        stale = await client.get("/books/1")
+        await _background_refreshes()
+        fresh = await client.get("/books/1")
+
+    assert stale.json()["call"] == 1
+    assert fresh.json()["call"] == 2
+    assert len(calls) == 2
+
+
+async def test_refreshed_entries_carry_the_new_validators():
+    cache.set_stored_versions({"books": (3, 1_700_000_000.0)})
+    client, _ = make_client(depends=("books",), stale_while_revalidate=True)
+    async with client:
+        first = await client.get("/books/1")
+        cache.set_stored_versions({"books": (4, 1_700_000_100.0)})
+        bump_catalog_version("books", [1])
+        stale = await client.get("/books/1")
+        await _background_refreshes()
+        fresh = await client.get("/books/1")
+        revalidated = await client.get("/books/1", headers={"If-None-Match": first.headers["etag"]})
+
+    assert stale.headers["etag"] == first.headers["etag"]
+    assert fresh.json()["call"] == 2
+    assert fresh.headers["etag"] != first.headers["etag"]
+    assert fresh.headers["last-modified"] == "Tue, 14 Nov 2023 22:15:00 GMT"
+    assert revalidated.status_code == 200
+    assert revalidated.json()["call"] == 2
+
+
+async def test_stale_entries_are_not_served_past_the_window(monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_TTL", 60.0)
+    monkeypatch.setattr(settings, "CACHE_STALE_TTL", 30.0)
+    now = [cache.time.time()]
+    monkeypatch.setattr(cache.time, "time", lambda: now[0])
+    client, _ = make_client(depends=("books",), stale_while_revalidate=True)
+    async with client:
+        await client.get("/books/1")
+        now[0] += 91
+        response = await client.get("/books/1")
+
+    assert response.json()["call"] == 2
+
+
+async def test_no_stale_window_means_no_stale_entries(monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_STALE_TTL", 0.0)
+    client, _ = make_client(depends=("books",), stale_while_revalidate=True)
+    async with client:
+        await client.get("/books/1")
+        bump_catalog_version("books", [1])
+        response = await client.get("/books/1")
+
+    assert response.json()["call"] == 2
+
+
+async def test_zero_ttl_runs_every_request_on_its_own_session(monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_TTL", 0.0)
+    cache.set_stored_versions({"books": (3, 1_700_000_000.0)})
+    client, calls = make_client(depends=("books",), stale_while_revalidate=True)
+    async with client:
+        responses = [await client.get("/books/1", headers={"If-None-Match": "*"}) for _ in range(3)]
+
+    assert [response.json()["call"] for response in responses] == [1, 2, 3]
+    assert calls == ["request-session"] * 3
+    assert all(response.status_code == 200 and "etag" not in response.headers for response in responses)
+
+
+async def test_shared_query_survives_one_waiter_leaving():
+    gate = asyncio.Event()
+    cancelled = []
+
+    async def compute():
+        try:
+            await gate.wait()
+            return b"body"
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    leaving = asyncio.create_task(cache._single_flight("key", compute))
+    staying = asyncio.create_task(cache._single_flight("key", compute))
+    await asyncio.sleep(0)
+    leaving.cancel()
+    await asyncio.sleep(0)
+    gate.set()
+
+    assert await staying == b"body"
+    assert cancelled == []
+
+
+async def test_shared_query_is_cancelled_when_the_last_waiter_leaves():
+    started = []
+
+    async def compute():
+        started.append(True)
+        await asyncio.Event().wait()
+
+    waiters = [asyncio.create_task(cache._single_flight("key", compute)) for _ in range(2)]
+    await asyncio.sleep(0)
+    task = cache._inflight["key"]
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert task.cancelled()
+    assert "key" not in cache._inflight
+    assert not cache._waiters
+    # A later request starts over rather than joining the cancelled query
+    later = asyncio.create_task(cache._single_flight("key", compute))
+    async with asyncio.timeout(5):
+        while len(started) < 2:
+            await asyncio.sleep(0)
+    assert cache._inflight["key"] is not task
+    later.cancel()
+    await asyncio.gather(later, return_exceptions=True)
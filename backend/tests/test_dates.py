@@ -0,0 +1,42 @@
+from datetime import date
+
+import pytest
+
+from app.dates import parse_publication_date
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("October 4,2022[1]", date(2022, 10, 4)),
+        ("Jan. 5th, 1977", date(1977, 1, 5)),
+        ("Sept 3, 1999", date(1999, 9, 3)),
+        ("2015-06-30", date(2015, 6, 30)),
+        ("May 1, 2001; reissued 2010", date(2001, 5, 1)),
+    ],
+)
+def test_full_dates(raw, expected):
+    assert parse_publication_date(raw) == expected
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("July1998", date(1998, 7, 1)),
+        ("March 2005 (paperback)", date(2005, 3, 1)),
+        ("2001-09", date(2001, 9, 1)),
+        ("Edition2017", date(2017, 1, 1)),
+    ],
+)
+def test_partial_dates_fall_back_to_the_first(raw, expected):
+    assert parse_publication_date(raw) == expected
+
+
+@pytest.mark.parametrize(("raw", "expected"), [("Feb 30 2020", date(2020, 2, 1)), ("2015-02-31", date(2015, 2, 1))])
+def test_impossible_day_keeps_the_month(raw, expected):
+    assert parse_publication_date(raw) == expected
+
+
+@pytest.mark.parametrize("raw", [None, "", "TBA", "[1]"])
+def test_unparseable(raw):
+    assert parse_publication_date(raw) is None
@@ -0,0 +1,72 @@
+import pytest
+
+from app.models.book import CanonStatus, ReadingStatus
+from app.schemas.book import BookFilterParams
+from app.services import book_service
+from fakes import FakeSession, rows
+
+pytestmark = pytest.mark.anyio
+
+COLUMNS = ("canon_or_legends", "reading_status", "owned", "decade")
+
+
+def grouping(*grouped_by: str) -> int:
+    """What Postgres' grouping() returns: one bit per argument, leftmost most
+    significant, set for the columns a row is *not* grouped by."""
+    return sum(1 << (len(COLUMNS) - 1 - i) for i, column in enumerate(COLUMNS) if column not in grouped_by)
+
+
+@pytest.fixture(autouse=True)
+def empty_facets_cache():
+    book_service._facets_cache.clear()
+
+
+async def test_rows_are_routed_by_grouping_set():
+    db = FakeSession(
+        rows(
+            "grouping canon_or_legends reading_status owned decade count",
+            (grouping("canon_or_legends"), CanonStatus.canon, None, None, None, 7),
+            (grouping("canon_or_legends"), CanonStatus.legends, None, None, None, 5),
+            (grouping("reading_status"), None, ReadingStatus.read, None, None, 4),
+            (grouping("owned"), None, None, True, None, 3),
+            (grouping("owned"), None, None, False, None, 9),
+            (grouping("decade"), None, None, None, -20, 6),
+            (grouping(), None, None, None, None, 12),
+        )
+    )
+
+    facets = await book_service.get_book_facets(db, BookFilterParams())
+
+    assert len(db.executed) == 1
+    assert facets["total"] == 12
+    assert facets["canon_status"] == {CanonStatus.canon: 7, CanonStatus.legends: 5}
+    assert facets["reading_status"][ReadingStatus.read] == 4
+    assert sum(facets["reading_status"].values()) == 4
+    assert facets["owned"] == {True: 3, False: 9}
+    assert facets["timeline_decade"] == [{"decade": -20, "count": 6}]
+
+
+async def test_undated_books_sort_after_the_decades():
+    db = FakeSession(
+        rows(
+            "grouping canon_or_legends reading_status owned decade count",
+            (grouping("decade"), None, None, None, None, 2),
+            (grouping("decade"), None, None, None, 10, 1),
+            (grouping("decade"), None, None, None, -30, 4),
+        )
+    )
+
+    facets = await book_service.get_book_facets(db, BookFilterParams())
+
+    assert [f["decade"] for f in facets["timeline_decade"]] == [-30, 10, None]
+
+
+async def test_results_are_cached_per_filter_set():
+    counts = rows("grouping canon_or_legends reading_status owned decade count", (grouping(), None, None, None, None, 1))
+    db = FakeSession(counts, counts)
+
+    await book_service.get_book_facets(db, BookFilterParams(q="Jedi"))
+    await book_service.get_book_facets(db, BookFilterParams(q=" jedi "))
+    await book_service.get_book_facets(db, BookFilterParams(q="Sith"))
+
+    assert len(db.executed) == 2
@@ -0,0 +1,121 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session
+
+from app.models import Author, Book
+from app.services.ingest_run_service import SLOWEST_KEPT, IngestRunLedger
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    # SQLite can't hold the JSONB tables, and the ledger never touches them
+    tables = [
+        table
+        for table in Book.metadata.sorted_tables
+        if not any(isinstance(column.type, JSONB) for column in table.columns)
+    ]
+    Book.metadata.create_all(engine, tables=tables)
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def ledger(session):
+    ledger = IngestRunLedger("books", 2)
+    # tracking() listens on the AsyncSession's sync_session
+    with ledger.tracking(SimpleNamespace(sync_session=session)):
+        yield ledger
+
+
+def add_book(session, title="Heir to the Empire") -> Book:
+    book = Book(title=title)
+    session.add(book)
+    session.flush()
+    return book
+
+
+def test_a_new_book_flushed_again_for_its_cover_counts_as_one_insert(session, ledger):
+    book = add_book(session)
+    book.cover_image = b"jpeg"
+    book.cover_url = f"/api/v1/books/{book.id}/cover"
+    session.flush()
+    ledger.keep()
+
+    assert ledger.rows == {"books": {"inserted": 1}}
+
+
+def test_an_existing_book_updated_twice_in_one_item_counts_once(session, ledger):
+    book = add_book(session)
+    ledger.keep()
+
+    book.page_count = 400
+    session.flush()
+    book.cover_image = b"jpeg"
+    session.flush()
+    ledger.keep()
+
+    assert ledger.rows == {"books": {"inserted": 1, "updated": 1}}
+
+
+def test_each_item_counts_its_own_update_of_a_shared_row(session, ledger):
+    author = Author(name="Timothy Zahn")
+    session.add(author)
+    session.flush()
+    ledger.keep()
+
+    for bio in ("first", "second"):
+        author.bio = bio
+        session.flush()
+        ledger.keep()
+
+    assert ledger.rows["authors"] == {"inserted": 1, "updated": 2}
+
+
+def test_inserted_then_deleted_counts_nothing(session, ledger):
+    book = add_book(session)
+    session.delete(book)
+    session.flush()
+    ledger.keep()
+
+    assert ledger.rows == {}
+
+
+def test_discarded_items_leave_no_counts(session, ledger):
+    add_book(session, "Dark Force Rising")
+    ledger.count("book_characters", "inserted", 12)
+    ledger.discard()
+    add_book(session, "The Last Command")
+    ledger.count("book_characters", "deleted", 3)
+    ledger.keep()
+
+    assert ledger.rows == {"books": {"inserted": 1}, "book_characters": {"deleted": 3}}
+
+
+def test_flushes_after_tracking_ends_are_not_counted(session):
+    ledger = IngestRunLedger("books", 1)
+    with ledger.tracking(SimpleNamespace(sync_session=session)):
+        pass
+    add_book(session)
+    ledger.keep()
+
+    assert ledger.rows == {}
+
+
+def test_to_run_reports_phases_slowest_items_and_errors():
+    ledger = IngestRunLedger("books", SLOWEST_KEPT + 2)
+    with ledger.phase("lookup"):
+        pass
+    for i in range(SLOWEST_KEPT + 2):
+        ledger.item_done(f"book {i}", i / 1000)
+    ledger.error("book 3", ValueError("bad date"))
+
+    run = ledger.to_run("completed", {"created": 10, "updated": 1, "errors": 1})
+
+    assert set(run.phases) == {"lookup"}
+    assert [item["name"] for item in run.slowest] == [f"book {i}" for i in range(SLOWEST_KEPT + 1, 1, -1)]
+    assert run.error_details == [{"name": "book 3", "error": "ValueError: bad date"}]
+    assert (run.kind, run.status, run.items, run.created) == ("books", "completed", SLOWEST_KEPT + 2, 10)
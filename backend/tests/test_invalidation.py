@@ -0,0 +1,39 @@
+import json
+from collections import defaultdict
+
+import pytest
+
+from app import cache, invalidation
+
+
+@pytest.fixture(autouse=True)
+def isolated_versions(monkeypatch):
+    monkeypatch.setattr(cache, "_versions", defaultdict(int))
+    monkeypatch.setattr(cache, "_stored_versions", {})
+
+
+def test_notifications_from_other_workers_apply_changes_and_stored_versions():
+    payload = json.dumps(
+        {"origin": "other-worker", "changes": {"books": [7]}, "versions": {"books": [12, 1_700_000_000.0]}}
+    )
+
+    invalidation._on_notification(None, 0, invalidation.CHANNEL, payload)
+
+    assert cache.entity_versions("books", 7) == (0, 1)
+    assert cache.stored_versions("books") == ((12, 1_700_000_000.0),)
+
+
+def test_own_notifications_are_ignored():
+    payload = json.dumps({"origin": cache.INSTANCE_ID, "changes": {"books": [7]}, "versions": {"books": [12, 1.0]}})
+
+    invalidation._on_notification(None, 0, invalidation.CHANNEL, payload)
+
+    assert cache.entity_versions("books", 7) == (0, 0)
+    assert cache.stored_versions("books") is None
+
+
+def test_oversized_payloads_fall_back_to_whole_scopes_but_keep_versions():
+    payload = json.loads(invalidation._encode({"books": list(range(5000))}, {"books": (3, 1.0)}))
+
+    assert payload["changes"] == {"books": None}
+    assert payload["versions"] == {"books": [3, 1.0]}
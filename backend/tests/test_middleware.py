@@ -0,0 +1,68 @@
+import gzip
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+
+from app.middleware import CompressionMiddleware, negotiate_encoding
+
+pytestmark = pytest.mark.anyio
+
+BODY = "Heir to the Empire\n" * 100
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("gzip, deflate, br", "br"),
+        ("BR", "br"),
+        ("br;q=0, gzip", "gzip"),
+        ("gzip;q=0, br;q=0", None),
+        ("br;q=0.5, gzip", "gzip"),
+        ("gzip;q=0.5, br;q=0.5", "br"),
+        ("*", "br"),
+        ("*;q=0", None),
+        ("br;q=0, *", "gzip"),
+        ("gzip, *;q=0", "gzip"),
+        ("brotli, xgzip", None),
+        ("br;q=oops, gzip", "gzip"),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, expected):
+    assert negotiate_encoding(accept_encoding) == expected
+
+
+def make_client() -> httpx.AsyncClient:
+    app = FastAPI()
+
+    @app.get("/text")
+    async def text():
+        return PlainTextResponse(BODY)
+
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+async def get_raw(accept_encoding: str) -> tuple[httpx.Response, bytes]:
+    async with make_client() as client:
+        async with client.stream("GET", "/text", headers={"Accept-Encoding": accept_encoding}) as response:
+            return response, b"".join([chunk async for chunk in response.aiter_raw()])
+
+
+async def test_a_refused_coding_is_not_used():
+    response, raw = await get_raw("br;q=0, gzip")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(raw).decode() == BODY
+
+
+async def test_nothing_acceptable_leaves_the_body_uncompressed():
+    response, raw = await get_raw("br;q=0, gzip;q=0")
+
+    assert "content-encoding" not in response.headers
+    assert raw.decode() == BODY
@@ -0,0 +1,64 @@
+from datetime import date
+
+import msgpack
+import orjson
+import pytest
+from pydantic import BaseModel
+
+from app.models.book import ReadingStatus
+from app.responses import JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, negotiate_media_type, render, to_columnar
+
+
+class Brief(BaseModel):
+    id: int
+    title: str
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        (None, JSON_MEDIA_TYPE),
+        ("", JSON_MEDIA_TYPE),
+        ("*/*", JSON_MEDIA_TYPE),
+        ("application/msgpack", MSGPACK_MEDIA_TYPE),
+        ("application/x-msgpack", MSGPACK_MEDIA_TYPE),
+        ("application/json;q=0.5, application/msgpack", MSGPACK_MEDIA_TYPE),
+        ("application/msgpack;q=0.4, application/json", JSON_MEDIA_TYPE),
+        ("application/msgpack;q=0", JSON_MEDIA_TYPE),
+        ("application/msgpack;q=oops", JSON_MEDIA_TYPE),
+        ("text/html, image/png", JSON_MEDIA_TYPE),
+    ],
+)
+def test_negotiate_media_type(accept, expected):
+    assert negotiate_media_type(accept) == expected
+
+
+def test_to_columnar_turns_lists_of_objects_into_columns():
+    content = {
+        "items": [{"id": 1, "title": "Heir to the Empire"}, {"id": 2, "title": "Dark Force Rising", "owned": True}],
+        "total": 2,
+    }
+
+    assert to_columnar(content) == {
+        "items": {"id": [1, 2], "title": ["Heir to the Empire", "Dark Force Rising"], "owned": [None, True]},
+        "total": 2,
+    }
+
+
+def test_to_columnar_handles_models_and_nesting():
+    content = {"books": [Brief(id=1, title="Shatterpoint")], "tags": ["a", "b"], "empty": []}
+
+    assert to_columnar(content) == {"books": {"id": [1], "title": ["Shatterpoint"]}, "tags": ["a", "b"], "empty": []}
+
+
+def test_render_json_and_msgpack_agree():
+    content = {"items": [Brief(id=1, title="Thrawn")], "status": ReadingStatus.read, "published_on": date(2017, 4, 11)}
+
+    as_json = orjson.loads(render(content))
+    as_msgpack = msgpack.unpackb(render(content, MSGPACK_MEDIA_TYPE))
+
+    assert as_json == as_msgpack == {
+        "items": [{"id": 1, "title": "Thrawn"}],
+        "status": "read",
+        "published_on": "2017-04-11",
+    }
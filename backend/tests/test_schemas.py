@@ -0,0 +1,38 @@
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.book import BookRead
+from app.schemas.character import CharacterDetailParams, CharacterSearchParams
+
+
+@pytest.mark.parametrize(
+    ("schema", "field", "value"),
+    [
+        (CharacterSearchParams, "order_by", "popularity"),
+        (CharacterSearchParams, "order_dir", "sideways"),
+        (CharacterDetailParams, "order_by", "page_count"),
+        (CharacterDetailParams, "order_dir", "up"),
+    ],
+)
+def test_unknown_character_sorts_are_rejected(schema, field, value):
+    with pytest.raises(ValidationError):
+        schema(**{field: value})
+
+
+def test_character_sorts():
+    assert CharacterSearchParams(order_by="book_count", order_dir="desc").order_by == "book_count"
+    assert CharacterDetailParams(order_by="publication_date").order_by == "publication_date"
+
+
+def test_sparse_book_detail_only_requires_id():
+    from app.main import app
+
+    openapi = app.openapi()
+    response = openapi["paths"]["/api/v1/books/{book_id}"]["get"]["responses"]["200"]
+    batch = openapi["components"]["schemas"]["BookBatch"]["properties"]["items"]
+    detail = openapi["components"]["schemas"]["BookDetail"]
+
+    assert response["content"]["application/json"]["schema"] == {"$ref": "#/components/schemas/BookDetail"}
+    assert batch["items"] == {"$ref": "#/components/schemas/BookDetail"}
+    assert detail["required"] == ["id"]
+    assert set(detail["properties"]) == set(BookRead.model_fields)
@@ -0,0 +1,44 @@
+import pytest
+
+from app.schemas.book import BookFilterParams
+from app.schemas.tag import TagApply
+from app.services import tag_service
+from fakes import FakeSession
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def committed(monkeypatch) -> list:
+    calls = []
+
+    async def record(db, **changes):
+        calls.append(changes)
+
+    monkeypatch.setattr(tag_service, "commit_catalog_changes", record)
+    return calls
+
+
+async def test_applying_a_tag_invalidates_the_changed_books(committed):
+    db = FakeSession([(4,)], [(1,), (2,)])
+
+    changed = await tag_service.apply_tag(db, 4, TagApply(ids=[1, 2, 3]))
+
+    assert changed == [1, 2]
+    assert committed == [{"books": [1, 2]}]
+
+
+@pytest.mark.parametrize("selection", [TagApply(ids=[]), TagApply(filter=BookFilterParams(q="nothing"), action="remove")])
+async def test_a_no_op_leaves_caches_alone(committed, selection):
+    db = FakeSession([(4,)], [])
+
+    assert await tag_service.apply_tag(db, 4, selection) == []
+    assert committed == []
+
+
+async def test_unknown_tag(committed):
+    db = FakeSession([])
+
+    assert await tag_service.apply_tag(db, 4, TagApply(ids=[1])) is None
+    assert len(db.executed) == 1
+    assert committed == []
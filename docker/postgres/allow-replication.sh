@@ -0,0 +1,3 @@
+#!/bin/sh
+# Let the db-replica service stream WAL from this server (first init only)
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"
@@ -7,8 +7,11 @@ import type {
   CharacterBookFilters,
   CharacterDetail,
   CharacterSearchFilters,
+  NameSearchFilters,
+  PaginatedAuthors,
   PaginatedBooks,
   PaginatedCharacters,
+  PaginatedSeries,
   Series,
   SeriesWithBooks,
   TagBrief,
@@ -62,8 +65,16 @@ export async function listAuthors(): Promise<Author[]> {
   return data;
 }
 
-export async function getAuthor(id: number): Promise<AuthorWithBooks> {
-  const { data } = await api.get(`/authors/${id}`);
+export async function searchAuthors(filters: NameSearchFilters): Promise<PaginatedAuthors> {
+  const params = Object.fromEntries(
+    Object.entries(filters).filter(([, v]) => v !== undefined && v !== "")
+  );
+  const { data } = await api.get("/authors/search", { params });
+  return data;
+}
+
+export async function getAuthor(id: number, page = 1): Promise<AuthorWithBooks> {
+  const { data } = await api.get(`/authors/${id}`, { params: { page } });
   return data;
 }
 
@@ -78,8 +89,16 @@ export async function listSeries(): Promise<Series[]> {
   return data;
 }
 
-export async function getSeries(id: number): Promise<SeriesWithBooks> {
-  const { data } = await api.get(`/series/${id}`);
+export async function searchSeries(filters: NameSearchFilters): Promise<PaginatedSeries> {
+  const params = Object.fromEntries(
+    Object.entries(filters).filter(([, v]) => v !== undefined && v !== "")
+  );
+  const { data } = await api.get("/series/search", { params });
+  return data;
+}
+
+export async function getSeries(id: number, page = 1): Promise<SeriesWithBooks> {
+  const { data } = await api.get(`/series/${id}`, { params: { page } });
   return data;
 }
 
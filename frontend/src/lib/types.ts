@@ -8,6 +8,7 @@ export interface BookBrief {
   reading_status: ReadingStatus;
   owned: boolean;
   timeline_year: number | null;
+  published_on: string | null;
   author_name: string | null;
   cover_url: string | null;
   matched_characters: string[];
@@ -20,6 +21,7 @@ export interface BookRead {
   isbn: string | null;
   page_count: number | null;
   publication_date: string | null;
+  published_on: string | null;
   cover_url: string | null;
   wookieepedia_url: string | null;
   canon_or_legends: CanonStatus;
@@ -48,8 +50,22 @@ export interface Author {
   bio: string | null;
 }
 
+export interface AuthorSummary extends Author {
+  book_count: number;
+}
+
+export interface PaginatedAuthors {
+  items: AuthorSummary[];
+  total: number;
+  page: number;
+  page_size: number;
+}
+
 export interface AuthorWithBooks extends Author {
+  book_count: number;
   books: BookBrief[];
+  books_page: number;
+  books_page_size: number;
 }
 
 export interface Series {
@@ -64,8 +80,26 @@ export interface SeriesBrief {
   order_in_series: number | null;
 }
 
+export interface SeriesSummary extends Series {
+  book_count: number;
+}
+
+export interface PaginatedSeries {
+  items: SeriesSummary[];
+  total: number;
+  page: number;
+  page_size: number;
+}
+
+export interface SeriesBook extends BookBrief {
+  order_in_series: number | null;
+}
+
 export interface SeriesWithBooks extends Series {
-  books: BookBrief[];
+  book_count: number;
+  books: SeriesBook[];
+  books_page: number;
+  books_page_size: number;
 }
 
 export interface CharacterBrief {
@@ -126,6 +160,15 @@ export interface CharacterSearchFilters {
   order_dir?: string;
 }
 
+export interface NameSearchFilters {
+  name?: string;
+  min_book_count?: number;
+  page?: number;
+  page_size?: number;
+  order_by?: string;
+  order_dir?: string;
+}
+
 export interface CharacterBookFilters {
   canon_status?: CanonStatus;
   reading_status?: ReadingStatus;
@@ -158,6 +201,8 @@ export interface BookSearchFilters {
   owned?: boolean;
   timeline_year_min?: number;
   timeline_year_max?: number;
+  published_min?: string;
+  published_max?: string;
   page?: number;
   page_size?: number;
   order_by?: string;
@@ -1,4 +1,5 @@
-import { Link, useParams } from "react-router-dom";
+import { useCallback } from "react";
+import { Link, useParams, useSearchParams } from "react-router-dom";
 import { useQuery } from "@tanstack/react-query";
 import { ArrowLeft } from "lucide-react";
 import { getAuthor } from "@/lib/api";
@@ -6,16 +7,30 @@ import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
 import { Card, CardContent } from "@/components/ui/card";
 import { Skeleton } from "@/components/ui/skeleton";
+import { Pagination } from "@/components/filters/Pagination";
 
 export function AuthorDetailPage() {
   const { id } = useParams<{ id: string }>();
+  const [searchParams, setSearchParams] = useSearchParams();
+  const page = Number(searchParams.get("page") || 1);
 
   const { data: author, isLoading } = useQuery({
-    queryKey: ["author", id],
-    queryFn: () => getAuthor(Number(id)),
+    queryKey: ["author", id, page],
+    queryFn: () => getAuthor(Number(id), page),
     enabled: !!id,
   });
 
+  const setPage = useCallback(
+    (page: number) => {
+      setSearchParams((prev) => {
+        const next = new URLSearchParams(prev);
+        next.set("page", String(page));
+        return next;
+      });
+    },
+    [setSearchParams]
+  );
+
   if (isLoading) {
     return (
       <div className="space-y-4">
@@ -27,6 +42,8 @@ export function AuthorDetailPage() {
 
   if (!author) return <p>Author not found.</p>;
 
+  const totalPages = Math.ceil(author.book_count / author.books_page_size);
+
   return (
     <div className="space-y-6 max-w-3xl">
       <div className="flex items-center gap-2">
@@ -41,25 +58,28 @@ export function AuthorDetailPage() {
       {author.bio && <p className="text-muted-foreground">{author.bio}</p>}
 
       <div className="space-y-3">
-        <h2 className="text-lg font-semibold">Books</h2>
+        <h2 className="text-lg font-semibold">Books ({author.book_count})</h2>
         {author.books.length > 0 ? (
-          <div className="grid grid-cols-1 md:grid-cols-2 gap-3">
-            {author.books.map((book) => (
-              <Link key={book.id} to={`/books/${book.id}`}>
-                <Card className="hover:shadow-md transition-shadow cursor-pointer h-full">
-                  <CardContent className="p-3 space-y-1">
-                    <h3 className="font-medium">{book.title}</h3>
-                    <div className="flex gap-1.5">
-                      <Badge variant={book.canon_or_legends === "canon" ? "default" : "secondary"}>
-                        {book.canon_or_legends}
-                      </Badge>
-                      <Badge variant="outline">{book.reading_status}</Badge>
-                    </div>
-                  </CardContent>
-                </Card>
-              </Link>
-            ))}
-          </div>
+          <>
+            <div className="grid grid-cols-1 md:grid-cols-2 gap-3">
+              {author.books.map((book) => (
+                <Link key={book.id} to={`/books/${book.id}`}>
+                  <Card className="hover:shadow-md transition-shadow cursor-pointer h-full">
+                    <CardContent className="p-3 space-y-1">
+                      <h3 className="font-medium">{book.title}</h3>
+                      <div className="flex gap-1.5">
+                        <Badge variant={book.canon_or_legends === "canon" ? "default" : "secondary"}>
+                          {book.canon_or_legends}
+                        </Badge>
+                        <Badge variant="outline">{book.reading_status}</Badge>
+                      </div>
+                    </CardContent>
+                  </Card>
+                </Link>
+              ))}
+            </div>
+            <Pagination page={author.books_page} totalPages={totalPages} onPageChange={setPage} />
+          </>
         ) : (
           <p className="text-muted-foreground">No books by this author.</p>
         )}
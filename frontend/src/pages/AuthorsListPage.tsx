@@ -1,6 +1,9 @@
-import { Link } from "react-router-dom";
+import { useCallback, useMemo } from "react";
+import { Link, useSearchParams } from "react-router-dom";
 import { useQuery } from "@tanstack/react-query";
-import { listAuthors } from "@/lib/api";
+import { searchAuthors } from "@/lib/api";
+import type { NameSearchFilters } from "@/lib/types";
+import { Input } from "@/components/ui/input";
 import {
   Table,
   TableBody,
@@ -10,17 +13,85 @@ import {
   TableRow,
 } from "@/components/ui/table";
 import { Skeleton } from "@/components/ui/skeleton";
+import { SortControls } from "@/components/filters/SortControls";
+import { Pagination } from "@/components/filters/Pagination";
+
+const AUTHOR_SORT_OPTIONS = [
+  { value: "name", label: "Name" },
+  { value: "book_count", label: "Book count" },
+];
 
 export function AuthorsListPage() {
-  const { data: authors, isLoading } = useQuery({
-    queryKey: ["authors"],
-    queryFn: listAuthors,
+  const [searchParams, setSearchParams] = useSearchParams();
+
+  const filters: NameSearchFilters = useMemo(
+    () => ({
+      name: searchParams.get("name") || undefined,
+      page: Number(searchParams.get("page") || 1),
+      page_size: 50,
+      order_by: searchParams.get("order_by") || "name",
+      order_dir: searchParams.get("order_dir") || "asc",
+    }),
+    [searchParams]
+  );
+
+  const { data, isLoading } = useQuery({
+    queryKey: ["authors", filters],
+    queryFn: () => searchAuthors(filters),
   });
 
+  const setFilter = useCallback(
+    (key: string, value: string | undefined) => {
+      setSearchParams((prev) => {
+        const next = new URLSearchParams(prev);
+        if (value) {
+          next.set(key, value);
+        } else {
+          next.delete(key);
+        }
+        next.set("page", "1");
+        return next;
+      });
+    },
+    [setSearchParams]
+  );
+
+  const setPage = useCallback(
+    (page: number) => {
+      setSearchParams((prev) => {
+        const next = new URLSearchParams(prev);
+        next.set("page", String(page));
+        return next;
+      });
+    },
+    [setSearchParams]
+  );
+
+  const totalPages = data ? Math.ceil(data.total / data.page_size) : 0;
+
   return (
     <div className="space-y-6">
       <h1 className="text-2xl font-bold">Authors</h1>
 
+      <div className="flex flex-wrap items-center gap-3">
+        <Input
+          placeholder="Search by name..."
+          className="w-[250px]"
+          defaultValue={filters.name || ""}
+          onChange={(e) => {
+            const val = e.target.value;
+            if (val.length === 0 || val.length >= 2) setFilter("name", val || undefined);
+          }}
+        />
+        <SortControls
+          orderBy={filters.order_by!}
+          orderDir={filters.order_dir!}
+          onOrderByChange={(v) => setFilter("order_by", v)}
+          onOrderDirChange={(v) => setFilter("order_dir", v)}
+          sortOptions={AUTHOR_SORT_OPTIONS}
+        />
+      </div>
+
       {isLoading ? (
         <div className="space-y-2">
           {Array.from({ length: 10 }).map((_, i) => (
@@ -28,35 +99,40 @@ export function AuthorsListPage() {
           ))}
         </div>
       ) : (
-        <Table>
-          <TableHeader>
-            <TableRow>
-              <TableHead>Name</TableHead>
-              <TableHead>Bio</TableHead>
-            </TableRow>
-          </TableHeader>
-          <TableBody>
-            {authors?.map((a) => (
-              <TableRow key={a.id}>
-                <TableCell>
-                  <Link to={`/authors/${a.id}`} className="font-medium underline">
-                    {a.name}
-                  </Link>
-                </TableCell>
-                <TableCell className="text-muted-foreground truncate max-w-md">
-                  {a.bio || "-"}
-                </TableCell>
-              </TableRow>
-            ))}
-            {authors?.length === 0 && (
+        <>
+          <Table>
+            <TableHeader>
               <TableRow>
-                <TableCell colSpan={2} className="text-center text-muted-foreground">
-                  No authors yet.
-                </TableCell>
+                <TableHead>Name</TableHead>
+                <TableHead>Books</TableHead>
+                <TableHead>Bio</TableHead>
               </TableRow>
-            )}
-          </TableBody>
-        </Table>
+            </TableHeader>
+            <TableBody>
+              {data?.items.map((a) => (
+                <TableRow key={a.id}>
+                  <TableCell>
+                    <Link to={`/authors/${a.id}`} className="font-medium underline">
+                      {a.name}
+                    </Link>
+                  </TableCell>
+                  <TableCell>{a.book_count}</TableCell>
+                  <TableCell className="text-muted-foreground truncate max-w-md">
+                    {a.bio || "-"}
+                  </TableCell>
+                </TableRow>
+              ))}
+              {data?.items.length === 0 && (
+                <TableRow>
+                  <TableCell colSpan={3} className="text-center text-muted-foreground">
+                    No authors found.
+                  </TableCell>
+                </TableRow>
+              )}
+            </TableBody>
+          </Table>
+          <Pagination page={filters.page!} totalPages={totalPages} onPageChange={setPage} />
+        </>
       )}
     </div>
   );
@@ -1,4 +1,5 @@
-import { Link, useParams } from "react-router-dom";
+import { useCallback } from "react";
+import { Link, useParams, useSearchParams } from "react-router-dom";
 import { useQuery } from "@tanstack/react-query";
 import { ArrowLeft } from "lucide-react";
 import { getSeries } from "@/lib/api";
@@ -6,16 +7,30 @@ import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
 import { Card, CardContent } from "@/components/ui/card";
 import { Skeleton } from "@/components/ui/skeleton";
+import { Pagination } from "@/components/filters/Pagination";
 
 export function SeriesDetailPage() {
   const { id } = useParams<{ id: string }>();
+  const [searchParams, setSearchParams] = useSearchParams();
+  const page = Number(searchParams.get("page") || 1);
 
   const { data: series, isLoading } = useQuery({
-    queryKey: ["series", id],
-    queryFn: () => getSeries(Number(id)),
+    queryKey: ["series", id, page],
+    queryFn: () => getSeries(Number(id), page),
     enabled: !!id,
   });
 
+  const setPage = useCallback(
+    (page: number) => {
+      setSearchParams((prev) => {
+        const next = new URLSearchParams(prev);
+        next.set("page", String(page));
+        return next;
+      });
+    },
+    [setSearchParams]
+  );
+
   if (isLoading) {
     return (
       <div className="space-y-4">
@@ -27,6 +42,8 @@ export function SeriesDetailPage() {
 
   if (!series) return <p>Series not found.</p>;
 
+  const totalPages = Math.ceil(series.book_count / series.books_page_size);
+
   return (
     <div className="space-y-6 max-w-3xl">
       <div className="flex items-center gap-2">
@@ -41,28 +58,31 @@ export function SeriesDetailPage() {
       {series.description && <p className="text-muted-foreground">{series.description}</p>}
 
       <div className="space-y-3">
-        <h2 className="text-lg font-semibold">Books in this series</h2>
+        <h2 className="text-lg font-semibold">Books in this series ({series.book_count})</h2>
         {series.books.length > 0 ? (
-          <div className="space-y-2">
-            {series.books.map((book, i) => (
-              <Link key={book.id} to={`/books/${book.id}`}>
-                <Card className="hover:shadow-md transition-shadow cursor-pointer">
-                  <CardContent className="p-3 flex items-center justify-between">
-                    <div className="flex items-center gap-3">
-                      <span className="text-muted-foreground text-sm w-6">#{i + 1}</span>
-                      <span className="font-medium">{book.title}</span>
-                    </div>
-                    <div className="flex gap-1.5">
-                      <Badge variant={book.canon_or_legends === "canon" ? "default" : "secondary"}>
-                        {book.canon_or_legends}
-                      </Badge>
-                      <Badge variant="outline">{book.reading_status}</Badge>
-                    </div>
-                  </CardContent>
-                </Card>
-              </Link>
-            ))}
-          </div>
+          <>
+            <div className="space-y-2">
+              {series.books.map((book) => (
+                <Link key={book.id} to={`/books/${book.id}`}>
+                  <Card className="hover:shadow-md transition-shadow cursor-pointer">
+                    <CardContent className="p-3 flex items-center justify-between">
+                      <div className="flex items-center gap-3">
+                        <span className="text-muted-foreground text-sm w-6">{book.order_in_series != null ? `#${book.order_in_series}` : "–"}</span>
+                        <span className="font-medium">{book.title}</span>
+                      </div>
+                      <div className="flex gap-1.5">
+                        <Badge variant={book.canon_or_legends === "canon" ? "default" : "secondary"}>
+                          {book.canon_or_legends}
+                        </Badge>
+                        <Badge variant="outline">{book.reading_status}</Badge>
+                      </div>
+                    </CardContent>
+                  </Card>
+                </Link>
+              ))}
+            </div>
+            <Pagination page={series.books_page} totalPages={totalPages} onPageChange={setPage} />
+          </>
         ) : (
           <p className="text-muted-foreground">No books in this series yet.</p>
         )}
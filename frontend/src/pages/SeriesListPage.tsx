@@ -1,42 +1,120 @@
-import { Link } from "react-router-dom";
+import { useCallback, useMemo } from "react";
+import { Link, useSearchParams } from "react-router-dom";
 import { useQuery } from "@tanstack/react-query";
-import { listSeries } from "@/lib/api";
+import { searchSeries } from "@/lib/api";
+import type { NameSearchFilters } from "@/lib/types";
+import { Input } from "@/components/ui/input";
+import { Badge } from "@/components/ui/badge";
 import { Card, CardContent } from "@/components/ui/card";
 import { Skeleton } from "@/components/ui/skeleton";
+import { SortControls } from "@/components/filters/SortControls";
+import { Pagination } from "@/components/filters/Pagination";
+
+const SERIES_SORT_OPTIONS = [
+  { value: "name", label: "Name" },
+  { value: "book_count", label: "Book count" },
+];
 
 export function SeriesListPage() {
-  const { data: series, isLoading } = useQuery({
-    queryKey: ["series"],
-    queryFn: listSeries,
+  const [searchParams, setSearchParams] = useSearchParams();
+
+  const filters: NameSearchFilters = useMemo(
+    () => ({
+      name: searchParams.get("name") || undefined,
+      page: Number(searchParams.get("page") || 1),
+      page_size: 24,
+      order_by: searchParams.get("order_by") || "name",
+      order_dir: searchParams.get("order_dir") || "asc",
+    }),
+    [searchParams]
+  );
+
+  const { data, isLoading } = useQuery({
+    queryKey: ["series", filters],
+    queryFn: () => searchSeries(filters),
   });
 
+  const setFilter = useCallback(
+    (key: string, value: string | undefined) => {
+      setSearchParams((prev) => {
+        const next = new URLSearchParams(prev);
+        if (value) {
+          next.set(key, value);
+        } else {
+          next.delete(key);
+        }
+        next.set("page", "1");
+        return next;
+      });
+    },
+    [setSearchParams]
+  );
+
+  const setPage = useCallback(
+    (page: number) => {
+      setSearchParams((prev) => {
+        const next = new URLSearchParams(prev);
+        next.set("page", String(page));
+        return next;
+      });
+    },
+    [setSearchParams]
+  );
+
+  const totalPages = data ? Math.ceil(data.total / data.page_size) : 0;
+
   return (
     <div className="space-y-6">
       <h1 className="text-2xl font-bold">Series</h1>
 
+      <div className="flex flex-wrap items-center gap-3">
+        <Input
+          placeholder="Search by name..."
+          className="w-[250px]"
+          defaultValue={filters.name || ""}
+          onChange={(e) => {
+            const val = e.target.value;
+            if (val.length === 0 || val.length >= 2) setFilter("name", val || undefined);
+          }}
+        />
+        <SortControls
+          orderBy={filters.order_by!}
+          orderDir={filters.order_dir!}
+          onOrderByChange={(v) => setFilter("order_by", v)}
+          onOrderDirChange={(v) => setFilter("order_dir", v)}
+          sortOptions={SERIES_SORT_OPTIONS}
+        />
+      </div>
+
       {isLoading ? (
         <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">
           {Array.from({ length: 6 }).map((_, i) => (
             <Skeleton key={i} className="h-24" />
           ))}
         </div>
-      ) : series && series.length > 0 ? (
-        <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">
-          {series.map((s) => (
-            <Link key={s.id} to={`/series/${s.id}`}>
-              <Card className="hover:shadow-md transition-shadow cursor-pointer h-full">
-                <CardContent className="p-4">
-                  <h3 className="font-semibold">{s.name}</h3>
-                  {s.description && (
-                    <p className="text-sm text-muted-foreground mt-1 line-clamp-2">
-                      {s.description}
-                    </p>
-                  )}
-                </CardContent>
-              </Card>
-            </Link>
-          ))}
-        </div>
+      ) : data && data.items.length > 0 ? (
+        <>
+          <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-4">
+            {data.items.map((s) => (
+              <Link key={s.id} to={`/series/${s.id}`}>
+                <Card className="hover:shadow-md transition-shadow cursor-pointer h-full">
+                  <CardContent className="p-4 space-y-2">
+                    <h3 className="font-semibold">{s.name}</h3>
+                    {s.description && (
+                      <p className="text-sm text-muted-foreground line-clamp-2">
+                        {s.description}
+                      </p>
+                    )}
+                    <Badge variant="outline">
+                      {s.book_count} {s.book_count === 1 ? "book" : "books"}
+                    </Badge>
+                  </CardContent>
+                </Card>
+              </Link>
+            ))}
+          </div>
+          <Pagination page={filters.page!} totalPages={totalPages} onPageChange={setPage} />
+        </>
       ) : (
         <p className="text-muted-foreground text-center py-12">No series found.</p>
       )}
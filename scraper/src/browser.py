@@ -3,9 +3,11 @@
 import logging
 import os
 import time
+from opentelemetry import trace
 from playwright.sync_api import sync_playwright, Browser, Page
 
 logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
 
 _playwright = None
 _browser: Browser | None = None
@@ -41,35 +43,38 @@ def fetch_page_html(
 
     Retries on timeout in case of slow page loads.
     """
-    browser = get_browser()
-
-    for attempt in range(max_retries + 1):
-        context = browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            java_script_enabled=True,
-        )
-        page: Page = context.new_page()
-        try:
-            page.goto(url, timeout=timeout, wait_until="domcontentloaded")
+    with tracer.start_as_current_span("browser.fetch_page_html", attributes={"url.full": url}) as span:
+        browser = get_browser()
 
+        for attempt in range(max_retries + 1):
+            span.set_attribute("fetch.attempts", attempt + 1)
+            context = browser.new_context(
+                viewport={"width": 1920, "height": 1080},
+                java_script_enabled=True,
+            )
+            page: Page = context.new_page()
             try:
-                page.wait_for_selector(wait_selector, timeout=timeout)
-            except Exception:
-                if attempt < max_retries:
-                    logger.warning(
-                        f"Attempt {attempt + 1} timed out for {url}, retrying after delay..."
-                    )
-                    context.close()
-                    time.sleep(10 * (attempt + 1))
-                    continue
-                raise
+                page.goto(url, timeout=timeout, wait_until="domcontentloaded")
+
+                try:
+                    page.wait_for_selector(wait_selector, timeout=timeout)
+                except Exception:
+                    if attempt < max_retries:
+                        logger.warning(
+                            f"Attempt {attempt + 1} timed out for {url}, retrying after delay..."
+                        )
+                        context.close()
+                        time.sleep(10 * (attempt + 1))
+                        continue
+                    raise
 
-            html = page.content()
-            return html
-        finally:
-            context.close()
+                html = page.content()
+                span.set_attribute("html.bytes", len(html))
+                return html
+            finally:
+                context.close()
 
-    raise RuntimeError(f"Failed to fetch {url} after {max_retries + 1} attempts")
+        raise RuntimeError(f"Failed to fetch {url} after {max_retries + 1} attempts")
 
 
 def close_browser() -> None:
@@ -1,23 +1,35 @@
 import logging
 
 import requests
+from opentelemetry import propagate, trace
 
 from src.config import BACKEND_URL
 
 logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+
+def _post(span_name: str, url: str, items: list[dict], timeout: int) -> requests.Response:
+    """POST with a client span whose context the backend continues."""
+    with tracer.start_as_current_span(span_name, kind=trace.SpanKind.CLIENT) as span:
+        span.set_attributes({"http.request.method": "POST", "url.full": url, "ingest.items": len(items)})
+        headers: dict[str, str] = {}
+        propagate.inject(headers)
+        resp = requests.post(url, json=items, headers=headers, timeout=timeout)
+        span.set_attribute("http.response.status_code", resp.status_code)
+        resp.raise_for_status()
+        return resp
 
 
 def ingest_books(books: list[dict]) -> None:
     url = f"{BACKEND_URL}/api/v1/ingest/books"
     logger.info(f"Sending {len(books)} books to {url}")
-    resp = requests.post(url, json=books, timeout=120)
-    resp.raise_for_status()
+    resp = _post("client.ingest_books", url, books, timeout=120)
     logger.info(f"Ingest response: {resp.json()}")
 
 
 def ingest_characters(characters: list[dict]) -> None:
     url = f"{BACKEND_URL}/api/v1/ingest/characters"
     logger.info(f"Sending {len(characters)} characters to {url}")
-    resp = requests.post(url, json=characters, timeout=60)
-    resp.raise_for_status()
+    resp = _post("client.ingest_characters", url, characters, timeout=60)
     logger.info(f"Ingest response: {resp.json()}")
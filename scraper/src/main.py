@@ -5,14 +5,18 @@ import os
 import time
 from pathlib import Path
 
+from opentelemetry import trace
+
 from src.parsers.book_list import scrape_book_list
 from src.parsers.book_detail import scrape_book_detail
 from src.client import ingest_books, ingest_characters
 from src.config import REQUEST_DELAY
 from src.browser import close_browser
+from src.tracing import setup_tracing, shutdown_tracing
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
 
 DATA_DIR = Path(os.getenv("DATA_DIR", str(Path(__file__).resolve().parents[1] / "data")))
 
@@ -24,6 +28,15 @@ def main():
     parser.add_argument("--from-json", type=str, help="Skip scraping, ingest from a saved JSON file")
     args = parser.parse_args()
 
+    setup_tracing()
+    try:
+        with tracer.start_as_current_span("scrape_run"):
+            run(args)
+    finally:
+        shutdown_tracing()
+
+
+def run(args: argparse.Namespace) -> None:
     if args.from_json:
         logger.info(f"Loading books from {args.from_json}")
         with open(args.from_json) as f:
@@ -62,17 +75,18 @@ def scrape_all(limit: int) -> tuple[list[dict], dict[str, list[str]]]:
 
     for i, entry in enumerate(book_entries):
         logger.info(f"[{i + 1}/{len(book_entries)}] Scraping: {entry['title']}")
-        try:
-            detail = scrape_book_detail(entry["url"])
-            book = {**entry, **detail}
-            books.append(book)
-            for char_name in detail.get("characters", []):
-                all_characters.setdefault(char_name, [])
-                if entry["title"] not in all_characters[char_name]:
-                    all_characters[char_name].append(entry["title"])
-        except Exception:
-            logger.exception(f"Failed to scrape {entry['url']}")
-            failed.append(entry["url"])
+        with tracer.start_as_current_span("scrape_book", attributes={"book.title": entry["title"]}):
+            try:
+                detail = scrape_book_detail(entry["url"])
+                book = {**entry, **detail}
+                books.append(book)
+                for char_name in detail.get("characters", []):
+                    all_characters.setdefault(char_name, [])
+                    if entry["title"] not in all_characters[char_name]:
+                        all_characters[char_name].append(entry["title"])
+            except Exception:
+                logger.exception(f"Failed to scrape {entry['url']}")
+                failed.append(entry["url"])
         time.sleep(REQUEST_DELAY)
 
     logger.info(f"Scraped {len(books)} books, {len(failed)} failures")
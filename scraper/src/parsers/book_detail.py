@@ -2,10 +2,12 @@ import logging
 import re
 
 from bs4 import BeautifulSoup
+from opentelemetry import trace
 
 from src.browser import fetch_page_html
 
 logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
 
 
 def parse_cover_image(infobox) -> str | None:
@@ -24,6 +26,11 @@ def parse_cover_image(infobox) -> str | None:
 def scrape_book_detail(url: str) -> dict:
     """Scrape a single book page for metadata, characters, and description."""
     html = fetch_page_html(url)
+    with tracer.start_as_current_span("book_detail.parse", attributes={"url.full": url, "html.bytes": len(html)}):
+        return parse_book_detail(html)
+
+
+def parse_book_detail(html: str) -> dict:
     soup = BeautifulSoup(html, "html.parser")
 
     result: dict = {}
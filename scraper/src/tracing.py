@@ -0,0 +1,66 @@
+"""OpenTelemetry tracing for scrape runs, off unless TRACING_EXPORTER is set.
+
+"console" prints finished spans; "file" appends OTLP/JSON lines to
+TRACING_FILE. Point the backend's TRACING_FILE at the same file to get the
+scraper's spans and the backend's (ingest request, per-book work, SQL) in
+one trace, since ingest requests carry the W3C ``traceparent`` header.
+"""
+
+import base64
+import json
+import threading
+
+from google.protobuf.json_format import MessageToDict
+from opentelemetry import trace
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SpanExporter, SpanExportResult
+
+from src.config import TRACING_EXPORTER, TRACING_FILE
+
+_provider: TracerProvider | None = None
+# OTLP/JSON spells ids in hex where protobuf's JSON mapping uses base64
+_ID_FIELDS = ("traceId", "spanId", "parentSpanId")
+
+
+def _hex_ids(value):
+    if isinstance(value, dict):
+        return {
+            k: base64.b64decode(v).hex() if k in _ID_FIELDS and isinstance(v, str) else _hex_ids(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_hex_ids(v) for v in value]
+    return value
+
+
+class OTLPJsonFileExporter(SpanExporter):
+    def __init__(self, path: str):
+        self._file = open(path, "a")
+        self._lock = threading.Lock()
+
+    def export(self, spans) -> SpanExportResult:
+        line = json.dumps(_hex_ids(MessageToDict(encode_spans(spans))), separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        self._file.close()
+
+
+def setup_tracing() -> None:
+    global _provider
+    if TRACING_EXPORTER == "none":
+        return
+    _provider = TracerProvider(resource=Resource.create({SERVICE_NAME: "swtracker-scraper"}))
+    exporter = ConsoleSpanExporter() if TRACING_EXPORTER == "console" else OTLPJsonFileExporter(TRACING_FILE)
+    _provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(_provider)
+
+
+def shutdown_tracing() -> None:
+    if _provider is not None:
+        _provider.shutdown()